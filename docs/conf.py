@@ -109,6 +109,8 @@ rst_epilog = """
 
 .. |ChartPart| replace:: :class:`.ChartPart`
 
+.. |ChartTemplate| replace:: :class:`.ChartTemplate`
+
 .. |ChartXmlWriter| replace:: :class:`.ChartXmlWriter`
 
 .. |Collection| replace:: :class:`Collection`
@@ -229,6 +231,8 @@ rst_epilog = """
 
 .. |SeriesCollection| replace:: :class:`.SeriesCollection`
 
+.. |SeriesIndex| replace:: :class:`.SeriesIndex`
+
 .. |Shape| replace:: :class:`.Shape`
 
 .. |ShapeCollection| replace:: :class:`.ShapeCollection`
@@ -251,6 +255,8 @@ rst_epilog = """
 
 .. |Table| replace:: :class:`Table`
 
+.. |TablePaginator| replace:: :class:`.TablePaginator`
+
 .. |TextFrame| replace:: :class:`.TextFrame`
 
 .. |TickLabels| replace:: :class:`.TickLabels`
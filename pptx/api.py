@@ -11,7 +11,12 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 from warnings import warn
 
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 from pptx.package import Package
+from pptx.text.replace import TextReplacer
+from pptx.text.style import TextStyleResolver
+from pptx.text.usage import FontUsageAnalyzer
+from pptx.util import lazyproperty
 
 
 class Presentation(object):
@@ -123,9 +128,73 @@ class Presentation(object):
         """
         return self._presentation.slides
 
+    def font_usage(self):
+        """
+        Return a dict mapping the typeface name of each font used by the
+        text of the slides of this presentation to a |FontUsage| object
+        giving the distinct characters set in that font and their total
+        count, e.g. to decide which fonts are worth embedding or subsetting.
+        Text that does not name a font is attributed to the font it
+        inherits from its layout, master, or theme.
+        """
+        analyzer = FontUsageAnalyzer(self.text_styles)
+        return analyzer.analyze(self.slides)
+
+    def replace_text(self, replacements, processes=None):
+        """
+        Replace each occurrence of each search string in *replacements*,
+        a mapping of search text to replacement text, in the text of the
+        slides of this presentation and of the charts they contain. Return
+        the number of replacements made. Text is replaced directly in the
+        XML, a search string split across runs is still found, and
+        a replacement takes on the formatting of the run in which its match
+        starts. When *processes* is a positive integer, the matching is
+        divided among a pool of that many worker processes.
+        """
+        replacer = TextReplacer(replacements)
+        return replacer.replace_in_parts(self._text_parts, processes)
+
     def save(self, file):
         """
         Save this presentation to *file*, where *file* can be either a path to
         a file (a string) or a file-like object.
         """
         return self._package.save(file)
+
+    def substitute_tokens(self, values, start='{{', end='}}',
+                          processes=None):
+        """
+        Replace each token in the text of the slides of this presentation,
+        and of the charts they contain, with its value in the mapping
+        *values*. A token is a key in *values* enclosed by *start* and
+        *end*, e.g. ``'{{name}}'``. Return the number of tokens replaced.
+        Otherwise behaves like :meth:`replace_text`.
+        """
+        replacer = TextReplacer.from_tokens(values, start, end)
+        return replacer.replace_in_parts(self._text_parts, processes)
+
+    @lazyproperty
+    def text_styles(self):
+        """
+        |TextStyleResolver| object for this presentation, providing the
+        effective font of a run of text on one of its slides, e.g.
+        ``prs.text_styles.font(run).size``. Styles inherited from layouts
+        and masters are remembered; call ``prs.text_styles.clear()`` after
+        changing a layout or master.
+        """
+        return TextStyleResolver()
+
+    @property
+    def _text_parts(self):
+        """
+        List of the parts whose text is replaced by :meth:`replace_text`,
+        each slide followed by the charts it contains.
+        """
+        text_parts = []
+        for slide in self.slides:
+            text_parts.append(slide)
+            text_parts.extend(
+                rel.target_part for rel in slide.rels.values()
+                if rel.reltype == RT.CHART and not rel.is_external
+            )
+        return text_parts
@@ -8,11 +8,14 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 from collections import Sequence
 from copy import deepcopy
+from numbers import Number
 
 from .axis import CategoryAxis, ValueAxis
 from .legend import Legend
 from .plot import PlotFactory, PlotTypeInspector
-from .series import SeriesCollection
+from .series import SeriesCollection, SeriesIndex
+from ..oxml.ns import qn
+from ..oxml.xmlchemy import OxmlElement
 from ..util import lazyproperty
 
 
@@ -108,7 +111,7 @@ class Chart(object):
         access (e.g. ``plot = plots[i]``).
         """
         plotArea = self._chartSpace.chart.plotArea
-        return _Plots(plotArea, self)
+        return _Plots(plotArea, self, self._series_index)
 
     def replace_data(self, chart_data):
         """
@@ -116,7 +119,9 @@ class Chart(object):
         *chart_data* to replace those in the XML and Excel worksheet for this
         chart.
         """
-        _SeriesRewriter.replace_series_data(self._chartSpace, chart_data)
+        _SeriesRewriter.replace_series_data(
+            self._chartSpace, chart_data, self._series_index
+        )
         self._workbook.update_from_xlsx_blob(chart_data.xlsx_blob)
 
     @lazyproperty
@@ -125,7 +130,51 @@ class Chart(object):
         The |SeriesCollection| object containing all the series in this
         chart.
         """
-        return SeriesCollection(self._chartSpace)
+        return SeriesCollection(self._chartSpace, self._series_index)
+
+    def series_values(self):
+        """
+        Return a tuple containing a ``(name, values_array)`` pair for each
+        series in this chart, in series order. *values_array* is the
+        ``array.array('d')`` provided by the ``values_array`` property of the
+        series. Suitable for bulk extraction of the data from many existing
+        charts.
+        """
+        return tuple(
+            (series.name, series.values_array) for series in self.series
+        )
+
+    def update_data(self, chart_data):
+        """
+        Incremental alternative to :meth:`replace_data`. Only the series
+        names, category labels, and point values in *chart_data* that differ
+        from those already in the chart are changed, both in the chart XML
+        and in the cells of the embedded Excel worksheet. Existing ``<c:pt>``
+        elements are edited in place and points are added or removed as
+        needed. Well suited to frequently updating a few points of a chart.
+        The numbers of a newly added series are given its number format.
+        The Excel worksheet is rewritten in full when there is none yet, when
+        its worksheet cannot be found, when *chart_data* has been decimated,
+        or when the data it replaces was, so a 'Source Index' column is never
+        left behind.
+        """
+        old_ser_count = len(self._series_index.sers)
+        cells = _SeriesRewriter.update_series_data(
+            self._chartSpace, chart_data, self._series_index
+        )
+        workbook = self._workbook
+        is_decimated = chart_data.source_indices is not None
+        if (workbook.xlsx_part is None or is_decimated or
+                not workbook.can_update_cells(old_ser_count)):
+            workbook.update_from_xlsx_blob(chart_data.xlsx_blob)
+            return
+        if cells:
+            number_formats = dict(
+                (series_data.index + 1, series_data.number_format)
+                for series_data in chart_data.series
+                if series_data.index >= old_ser_count
+            )
+            workbook.update_cells(cells, number_formats)
 
     @property
     def value_axis(self):
@@ -139,6 +188,14 @@ class Chart(object):
             raise ValueError('chart has no value axis')
         return ValueAxis(valAx)
 
+    @property
+    def _series_index(self):
+        """
+        The |SeriesIndex| object caching the ser elements of this chart,
+        shared by all users of this chart part.
+        """
+        return self._chart_part.series_index
+
     @property
     def _workbook(self):
         """
@@ -155,13 +212,14 @@ class _Plots(Sequence):
     types are displayed in a single set of axes, like a bar plot with
     a superimposed line plot.
     """
-    def __init__(self, plotArea, chart):
+    def __init__(self, plotArea, chart, series_index=None):
         super(_Plots, self).__init__()
         self._plotArea = plotArea
         self._chart = chart
+        self._series_index = series_index
 
     def __getitem__(self, index):
-        xCharts = list(self._plotArea.iter_plots())
+        xCharts = self._xCharts
         if isinstance(index, slice):
             plots = [PlotFactory(xChart, self._chart) for xChart in xCharts]
             return plots[index]
@@ -170,8 +228,16 @@ class _Plots(Sequence):
             return PlotFactory(xChart, self._chart)
 
     def __len__(self):
-        plot_elms = [p for p in self._plotArea.iter_plots()]
-        return len(plot_elms)
+        return len(self._xCharts)
+
+    @property
+    def _xCharts(self):
+        """
+        The sequence of xChart elements in the plot area.
+        """
+        if self._series_index is not None:
+            return self._series_index.xCharts
+        return list(self._plotArea.iter_plots())
 
 
 class _SeriesRewriter(object):
@@ -183,7 +249,7 @@ class _SeriesRewriter(object):
     only.
     """
     @classmethod
-    def replace_series_data(cls, chartSpace, chart_data):
+    def replace_series_data(cls, chartSpace, chart_data, series_index=None):
         """
         Use the category and series data in *chart_data* to rewrite the
         series name, category labels, and point values of the series
@@ -192,14 +258,62 @@ class _SeriesRewriter(object):
         *chartSpace*, the excess series are deleted. If *chart_data* contains
         more series than the *chartSpace* element, new series are added to
         the last plot in the chart and series formatting is copied from the
-        last series in that plot.
+        last series in that plot. *series_index* is the |SeriesIndex| for
+        *chartSpace*, if there is one, and is kept current.
         """
-        sers = cls._adjust_ser_count(chartSpace, len(chart_data.series))
+        if series_index is None:
+            series_index = SeriesIndex(chartSpace)
+        sers = cls._adjust_ser_count(
+            chartSpace, len(chart_data.series), series_index
+        )
         for ser, series_data in zip(sers, chart_data.series):
             cls._rewrite_ser_data(ser, series_data)
+        series_index.invalidate()
 
     @classmethod
-    def _add_cloned_sers(cls, chartSpace, count):
+    def update_series_data(cls, chartSpace, chart_data, series_index=None):
+        """
+        Like :meth:`replace_series_data`, but only the series names,
+        category labels, and point values that differ from those already in
+        *chartSpace* are changed, in place. Return a list of ``(row_idx,
+        col_idx, value)`` triples identifying the chart data worksheet cells
+        that must change to match, where a *value* of |None| indicates
+        a cell to be cleared.
+        """
+        if series_index is None:
+            series_index = SeriesIndex(chartSpace)
+        old_sers = series_index.sers
+        old_col_count = len(old_sers) + 1
+        old_row_count = max([cls._row_count(ser) for ser in old_sers] + [1])
+
+        cells = {}
+        categories = chart_data.categories
+        sers = cls._adjust_ser_count(
+            chartSpace, len(chart_data.series), series_index
+        )
+        for ser, series_data in zip(sers, chart_data.series):
+            is_new = series_data.index >= len(old_sers)
+            cls._update_ser_data(ser, series_data, categories, cells, is_new)
+        series_index.invalidate()
+
+        col_count = len(chart_data.series) + 1
+        row_count = max(
+            [len(series_data) + 1 for series_data in chart_data.series] +
+            [len(categories) + 1]
+        )
+        for row_idx in range(old_row_count):
+            for col_idx in range(old_col_count):
+                if row_idx < row_count and col_idx < col_count:
+                    continue
+                cells.setdefault((row_idx, col_idx), None)
+
+        return [
+            (row_idx, col_idx, value)
+            for (row_idx, col_idx), value in sorted(cells.items())
+        ]
+
+    @classmethod
+    def _add_cloned_sers(cls, chartSpace, count, series_index):
         """
         Add `c:ser` elements to the last xChart element in *chartSpace*,
         cloned from the last `c:ser` child of that xChart.
@@ -212,24 +326,27 @@ class _SeriesRewriter(object):
             return new_ser
 
         last_ser = chartSpace.last_doc_order_ser
-        starting_idx = len(chartSpace.sers)
+        starting_idx = len(series_index.sers)
         for idx in range(starting_idx, starting_idx+count):
             last_ser = clone_ser(last_ser, idx)
+        series_index.invalidate()
 
     @classmethod
-    def _adjust_ser_count(cls, chartSpace, new_ser_count):
+    def _adjust_ser_count(cls, chartSpace, new_ser_count, series_index):
         """
         Return the ser elements in *chartSpace* after adjusting their number
         to *new_ser_count*. The ser elements returned are sorted in
         increasing order of the c:ser/c:idx value, starting with 0 and with
         any gaps in numbering collapsed.
         """
-        ser_count_diff = new_ser_count - len(chartSpace.sers)
+        ser_count_diff = new_ser_count - len(series_index.sers)
         if ser_count_diff > 0:
-            cls._add_cloned_sers(chartSpace, ser_count_diff)
+            cls._add_cloned_sers(chartSpace, ser_count_diff, series_index)
         elif ser_count_diff < 0:
-            cls._trim_ser_count_by(chartSpace, abs(ser_count_diff))
-        return chartSpace.sers
+            cls._trim_ser_count_by(
+                chartSpace, abs(ser_count_diff), series_index
+            )
+        return series_index.sers
 
     @classmethod
     def _rewrite_ser_data(cls, ser, series_data):
@@ -245,20 +362,141 @@ class _SeriesRewriter(object):
         ser._insert_val(series_data.val)
 
     @classmethod
-    def _trim_ser_count_by(cls, chartSpace, count):
+    def _row_count(cls, ser):
+        """
+        Return the number of chart data worksheet rows the data in *ser*
+        occupies, including the series name row, based on the point counts
+        of its category and value caches.
+        """
+        pt_counts = ser.xpath(
+            './c:cat/*/*/c:ptCount/@val | ./c:val/*/*/c:ptCount/@val'
+        )
+        return max([int(pt_count) for pt_count in pt_counts] + [0]) + 1
+
+    @classmethod
+    def _trim_ser_count_by(cls, chartSpace, count, series_index):
         """
         Remove the last *count* ser elements from *chartSpace*. Any xChart
         elements having no ser child elements after trimming are also
         removed.
         """
-        extra_sers = chartSpace.sers[-count:]
+        extra_sers = series_index.sers[-count:]
         for ser in extra_sers:
             parent = ser.getparent()
             parent.remove(ser)
         extra_xCharts = [
-            xChart for xChart in chartSpace.chart.plotArea.iter_plots()
+            xChart for xChart in series_index.xCharts
             if len(list(xChart.iter_sers())) == 0
         ]
         for xChart in extra_xCharts:
             parent = xChart.getparent()
             parent.remove(xChart)
+        series_index.invalidate()
+
+    @classmethod
+    def _update_cat(cls, ser, series_data, categories, cells):
+        """
+        Make the category labels cached in *ser* match *categories*, adding
+        the worksheet cells of each changed label to *cells*. The category
+        labels are shared by all series, so are never forced.
+        """
+        caches = ser.xpath('./c:cat/c:strRef/c:strCache')
+        if not caches:
+            ser._remove_cat()
+            ser._insert_cat(series_data.cat)
+            changed_idxs = range(len(categories))
+        else:
+            ser.xpath('./c:cat/c:strRef/c:f')[0].text = (
+                series_data.categories_ref
+            )
+            texts = ['%s' % category for category in categories]
+            changed_idxs = cls._update_pts(caches[0], texts)
+        for idx in changed_idxs:
+            category = categories[idx]
+            if not isinstance(category, Number):
+                category = '%s' % category
+            cells[(idx + 1, 0)] = category
+
+    @classmethod
+    def _update_pts(cls, cache, texts):
+        """
+        Make the ``<c:pt>`` children of *cache*, a `c:strCache` or
+        `c:numCache` element, match the string values in *texts*, editing
+        existing points in place, adding missing ones and removing any
+        beyond the new point count. Return the sequence of indices of the
+        points that were changed or added.
+        """
+        ptCount = cache.find(qn('c:ptCount'))
+        ptCount.set('val', str(len(texts)))
+        pts = dict((pt.idx, pt) for pt in cache.findall(qn('c:pt')))
+        for idx, pt in pts.items():
+            if idx >= len(texts):
+                cache.remove(pt)
+
+        changed_idxs = []
+        prior = ptCount
+        for idx, text in enumerate(texts):
+            pt = pts.get(idx)
+            if pt is None:
+                pt = OxmlElement('c:pt')
+                pt.set('idx', str(idx))
+                pt.append(OxmlElement('c:v'))
+                prior.addnext(pt)
+            elif pt.v.text == text:
+                prior = pt
+                continue
+            pt.v.text = text
+            changed_idxs.append(idx)
+            prior = pt
+        return changed_idxs
+
+    @classmethod
+    def _update_ser_data(cls, ser, series_data, categories, cells, force):
+        """
+        Change the name, category labels, and values cached in *ser* to
+        those in *series_data* and *categories*, touching only those that
+        differ. The worksheet cells corresponding to each change are added to
+        *cells*. When *force* is |True|, as for a newly added series, the
+        name and value cells for this series are added regardless.
+        """
+        cls._update_tx(ser, series_data, cells, force)
+        cls._update_cat(ser, series_data, categories, cells)
+        cls._update_val(ser, series_data, cells, force)
+
+    @classmethod
+    def _update_tx(cls, ser, series_data, cells, force):
+        """
+        Make the series name cached in *ser* match that of *series_data*.
+        """
+        col_idx = series_data.index + 1
+        vs = ser.xpath('./c:tx/c:strRef/c:strCache/c:pt/c:v')
+        if not vs:
+            ser._remove_tx()
+            ser._insert_tx(series_data.tx)
+        else:
+            ser.xpath('./c:tx/c:strRef/c:f')[0].text = series_data.name_ref
+            if vs[0].text == series_data.name and not force:
+                return
+            vs[0].text = series_data.name
+        cells[(0, col_idx)] = series_data.name
+
+    @classmethod
+    def _update_val(cls, ser, series_data, cells, force):
+        """
+        Make the point values cached in *ser* match those of *series_data*.
+        """
+        col_idx = series_data.index + 1
+        values = series_data.values
+        caches = ser.xpath('./c:val/c:numRef/c:numCache')
+        if not caches:
+            ser._remove_val()
+            ser._insert_val(series_data.val)
+            changed_idxs = range(len(values))
+        else:
+            ser.xpath('./c:val/c:numRef/c:f')[0].text = series_data.values_ref
+            texts = ['%s' % value for value in values]
+            changed_idxs = cls._update_pts(caches[0], texts)
+        if force:
+            changed_idxs = range(len(values))
+        for idx in changed_idxs:
+            cells[(idx + 1, col_idx)] = values[idx]
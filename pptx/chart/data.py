@@ -10,6 +10,7 @@ from xml.sax.saxutils import escape
 
 from ..oxml import parse_xml
 from ..oxml.ns import nsdecls
+from .decimation import Decimator
 from .xlsx import WorkbookWriter
 from .xmlwriter import ChartXmlWriter
 
@@ -25,6 +26,7 @@ class ChartData(object):
         super(ChartData, self).__init__()
         self._categories = []
         self._series_lst = []
+        self._source_idxs = None
 
     def add_series(self, name, values, number_format=0):
         """
@@ -57,6 +59,46 @@ class ChartData(object):
         # _SeriesData objects retain access to latest values
         self._categories[:] = categories
 
+    def decimate(self, max_points, method='lttb'):
+        """
+        Reduce the categories and series values in this chart data to no
+        more than *max_points* points, so an oversized data set can be
+        charted without the cost of rendering and saving every point.
+        *method* is one of:
+
+        ``'lttb'``
+            Largest-Triangle-Three-Buckets, the default, keeps the points
+            that best preserve the visual shape of a line.
+        ``'minmax'``
+            Keeps the points having the minimum and maximum value of each
+            series within each of a number of equal-width buckets, so peaks
+            are never lost. *max_points* must be at least twice the number
+            of series.
+        ``'nth'``
+            Keeps every n-th point.
+
+        The same points are kept for the categories and all series, so this
+        method should be called after all series are added. It has no effect
+        when there are no more than *max_points* points. The index each kept
+        point had in the original data is available from
+        :attr:`source_indices` and is written to the Excel worksheet in
+        a 'Source Index' column following the series values.
+        """
+        idxs = Decimator.point_idxs(
+            [series.values for series in self._series_lst], max_points, method
+        )
+        categories = self._categories
+        self._categories[:] = [
+            categories[idx] for idx in idxs if idx < len(categories)
+        ]
+        for series in self._series_lst:
+            series._take(idxs)
+        source_idxs = self._source_idxs
+        self._source_idxs = (
+            tuple(idxs) if source_idxs is None
+            else tuple(source_idxs[idx] for idx in idxs)
+        )
+
     @property
     def series(self):
         """
@@ -65,13 +107,24 @@ class ChartData(object):
         """
         return tuple(self._series_lst)
 
+    @property
+    def source_indices(self):
+        """
+        Read-only. A tuple containing, for each point remaining after
+        :meth:`decimate`, the zero-based index of that point in the original
+        data, or |None| if this chart data has not been decimated.
+        """
+        return self._source_idxs
+
     @property
     def xlsx_blob(self):
         """
         Return a blob containing an Excel workbook file populated with the
         categories and series in this chart data object.
         """
-        return WorkbookWriter.xlsx_blob(self.categories, self._series_lst)
+        return WorkbookWriter.xlsx_blob(
+            self.categories, self._series_lst, self._source_idxs
+        )
 
     def xml_bytes(self, chart_type):
         """
@@ -117,11 +170,19 @@ class _SeriesData(object):
         The ``<c:cat>`` element XML for this series, as an oxml element.
         """
         xml = self._cat_tmpl.format(
-            wksht_ref=self._categories_ref, cat_count=len(self._categories),
+            wksht_ref=self.categories_ref, cat_count=len(self._categories),
             cat_pt_xml=self._cat_pt_xml, nsdecls=' %s' % nsdecls('c')
         )
         return parse_xml(xml)
 
+    @property
+    def categories_ref(self):
+        """
+        The Excel worksheet reference to the categories for this series.
+        """
+        end_row_number = len(self._categories) + 1
+        return "Sheet1!$A$2:$A$%d" % end_row_number
+
     @property
     def cat_xml(self):
         """
@@ -129,7 +190,7 @@ class _SeriesData(object):
         containing the category labels and spreadsheet reference.
         """
         return self._cat_tmpl.format(
-            wksht_ref=self._categories_ref, cat_count=len(self._categories),
+            wksht_ref=self.categories_ref, cat_count=len(self._categories),
             cat_pt_xml=self._cat_pt_xml, nsdecls=''
         )
 
@@ -147,6 +208,13 @@ class _SeriesData(object):
         """
         return self._name
 
+    @property
+    def name_ref(self):
+        """
+        The Excel worksheet reference to the name for this series.
+        """
+        return "Sheet1!$%s$1" % self._col_letter
+
     @property
     def number_format(self):
         """
@@ -164,7 +232,7 @@ class _SeriesData(object):
         """
         name = escape(self.name)
         xml = self._tx_tmpl.format(
-            wksht_ref=self._series_name_ref, series_name=name,
+            wksht_ref=self.name_ref, series_name=name,
             nsdecls=' %s' % nsdecls('c')
         )
         return parse_xml(xml)
@@ -177,7 +245,7 @@ class _SeriesData(object):
         """
         name = escape(self.name)
         return self._tx_tmpl.format(
-            wksht_ref=self._series_name_ref, series_name=name, nsdecls=''
+            wksht_ref=self.name_ref, series_name=name, nsdecls=''
         )
 
     @property
@@ -186,7 +254,7 @@ class _SeriesData(object):
         The ``<c:val>`` XML for this series, as an oxml element.
         """
         xml = self._val_tmpl.format(
-            wksht_ref=self._values_ref, val_count=len(self),
+            wksht_ref=self.values_ref, val_count=len(self),
             val_pt_xml=self._val_pt_xml, nsdecls=' %s' % nsdecls('c')
         )
         return parse_xml(xml)
@@ -198,7 +266,7 @@ class _SeriesData(object):
         this series.
         """
         return self._val_tmpl.format(
-            wksht_ref=self._values_ref, val_count=len(self),
+            wksht_ref=self.values_ref, val_count=len(self),
             val_pt_xml=self._val_pt_xml, nsdecls=''
         )
 
@@ -210,12 +278,23 @@ class _SeriesData(object):
         return self._values
 
     @property
-    def _categories_ref(self):
+    def values_ref(self):
         """
-        The Excel worksheet reference to the categories for this series.
+        The Excel worksheet reference to the values for this series (not
+        including the series name).
         """
-        end_row_number = len(self._categories) + 1
-        return "Sheet1!$A$2:$A$%d" % end_row_number
+        return "Sheet1!$%s$2:$%s$%d" % (
+            self._col_letter, self._col_letter, len(self._values)+1
+        )
+
+    def _take(self, idxs):
+        """
+        Reduce the values of this series to those at *idxs*, a sequence of
+        zero-based indices in ascending order. An index beyond the last value
+        is ignored.
+        """
+        values = self._values
+        self._values = [values[idx] for idx in idxs if idx < len(values)]
 
     @property
     def _cat_pt_xml(self):
@@ -258,13 +337,6 @@ class _SeriesData(object):
         """
         return chr(ord('B') + self._series_idx)
 
-    @property
-    def _series_name_ref(self):
-        """
-        The Excel worksheet reference to the name for this series.
-        """
-        return "Sheet1!$%s$1" % self._col_letter
-
     @property
     def _tx_tmpl(self):
         """
@@ -318,13 +390,3 @@ class _SeriesData(object):
             '            </c:numRef>\n'
             '          </c:val>\n'
         )
-
-    @property
-    def _values_ref(self):
-        """
-        The Excel worksheet reference to the values for this series (not
-        including the series name).
-        """
-        return "Sheet1!$%s$2:$%s$%d" % (
-            self._col_letter, self._col_letter, len(self._values)+1
-        )
@@ -0,0 +1,142 @@
+# encoding: utf-8
+
+"""
+Decimator and related objects, for reducing oversized chart series to
+a manageable number of points.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+_NAN = float('nan')
+
+
+class Decimator(object):
+    """
+    Service object that knows how to choose a subset of the points in
+    a set of series such that the shape of the plotted data is largely
+    preserved. A single selection is made for all series, since they share
+    the categories of the plot.
+    """
+    methods = ('lttb', 'minmax', 'nth')
+
+    @classmethod
+    def point_idxs(cls, value_seqs, max_points, method='lttb'):
+        """
+        Return a list of the zero-based indices, in ascending order, of the
+        points to keep from the series in *value_seqs*, a sequence of
+        sequences of numeric values. *method* is one of 'lttb', 'minmax', or
+        'nth'. Values of |None| are treated as missing. Raises |ValueError|
+        on an unknown *method* or when *max_points* is less than 2, or, for
+        'minmax', less than twice the number of series, too few to keep the
+        minimum and maximum of each.
+        """
+        if method not in cls.methods:
+            raise ValueError(
+                "decimation method must be one of %s, got '%s'" %
+                (', '.join(cls.methods), method)
+            )
+        if max_points < 2:
+            raise ValueError('max_points must be at least 2')
+
+        point_count = max([len(values) for values in value_seqs] + [0])
+        if point_count <= max_points:
+            return list(range(point_count))
+
+        columns = [cls._column(values, point_count) for values in value_seqs]
+        idxs_method = getattr(cls, '_%s_idxs' % method)
+        return idxs_method(columns, point_count, max_points)
+
+    @staticmethod
+    def _column(values, point_count):
+        """
+        Return *values* as a list of *point_count* floats, a missing value
+        being represented by NaN.
+        """
+        column = [_NAN if value is None else float(value) for value in values]
+        column.extend([_NAN] * (point_count - len(column)))
+        return column
+
+    @staticmethod
+    def _lttb_idxs(columns, point_count, max_points):
+        """
+        Return the point indices chosen using the Largest-Triangle-Three-
+        Buckets algorithm. The first and last points are always kept and one
+        point is chosen from each of the equal-width buckets between them,
+        the one forming the largest triangle with the point chosen from the
+        prior bucket and the average of the next bucket. With multiple
+        series, triangle areas are summed across series.
+        """
+        bucket_width = (point_count - 2) / (max_points - 2)
+        idxs = [0]
+        a = 0
+        for bucket_idx in range(max_points - 2):
+            next_start = int((bucket_idx + 1) * bucket_width) + 1
+            next_end = min(
+                int((bucket_idx + 2) * bucket_width) + 1, point_count
+            )
+            avg_x = (next_start + next_end - 1) / 2
+            avgs = []
+            for column in columns:
+                ys = [y for y in column[next_start:next_end] if y == y]
+                avgs.append(sum(ys) / len(ys) if ys else _NAN)
+
+            start = int(bucket_idx * bucket_width) + 1
+            end = int((bucket_idx + 1) * bucket_width) + 1
+            best_idx, best_area = start, -1.0
+            for idx in range(start, end):
+                area = 0.0
+                for column, avg_y in zip(columns, avgs):
+                    area_x2 = (
+                        (a - avg_x) * (column[idx] - column[a]) -
+                        (a - idx) * (avg_y - column[a])
+                    )
+                    if area_x2 == area_x2:
+                        area += abs(area_x2)
+                if area > best_area:
+                    best_idx, best_area = idx, area
+            idxs.append(best_idx)
+            a = best_idx
+        idxs.append(point_count - 1)
+        return idxs
+
+    @staticmethod
+    def _minmax_idxs(columns, point_count, max_points):
+        """
+        Return the point indices chosen by dividing the points into
+        equal-width buckets and keeping, within each bucket, the points
+        having the minimum and maximum value of each series. The bucket
+        count is chosen so no more than *max_points* are kept. Raises
+        |ValueError| when *max_points* is too small for even one bucket.
+        """
+        bucket_points = 2 * max(len(columns), 1)
+        if max_points < bucket_points:
+            raise ValueError(
+                "max_points must be at least %d for 'minmax' decimation of "
+                "%d series" % (bucket_points, len(columns))
+            )
+        bucket_count = max_points // bucket_points
+        bucket_width = point_count / bucket_count
+        idxs = []
+        for bucket_idx in range(bucket_count):
+            start = int(bucket_idx * bucket_width)
+            end = int((bucket_idx + 1) * bucket_width)
+            keep = set()
+            for column in columns:
+                points = [
+                    (y, idx) for idx, y in
+                    enumerate(column[start:end], start) if y == y
+                ]
+                if points:
+                    keep.add(min(points)[1])
+                    keep.add(max(points)[1])
+            idxs.extend(sorted(keep) if keep else [start])
+        return idxs
+
+    @staticmethod
+    def _nth_idxs(columns, point_count, max_points):
+        """
+        Return the indices of every n-th point, starting with the first,
+        where n is the smallest stride keeping no more than *max_points*.
+        """
+        stride = -(-point_count // max_points)
+        return list(range(0, point_count, stride))
@@ -51,6 +51,17 @@ class _BaseSeries(object):
         value_pt_elms = ser.val_pts
         return tuple(pt.value for pt in value_pt_elms)
 
+    @property
+    def values_array(self):
+        """
+        Read-only. An ``array.array('d')`` containing the float values for
+        this series, in the order they appear on the chart, read in a single
+        pass over the cached point values. A point having no value appears
+        as NaN. The array supports the buffer protocol, so a NumPy array can
+        be had without copying using ``numpy.frombuffer(values_array)``.
+        """
+        return self._element.val_array
+
 
 class BarSeries(_BaseSeries):
     """
@@ -149,17 +160,84 @@ class SeriesCollection(Sequence):
     """
     A sequence of |Series| objects.
     """
-    def __init__(self, parent_elm):
-        # *parent_elm* can be either a c:chartSpace or xChart element
+    def __init__(self, parent_elm, series_index=None):
+        # *parent_elm* can be either a c:chartSpace or xChart element, a
+        # |SeriesIndex| is used in place of parent_elm.sers when provided
         super(SeriesCollection, self).__init__()
         self._element = parent_elm
+        self._series_index = series_index
 
     def __getitem__(self, index):
-        ser = self._element.sers[index]
+        ser = self._sers[index]
         return _SeriesFactory(ser)
 
+    def __iter__(self):
+        # resolve the sers once rather than once per item
+        return (_SeriesFactory(ser) for ser in self._sers)
+
     def __len__(self):
-        return len(self._element.sers)
+        return len(self._sers)
+
+    @property
+    def _sers(self):
+        """
+        The sequence of ``<c:ser>`` elements in this collection.
+        """
+        if self._series_index is not None:
+            return self._series_index.sers
+        return self._element.sers
+
+
+class SeriesIndex(object):
+    """
+    Cache of the ``<c:ser>`` elements in a chart, sorted by their
+    ``c:ser/c:idx`` value, along with the xChart elements that contain them.
+    Because gaps in idx numbering are collapsed, the position of a ser
+    element in :attr:`sers` is also its idx value. The cache is rebuilt on
+    first access after :meth:`invalidate` is called, which code that adds,
+    removes, or renumbers ser or xChart elements or rewrites series data
+    must do. An access otherwise reads no XML, so a change made to the
+    chart XML directly is not seen until :meth:`invalidate` is called.
+    """
+    def __init__(self, chartSpace):
+        super(SeriesIndex, self).__init__()
+        self._chartSpace = chartSpace
+        self._sers = None
+        self._xCharts = None
+
+    def __getitem__(self, idx):
+        """
+        Return the ``<c:ser>`` element having ``c:idx/@val`` of *idx*.
+        """
+        return self.sers[idx]
+
+    def invalidate(self):
+        """
+        Discard the cached elements, causing them to be re-read on next
+        access.
+        """
+        self._sers = None
+        self._xCharts = None
+
+    @property
+    def sers(self):
+        """
+        The ``<c:ser>`` elements in the chart, sorted by idx, as a list.
+        """
+        if self._sers is None:
+            self._sers = self._chartSpace.sers
+        return self._sers
+
+    @property
+    def xCharts(self):
+        """
+        The xChart elements in the plot area of the chart, in document
+        order, as a list.
+        """
+        if self._xCharts is None:
+            plotArea = self._chartSpace.chart.plotArea
+            self._xCharts = list(plotArea.iter_plots())
+        return self._xCharts
 
 
 def _SeriesFactory(ser):
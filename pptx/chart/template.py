@@ -0,0 +1,197 @@
+# encoding: utf-8
+
+"""
+ChartTemplate and related objects, for stamping out many charts sharing the
+same formatting.
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import re
+
+from copy import deepcopy
+
+from lxml import etree
+
+from .data import ChartData
+from ..oxml import parse_xml
+from ..oxml.ns import qn
+
+
+class ChartTemplate(object):
+    """
+    A reusable chart skeleton, prepared once and then used to produce each
+    new chart. A template can be passed in place of a chart type to
+    :meth:`shapes.add_chart` and :meth:`ChartPlaceholder.insert_chart`, in
+    which case the new chart is produced by injecting the series data from
+    the |ChartData| object into the prepared skeleton. Formatting of the
+    template series is retained, the formatting of the last series being
+    copied for any series beyond those in the template. As when replacing
+    chart data, a plot left with no series is removed. Like the chart XML
+    writer, only the first series is placed in a pie plot, a pie chart
+    depicting a single series. Only plots of category series are supported;
+    an XY (scatter) or bubble plot, whose series have X and Y values, is
+    rejected. A template saves re-applying formatting to each chart, not
+    time; a chart is produced from a template in about the time it takes
+    to generate one, and its embedded workbook is generated all the same.
+    """
+
+    _chart_type_templates = {}
+    _single_ser_tagnames = (
+        qn('c:pieChart'), qn('c:pie3DChart'), qn('c:ofPieChart')
+    )
+    _unsupported_tagnames = (qn('c:bubbleChart'), qn('c:scatterChart'))
+
+    def __init__(self, chartSpace):
+        super(ChartTemplate, self).__init__()
+        self._skeleton_tmpl = None
+        self._slot_names = []
+        self._single_ser_slots = set()
+        self._ser_tmpls = []
+        self._compile(deepcopy(chartSpace))
+
+    @classmethod
+    def from_chart(cls, chart):
+        """
+        Return a new |ChartTemplate| object having the formatting of the
+        existing |Chart| object *chart*. Relationships of the source chart,
+        such as to its embedded Excel workbook, are not carried over. Raises
+        |ValueError| if *chart* has no series or has an XY (scatter) or
+        bubble plot.
+        """
+        chartSpace = deepcopy(chart._chartSpace)
+        for tagname in ('c:externalData', 'c:userShapes'):
+            for child in chartSpace.findall(qn(tagname)):
+                chartSpace.remove(child)
+        return cls(chartSpace)
+
+    @classmethod
+    def from_chart_type(cls, chart_type):
+        """
+        Return the |ChartTemplate| object for a default chart of
+        *chart_type*, one of the :ref:`XlChartType` enumeration values. The
+        template is generated on first use and cached, so the same object is
+        returned on each call for a given chart type.
+        """
+        template = cls._chart_type_templates.get(chart_type)
+        if template is None:
+            chart_data = ChartData()
+            chart_data.categories = ('',)
+            chart_data.add_series('', (0,))
+            chartSpace = parse_xml(chart_data.xml_bytes(chart_type))
+            template = cls(chartSpace)
+            cls._chart_type_templates[chart_type] = template
+        return template
+
+    def new_chartSpace(self, chart_data):
+        """
+        Return a new ``<c:chartSpace>`` element produced from this template
+        and depicting the categories and series in *chart_data*. The
+        category XML is composed once and shared by all series. Series
+        beyond the first placed in a pie plot are left out.
+        """
+        series = chart_data.series
+        cat_xml = series[0].cat_xml if series else ''
+        slot_xmls = [[] for _ in self._slot_names]
+
+        last_tmpl_idx = len(self._ser_tmpls) - 1
+        for series_data in series:
+            tmpl_idx = min(series_data.index, last_tmpl_idx)
+            xChart_idx, ser_tmpl = self._ser_tmpls[tmpl_idx]
+            if xChart_idx in self._single_ser_slots and slot_xmls[xChart_idx]:
+                continue
+            slot_xmls[xChart_idx].append(ser_tmpl % {
+                'idx': series_data.index, 'tx': series_data.tx_xml,
+                'cat': cat_xml, 'val': series_data.val_xml,
+            })
+
+        chartSpace = parse_xml(self._skeleton_tmpl % dict(
+            (name, ''.join(xmls))
+            for name, xmls in zip(self._slot_names, slot_xmls)
+        ))
+
+        xCharts = list(chartSpace.chart.plotArea.iter_plots())
+        for xChart, xmls in zip(xCharts, slot_xmls):
+            if not xmls:
+                xChart.getparent().remove(xChart)
+        return chartSpace
+
+    def _compile(self, chartSpace):
+        """
+        Reduce *chartSpace* to a string formatting template having a named
+        slot where the ``<c:ser>`` elements of each xChart belong, and each
+        of its ``<c:ser>`` elements to a template for a new series in that
+        xChart.
+        """
+        ser_tmpls = []
+        xCharts = list(chartSpace.chart.plotArea.iter_plots())
+        for xChart_idx, xChart in enumerate(xCharts):
+            if xChart.tag in self._unsupported_tagnames:
+                raise ValueError(
+                    'chart template does not support %s plots'
+                    % etree.QName(xChart).localname
+                )
+            sers = list(xChart.iter_sers())
+            offset = xChart.index(sers[0]) if sers else len(xChart)
+            for ser in sers:
+                xChart.remove(ser)
+                ser_tmpls.append((
+                    ser.idx.val, xChart_idx,
+                    self._ser_tmpl(ser, chartSpace.nsmap)
+                ))
+            slot_name = 'xChart%d' % xChart_idx
+            xChart.insert(offset, etree.Comment(slot_name))
+            self._slot_names.append(slot_name)
+            if xChart.tag in self._single_ser_tagnames:
+                self._single_ser_slots.add(xChart_idx)
+        if not ser_tmpls:
+            raise ValueError('chart template must contain at least one series')
+
+        self._skeleton_tmpl = self._tmpl_from(chartSpace, self._slot_names)
+        self._ser_tmpls = [
+            (xChart_idx, ser_tmpl) for _, xChart_idx, ser_tmpl in sorted(
+                ser_tmpls, key=lambda t: t[0]
+            )
+        ]
+
+    @classmethod
+    def _ser_tmpl(cls, ser, nsmap):
+        """
+        Return a string formatting template for a new series formatted like
+        *ser*, having slots for its idx and its ``<c:tx>``, ``<c:cat>`` and
+        ``<c:val>`` elements. Namespace declarations on *ser* already made
+        in *nsmap* are dropped, as they are redundant within the chart.
+        """
+        for tagname in ('c:tx', 'c:cat', 'c:val'):
+            child = ser.find(qn(tagname))
+            if child is None:
+                insert_method = getattr(ser, '_insert_%s' % tagname[2:])
+                child = insert_method(ser.makeelement(qn(tagname)))
+            ser.replace(child, etree.Comment(tagname[2:]))
+        ser.idx.set('val', 'idx')
+        ser.order.set('val', 'idx')
+
+        ser_tmpl = cls._tmpl_from(ser, ('tx', 'cat', 'val'))
+        ser_tmpl = ser_tmpl.replace('val="idx"', 'val="%(idx)d"')
+
+        def drop_if_redundant(match):
+            prefix, uri = match.groups()
+            return '' if nsmap.get(prefix) == uri else match.group(0)
+
+        start_tag_end = ser_tmpl.index('>')
+        return re.sub(
+            r' xmlns:(\w+)="([^"]*)"', drop_if_redundant,
+            ser_tmpl[:start_tag_end]
+        ) + ser_tmpl[start_tag_end:]
+
+    @staticmethod
+    def _tmpl_from(element, slot_names):
+        """
+        Return the XML of *element* as a string formatting template, with
+        each comment naming an item in *slot_names* replaced by a format
+        field of that name.
+        """
+        xml = etree.tostring(element).decode('utf-8').replace('%', '%%')
+        for name in slot_names:
+            xml = xml.replace('<!--%s-->' % name, '%%(%s)s' % name)
+        return xml
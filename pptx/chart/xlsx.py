@@ -7,25 +7,41 @@ Chart builder and related objects.
 from __future__ import absolute_import, print_function, unicode_literals
 
 from contextlib import contextmanager
+from zipfile import ZIP_DEFLATED, ZipFile
 
+from lxml import etree
 from xlsxwriter import Workbook
 
-from ..compat import BytesIO
+from ..compat import BytesIO, is_string
+from ..opc.constants import (
+    NAMESPACE as NS, RELATIONSHIP_TARGET_MODE as RTM,
+    RELATIONSHIP_TYPE as RT
+)
+from ..opc.packuri import PACKAGE_URI, PackURI
 
 
 class WorkbookWriter(object):
     """
     Service object that knows how to write an Excel workbook for chart data.
     """
+    source_idx_header = 'Source Index'
+
     @classmethod
-    def xlsx_blob(cls, categories, series):
+    def xlsx_blob(cls, categories, series, source_idxs=None):
         """
         Return the byte stream of an Excel file formatted as chart data for
-        a chart having *categories* and *series*.
+        a chart having *categories* and *series*. When *source_idxs* is not
+        |None|, as for decimated chart data, it is written in a column
+        following the series, recording the index of each point in the
+        original data.
         """
         xlsx_file = BytesIO()
         with cls._open_worksheet(xlsx_file) as (workbook, worksheet):
             cls._populate_worksheet(workbook, worksheet, categories, series)
+            if source_idxs is not None:
+                source_col = len(series) + 1
+                worksheet.write(0, source_col, cls.source_idx_header)
+                worksheet.write_column(1, source_col, source_idxs)
         return xlsx_file.getvalue()
 
     @staticmethod
@@ -58,3 +74,381 @@ class WorkbookWriter(object):
             series_col = series.index + 1
             worksheet.write(0, series_col, series.name)
             worksheet.write_column(1, series_col, series.values, num_format)
+
+
+class WorksheetPatcher(object):
+    """
+    Service object that knows how to change individual cell values in the
+    chart data worksheet of an existing Excel workbook, leaving the rest of
+    the workbook undisturbed. The chart data worksheet is the first
+    worksheet of the workbook, located by following the relationships of
+    the Excel package, so a workbook saved by Excel is handled as well as
+    one written by XlsxWriter.
+    """
+    _nsuri = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+
+    # number formats having a built-in id, which need no <numFmt> element
+    _builtin_numFmtIds = {
+        'General': '0', '0': '1', '0.00': '2', '#,##0': '3',
+        '#,##0.00': '4', '0%': '9', '0.00%': '10', '0.00E+00': '11',
+        '@': '49',
+    }
+
+    @classmethod
+    def cell_text(cls, xlsx_blob, row_idx, col_idx):
+        """
+        Return the text of the cell at zero-based *row_idx* and *col_idx* in
+        the worksheet of the Excel file in *xlsx_blob*, or |None| if there is
+        no such cell or it does not contain a string. Shared strings, inline
+        strings, and formula string results are all read. Raises |KeyError|
+        if the workbook has no worksheet.
+        """
+        zipf = ZipFile(BytesIO(xlsx_blob))
+        try:
+            sheet_membername, sst_membername = cls._membernames(zipf)[:2]
+            worksheet = etree.fromstring(zipf.read(sheet_membername))
+            sheetData = worksheet.find(cls._qn('sheetData'))
+            row = cls._row(sheetData, row_idx + 1, create=False)
+            c = None if row is None else cls._cell(row, col_idx, False)
+            if c is None:
+                return None
+            t = c.get('t')
+            if t == 'inlineStr':
+                return ''.join(c.find(cls._qn('is')).itertext())
+            v = c.find(cls._qn('v'))
+            if v is None or t not in ('s', 'str'):
+                return None
+            if t == 'str':
+                return v.text
+            if sst_membername is None:
+                return None
+            sst = etree.fromstring(zipf.read(sst_membername))
+            si = sst.findall(cls._qn('si'))[int(v.text)]
+            return ''.join(t_.text or '' for t_ in si.iter(cls._qn('t')))
+        finally:
+            zipf.close()
+
+    @classmethod
+    def patched_xlsx_blob(cls, xlsx_blob, cells, number_formats=None):
+        """
+        Return the byte stream of the Excel file in *xlsx_blob* after
+        applying the changes in *cells*, a sequence of ``(row_idx, col_idx,
+        value)`` triples using zero-based row and column indices. A string
+        *value* is written as an inline string, any other value as a number.
+        A *value* of |None| causes the cell to be removed. *number_formats*,
+        when not |None|, maps a column index to the number format, such as
+        ``'0.00'``, given to the numbers written in that column, as for the
+        column of a newly added series. Raises |KeyError| if the workbook has
+        no worksheet.
+        """
+        in_zip = ZipFile(BytesIO(xlsx_blob))
+        sheet_membername, _, styles_membername = cls._membernames(in_zip)
+        patched_blobs, col_styles = {}, {}
+        if number_formats and styles_membername is not None:
+            patched_blobs[styles_membername], col_styles = (
+                cls._patched_styles_xml(
+                    in_zip.read(styles_membername), number_formats
+                )
+            )
+        patched_blobs[sheet_membername] = cls._patched_sheet_xml(
+            in_zip.read(sheet_membername), cells, col_styles
+        )
+        xlsx_file = BytesIO()
+        out_zip = ZipFile(xlsx_file, 'w', ZIP_DEFLATED)
+        for zipinfo in in_zip.infolist():
+            blob = patched_blobs.get(zipinfo.filename)
+            if blob is None:
+                blob = in_zip.read(zipinfo.filename)
+            out_zip.writestr(zipinfo, blob)
+        out_zip.close()
+        in_zip.close()
+        return xlsx_file.getvalue()
+
+    @classmethod
+    def _cell(cls, row, col_idx, create):
+        """
+        Return the ``<c>`` child of *row* in the column at *col_idx*. If
+        there is no such cell, a new one is inserted in column order when
+        *create* is |True|, otherwise |None| is returned.
+        """
+        ref = '%s%s' % (cls._col_letters(col_idx), row.get('r'))
+        successor = None
+        for c in row.iterchildren(cls._qn('c')):
+            if c.get('r') == ref:
+                return c
+            if cls._col_idx(c.get('r')) > col_idx:
+                successor = c
+                break
+        if not create:
+            return None
+        c = etree.Element(cls._qn('c'), r=ref)
+        if successor is None:
+            row.append(c)
+        else:
+            successor.addprevious(c)
+        return c
+
+    @staticmethod
+    def _col_idx(cell_ref):
+        """
+        Return the zero-based column index of the cell reference *cell_ref*,
+        e.g. 2 for 'C7'.
+        """
+        col_idx = 0
+        for char in cell_ref:
+            if char.isdigit():
+                break
+            col_idx = col_idx * 26 + (ord(char) - ord('A') + 1)
+        return col_idx - 1
+
+    @staticmethod
+    def _col_letters(col_idx):
+        """
+        Return the column letters for zero-based *col_idx*, e.g. 'AA' for 26.
+        """
+        letters = ''
+        col_number = col_idx + 1
+        while col_number:
+            col_number, remainder = divmod(col_number - 1, 26)
+            letters = chr(ord('A') + remainder) + letters
+        return letters
+
+    @classmethod
+    def _membernames(cls, zipf):
+        """
+        Return a ``(sheet, sst, styles)`` triple of the zip member names of
+        the chart data worksheet, the shared strings, and the styles of the
+        Excel package open in *zipf*, found by following its relationships.
+        *sst* and *styles* are |None| when the workbook has no such part.
+        Raises |KeyError| if the workbook has no worksheet.
+        """
+        targets = dict(
+            (reltype, partname)
+            for _, reltype, partname in cls._rels(zipf, PACKAGE_URI)
+        )
+        workbook_partname = targets.get(RT.OFFICE_DOCUMENT)
+        if workbook_partname is None:
+            raise KeyError('no workbook in Excel package')
+        rels = cls._rels(zipf, workbook_partname)
+        targets = dict((reltype, partname) for _, reltype, partname in rels)
+        worksheets = dict(
+            (rId, partname) for rId, reltype, partname in rels
+            if reltype == RT.WORKSHEET
+        )
+
+        workbook = etree.fromstring(zipf.read(workbook_partname.membername))
+        rId_attr = '{%s}id' % NS.OFC_RELATIONSHIPS
+        sheet_partname = None
+        for sheet in workbook.iter(cls._qn('sheet')):
+            sheet_partname = worksheets.get(sheet.get(rId_attr))
+            if sheet_partname is not None:
+                break
+        if sheet_partname is None:
+            raise KeyError('no worksheet in Excel package')
+
+        sst_partname = targets.get(RT.SHARED_STRINGS)
+        styles_partname = targets.get(RT.STYLES)
+        return (
+            sheet_partname.membername,
+            None if sst_partname is None else sst_partname.membername,
+            None if styles_partname is None else styles_partname.membername,
+        )
+
+    @classmethod
+    def _numFmtId(cls, styleSheet, number_format):
+        """
+        Return the id, as a string, of *number_format* in *styleSheet*,
+        adding a ``<numFmt>`` element for it if it is neither already
+        present nor built in.
+        """
+        numFmts = styleSheet.find(cls._qn('numFmts'))
+        # custom number formats are numbered from 164
+        next_id = 164
+        if numFmts is not None:
+            for numFmt in numFmts.iterchildren(cls._qn('numFmt')):
+                if numFmt.get('formatCode') == number_format:
+                    return numFmt.get('numFmtId')
+                next_id = max(next_id, int(numFmt.get('numFmtId')) + 1)
+        numFmtId = cls._builtin_numFmtIds.get(number_format)
+        if numFmtId is not None:
+            return numFmtId
+        if numFmts is None:
+            numFmts = etree.Element(cls._qn('numFmts'))
+            styleSheet.insert(0, numFmts)
+        etree.SubElement(
+            numFmts, cls._qn('numFmt'), numFmtId=str(next_id),
+            formatCode=number_format
+        )
+        numFmts.set('count', str(len(numFmts.findall(cls._qn('numFmt')))))
+        return str(next_id)
+
+    @classmethod
+    def _patched_sheet_xml(cls, sheet_xml, cells, col_styles=None):
+        """
+        Return the worksheet XML in *sheet_xml* with *cells* applied and its
+        ``<dimension>`` element updated to the new extents of the data.
+        *col_styles* maps a column index to the cell format index given to
+        the numbers written in that column.
+        """
+        col_styles = col_styles or {}
+        worksheet = etree.fromstring(sheet_xml)
+        sheetData = worksheet.find(cls._qn('sheetData'))
+        for row_idx, col_idx, value in cells:
+            row = cls._row(sheetData, row_idx + 1, create=value is not None)
+            if row is None:
+                continue
+            c = cls._cell(row, col_idx, create=value is not None)
+            if value is None:
+                if c is not None:
+                    row.remove(c)
+                if len(row) == 0:
+                    sheetData.remove(row)
+                continue
+            cls._set_cell_value(
+                sheetData, row, c, col_idx, value, col_styles.get(col_idx)
+            )
+        cls._update_dimension(worksheet, sheetData)
+        return etree.tostring(
+            worksheet, encoding='UTF-8', xml_declaration=True,
+            standalone=True
+        )
+
+    @classmethod
+    def _patched_styles_xml(cls, styles_xml, number_formats):
+        """
+        Return a ``(styles_xml, col_styles)`` pair. *styles_xml* is the
+        styles XML in *styles_xml* with a cell format added for each number
+        format in *number_formats* that has none. *col_styles* maps each
+        column index in *number_formats* to the index of the cell format
+        applying its number format, the value of the ``s`` attribute of
+        a cell, omitting columns needing only the default format.
+        """
+        styleSheet = etree.fromstring(styles_xml)
+        cellXfs = styleSheet.find(cls._qn('cellXfs'))
+        if cellXfs is None:
+            return styles_xml, {}
+        xfs = cellXfs.findall(cls._qn('xf'))
+        col_styles = {}
+        for col_idx, number_format in number_formats.items():
+            numFmtId = cls._numFmtId(styleSheet, number_format)
+            for xf_idx, xf in enumerate(xfs):
+                if (xf.get('numFmtId', '0') == numFmtId and
+                        xf.get('fontId', '0') == '0' and
+                        xf.get('fillId', '0') == '0' and
+                        xf.get('borderId', '0') == '0'):
+                    break
+            else:
+                xf_idx = len(xfs)
+                xfs.append(etree.SubElement(
+                    cellXfs, cls._qn('xf'), numFmtId=numFmtId, fontId='0',
+                    fillId='0', borderId='0', xfId='0',
+                    applyNumberFormat='1'
+                ))
+                cellXfs.set('count', str(len(xfs)))
+            if xf_idx:
+                col_styles[col_idx] = str(xf_idx)
+        styles_xml = etree.tostring(
+            styleSheet, encoding='UTF-8', xml_declaration=True,
+            standalone=True
+        )
+        return styles_xml, col_styles
+
+    @classmethod
+    def _rels(cls, zipf, partname):
+        """
+        Return a list of ``(rId, reltype, target_partname)`` triples for
+        each internal relationship of the part named *partname* in the
+        package open in *zipf*. The list is empty when the part has no
+        relationships.
+        """
+        rels_membername = partname.rels_uri.membername
+        if rels_membername not in zipf.namelist():
+            return []
+        relationships = etree.fromstring(zipf.read(rels_membername))
+        return [
+            (
+                rel.get('Id'), rel.get('Type'),
+                PackURI.from_rel_ref(partname.baseURI, rel.get('Target'))
+            )
+            for rel in relationships.iterchildren(
+                '{%s}Relationship' % NS.OPC_RELATIONSHIPS
+            )
+            if rel.get('TargetMode') != RTM.EXTERNAL
+        ]
+
+    @classmethod
+    def _qn(cls, tagroot):
+        """
+        Return the Clark-notation name of SpreadsheetML element *tagroot*.
+        """
+        return '{%s}%s' % (cls._nsuri, tagroot)
+
+    @classmethod
+    def _row(cls, sheetData, row_number, create):
+        """
+        Return the ``<row>`` child of *sheetData* having one-based
+        *row_number*, inserted in row order if not present and *create* is
+        |True|.
+        """
+        successor = None
+        for row in sheetData.iterchildren(cls._qn('row')):
+            r = int(row.get('r'))
+            if r == row_number:
+                return row
+            if r > row_number:
+                successor = row
+                break
+        if not create:
+            return None
+        row = etree.Element(cls._qn('row'), r=str(row_number))
+        if successor is None:
+            sheetData.append(row)
+        else:
+            successor.addprevious(row)
+        return row
+
+    @classmethod
+    def _set_cell_value(cls, sheetData, row, c, col_idx, value, s=None):
+        """
+        Replace the contents of cell *c* with *value*. A numeric cell is
+        given the cell format index *s* when it is not |None|. Otherwise
+        a new numeric cell takes its style from the cell above it so
+        a series number format carries over to added points.
+        """
+        # row spans are an optional optimization hint that may now be stale
+        row.attrib.pop('spans', None)
+        for child in list(c):
+            c.remove(child)
+        c.attrib.pop('t', None)
+        if is_string(value):
+            c.set('t', 'inlineStr')
+            is_ = etree.SubElement(c, cls._qn('is'))
+            etree.SubElement(is_, cls._qn('t')).text = value
+            return
+        if s is not None:
+            c.set('s', s)
+        elif c.get('s') is None:
+            above = cls._row(sheetData, int(row.get('r')) - 1, create=False)
+            if above is not None:
+                above_c = cls._cell(above, col_idx, create=False)
+                if above_c is not None and above_c.get('s') is not None:
+                    c.set('s', above_c.get('s'))
+        etree.SubElement(c, cls._qn('v')).text = '%s' % value
+
+    @classmethod
+    def _update_dimension(cls, worksheet, sheetData):
+        """
+        Set the ``ref`` attribute of the ``<dimension>`` element to span all
+        remaining cells in *sheetData*.
+        """
+        dimension = worksheet.find(cls._qn('dimension'))
+        if dimension is None:
+            return
+        max_row, max_col = 1, 0
+        for row in sheetData.iterchildren(cls._qn('row')):
+            for c in row.iterchildren(cls._qn('c')):
+                max_row = max(max_row, int(row.get('r')))
+                max_col = max(max_col, cls._col_idx(c.get('r')))
+        last_ref = '%s%d' % (cls._col_letters(max_col), max_row)
+        ref = 'A1' if last_ref == 'A1' else 'A1:%s' % last_ref
+        dimension.set('ref', ref)
@@ -403,6 +403,24 @@ class RelationshipCollection(dict):
             self._target_parts_by_rId[rId] = target
         return rel
 
+    def add_relationships(self, reltype, target_parts):
+        """
+        Return a list of the rIds of newly added relationships of *reltype*,
+        one to each part in *target_parts*, in order. The rIds are those
+        successive calls to :meth:`get_or_add` would assign to parts not yet
+        related, found in a single pass rather than by searching the
+        collection for each part. No part in *target_parts* may already be
+        a target of the collection.
+        """
+        rIds, n = [], 1
+        for target_part in target_parts:
+            while 'rId%d' % n in self:
+                n += 1
+            rId = 'rId%d' % n
+            self.add_relationship(reltype, target_part, rId)
+            rIds.append(rId)
+        return rIds
+
     def get_or_add(self, reltype, target_part):
         """
         Return relationship of *reltype* to *target_part*, newly added if not
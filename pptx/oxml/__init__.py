@@ -226,6 +226,8 @@ from .shapes.shared import (
     CT_NonVisualDrawingProps, CT_Placeholder, CT_Point2D, CT_PositiveSize2D,
     CT_ShapeProperties, CT_Transform2D
 )
+register_element_cls('a:chExt', CT_PositiveSize2D)
+register_element_cls('a:chOff', CT_Point2D)
 register_element_cls('a:ext',   CT_PositiveSize2D)
 register_element_cls('a:ln',    CT_LineProperties)
 register_element_cls('a:off',   CT_Point2D)
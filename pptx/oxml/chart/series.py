@@ -6,6 +6,8 @@ Series-related oxml objects.
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+from array import array
+
 from ..simpletypes import XsdUnsignedInt
 from ..xmlchemy import (
     BaseOxmlElement, OneAndOnlyOne, RequiredAttribute, ZeroOrOne
@@ -31,6 +33,27 @@ class CT_SeriesComposite(BaseOxmlElement):
     val = ZeroOrOne('c:val', successors=('c:smooth', 'c:shape', 'c:extLst'))
     smooth = ZeroOrOne('c:smooth', successors=('c:extLst',))
 
+    @property
+    def val_array(self):
+        """
+        An ``array.array('d')`` containing the float value of each point
+        under the ``<c:val>`` child element, indexed by the point's ``idx``
+        attribute. The array length is the ``<c:ptCount>`` value when
+        present. A point with no ``<c:pt>`` element or an empty ``<c:v>``
+        element, such as a blank cell, appears as NaN. Built in a single pass
+        without creating a proxy element for each point.
+        """
+        pt_counts = self.xpath('./c:val//c:ptCount/@val')
+        idxs = [int(idx) for idx in self.xpath('./c:val//c:pt/@idx')]
+        valued_idxs = self.xpath('./c:val//c:pt[c:v/text()]/@idx')
+        vs = self.xpath('./c:val//c:pt/c:v[text()][1]/text()[1]')
+        pt_count = int(pt_counts[0]) if pt_counts else 0
+        pt_count = max([pt_count] + [idx + 1 for idx in idxs])
+        values = array('d', [float('nan')]) * pt_count
+        for idx, v in zip(valued_idxs, vs):
+            values[int(idx)] = float(v)
+        return values
+
     @property
     def val_pts(self):
         """
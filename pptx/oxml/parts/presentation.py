@@ -48,18 +48,40 @@ class CT_SlideIdList(BaseOxmlElement):
         """
         return self._add_sldId(id=self._next_id, rId=rId)
 
+    def add_sldIds(self, rIds):
+        """
+        Return a list of newly created <p:sldId> child elements, one for each
+        rId in *rIds*, having the ids successive calls to :meth:`add_sldId`
+        would assign. The ids in use are collected once rather than for each
+        new element.
+        """
+        used_ids = self._used_ids
+        sldIds, n = [], 256
+        for rId in rIds:
+            while n in used_ids:
+                n += 1
+            sldIds.append(self._add_sldId(id=n, rId=rId))
+            n += 1
+        return sldIds
+
     @property
     def _next_id(self):
         """
         Return the next available slide ID as an int. Valid slide IDs start
         at 256. Unused ids in the sequences starting from 256 are used first.
         """
-        id_str_lst = self.xpath('./p:sldId/@id')
-        used_ids = [int(id_str) for id_str in id_str_lst]
+        used_ids = self._used_ids
         for n in range(256, 258+len(used_ids)):
             if n not in used_ids:
                 return n
 
+    @property
+    def _used_ids(self):
+        """
+        Set of the slide ids, as ints, of the <p:sldId> children.
+        """
+        return set(int(id_str) for id_str in self.xpath('./p:sldId/@id'))
+
 
 class CT_SlideMasterIdList(BaseOxmlElement):
     """
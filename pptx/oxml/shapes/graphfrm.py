@@ -117,15 +117,16 @@ class CT_GraphicalObjectFrame(BaseShapeElement):
         return graphicFrame
 
     @classmethod
-    def new_table_graphicFrame(cls, id_, name, rows, cols, x, y, cx, cy):
+    def new_table_graphicFrame(cls, id_, name, rows, cols, x, y, cx, cy,
+                               texts=None):
         """
         Return a ``<p:graphicFrame>`` element tree populated with a table
-        element.
+        element, its cells pre-filled from *texts* when it is not |None|.
         """
         graphicFrame = cls.new_graphicFrame(id_, name, x, y, cx, cy)
         graphicFrame.graphic.graphicData.uri = GRAPHIC_DATA_URI_TABLE
         graphicFrame.graphic.graphicData.append(
-            CT_Table.new_tbl(rows, cols, cx, cy)
+            CT_Table.new_tbl(rows, cols, cx, cy, texts=texts)
         )
         return graphicFrame
 
@@ -56,13 +56,13 @@ class CT_GroupShape(BaseShapeElement):
         self.insert_element_before(sp, 'p:extLst')
         return sp
 
-    def add_table(self, id_, name, rows, cols, x, y, cx, cy):
+    def add_table(self, id_, name, rows, cols, x, y, cx, cy, texts=None):
         """
         Append a ``<p:graphicFrame>`` shape containing a table as specified
         in call.
         """
         graphicFrame = CT_GraphicalObjectFrame.new_table_graphicFrame(
-            id_, name, rows, cols, x, y, cx, cy
+            id_, name, rows, cols, x, y, cx, cy, texts
         )
         self.insert_element_before(graphicFrame, 'p:extLst')
         return graphicFrame
@@ -83,20 +83,24 @@ class CT_GroupShape(BaseShapeElement):
         """
         return self.grpSpPr.get_or_add_xfrm()
 
-    def iter_ph_elms(self):
+    def iter_ph_elms(self, children=None):
         """
-        Generate each placeholder shape child element in document order.
+        Generate each placeholder shape child element in document order,
+        from among *children* if a sequence of child elements is given.
         """
-        for e in self.iter_shape_elms():
+        for e in self.iter_shape_elms(children):
             if e.has_ph_elm:
                 yield e
 
-    def iter_shape_elms(self):
+    def iter_shape_elms(self, children=None):
         """
         Generate each child of this ``<p:spTree>`` element that corresponds
-        to a shape, in the sequence they appear in the XML.
+        to a shape, in the sequence they appear in the XML, from among
+        *children* if a sequence of child elements is given.
         """
-        for elm in self.iterchildren():
+        if children is None:
+            children = self.iterchildren()
+        for elm in children:
             if elm.tag in self._shape_tags:
                 yield elm
 
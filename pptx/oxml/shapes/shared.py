@@ -344,8 +344,10 @@ class CT_Transform2D(BaseOxmlElement):
     Custom element class for <a:xfrm> element.
     """
     rot = OptionalAttribute('rot', ST_Angle, default=0.0)
-    off = ZeroOrOne('a:off', successors=('a:ext',))
-    ext = ZeroOrOne('a:ext', successors=())
+    off = ZeroOrOne('a:off', successors=('a:ext', 'a:chOff', 'a:chExt'))
+    ext = ZeroOrOne('a:ext', successors=('a:chOff', 'a:chExt'))
+    chOff = ZeroOrOne('a:chOff', successors=('a:chExt',))
+    chExt = ZeroOrOne('a:chExt', successors=())
 
     @property
     def x(self):
@@ -6,11 +6,13 @@ lxml custom element classes for table-related XML elements.
 
 from __future__ import absolute_import, division
 
+from xml.sax.saxutils import escape
+
 from .. import parse_xml
 from ...enum.text import MSO_VERTICAL_ANCHOR
 from ..ns import nsdecls
 from ..simpletypes import ST_Coordinate, ST_Coordinate32, XsdBoolean
-from ..text import CT_TextBody
+from ..text import _ParagraphTextAppender, CT_TextBody
 from ..xmlchemy import (
     BaseOxmlElement, Choice, OneAndOnlyOne, OptionalAttribute,
     RequiredAttribute, ZeroOrMore, ZeroOrOne, ZeroOrOneChoice
@@ -114,46 +116,68 @@ class CT_Table(BaseOxmlElement):
         setattr(tblPr, propname, value)
 
     @classmethod
-    def new_tbl(cls, rows, cols, width, height, tableStyleId=None):
+    def new_tbl(cls, rows, cols, width, height, tableStyleId=None,
+                texts=None):
         """
-        Return a new ``<p:tbl>`` element tree
+        Return a new ``<a:tbl>`` element tree having *rows* rows and *cols*
+        columns, *width* and *height* being divided evenly between them. When
+        *texts* is given, it is a sequence of rows, each a sequence of
+        unicode strings, providing the initial text of the cells at the top
+        left of the table. The XML for the whole table is generated as
+        a string and parsed once, which for a large table is much faster
+        than adding each row and cell element in turn.
         """
         # working hypothesis is this is the default table style GUID
         if tableStyleId is None:
             tableStyleId = '{5C22544A-7EE6-4342-B048-85BDC9FD1C3A}'
+        texts = () if texts is None else tuple(texts)
+
+        # last row and col absorb any division error
+        colwidth, rowheight = width//cols, height//rows
+        col_widths = [colwidth] * (cols-1) + [width - (cols-1)*colwidth]
+        row_heights = [rowheight] * (rows-1) + [height - (rows-1)*rowheight]
+
+        gridCols = ''.join('<a:gridCol w="%d"/>' % w for w in col_widths)
+        trs = []
+        for row_idx, h in enumerate(row_heights):
+            row_texts = tuple(texts[row_idx]) if row_idx < len(texts) else ()
+            trs.append('<a:tr h="%d">' % h)
+            trs.extend(
+                cls._tc_xml(row_texts[col] if col < len(row_texts) else None)
+                for col in range(cols)
+            )
+            trs.append('</a:tr>')
 
-        xml = cls._tbl_tmpl() % (tableStyleId)
-        tbl = parse_xml(xml)
-
-        # add specified number of rows and columns
-        rowheight = height//rows
-        colwidth = width//cols
-
-        for col in range(cols):
-            # adjust width of last col to absorb any div error
-            if col == cols-1:
-                colwidth = width - ((cols-1) * colwidth)
-            tbl.tblGrid.add_gridCol(width=colwidth)
-
-        for row in range(rows):
-            # adjust height of last row to absorb any div error
-            if row == rows-1:
-                rowheight = height - ((rows-1) * rowheight)
-            tr = tbl.add_tr(height=rowheight)
-            for col in range(cols):
-                tr.add_tc()
+        xml = cls._tbl_tmpl() % (tableStyleId, gridCols, ''.join(trs))
+        return parse_xml(xml)
 
-        return tbl
+    @staticmethod
+    def _tc_xml(text):
+        """
+        Return the XML for an ``<a:tc>`` element containing *text*, an empty
+        cell if *text* is |None| or empty.
+        """
+        p_content = ''
+        if text:
+            p_content = '<a:br/>'.join(
+                '<a:r><a:t>%s</a:t></a:r>' % escape(line) if line else ''
+                for line in text.split('\n')
+            )
+        return (
+            '<a:tc><a:txBody><a:bodyPr/><a:lstStyle/><a:p>%s</a:p>'
+            '</a:txBody><a:tcPr/></a:tc>' % p_content
+        )
 
     @classmethod
     def _tbl_tmpl(cls):
         return (
-            '<a:tbl %s>\n'
-            '  <a:tblPr firstRow="1" bandRow="1">\n'
-            '    <a:tableStyleId>%s</a:tableStyleId>\n'
-            '  </a:tblPr>\n'
-            '  <a:tblGrid/>\n'
-            '</a:tbl>' % (nsdecls('a'), '%s')
+            '<a:tbl %s>'
+            '<a:tblPr firstRow="1" bandRow="1">'
+            '<a:tableStyleId>%s</a:tableStyleId>'
+            '</a:tblPr>'
+            '<a:tblGrid>%s</a:tblGrid>'
+            '%s'
+            '</a:tbl>' % (nsdecls('a'), '%s', '%s', '%s')
         )
 
 
@@ -243,6 +267,21 @@ class CT_TableCell(BaseOxmlElement):
         tc = parse_xml(xml)
         return tc
 
+    def set_text(self, text):
+        """
+        Replace the content of this cell with a single paragraph containing
+        *text*, a unicode string in which each line feed character becomes
+        a line break. Properties of the first paragraph are preserved.
+        """
+        txBody = self.get_or_add_txBody()
+        p_lst = txBody.p_lst
+        for p in p_lst[1:]:
+            txBody.remove(p)
+        p = p_lst[0]
+        for elm in p.content_children:
+            p.remove(elm)
+        _ParagraphTextAppender.append_to_p_from_text(p, text)
+
     def _get_marX(self, attr_name, default):
         """
         Generalized method to get margin values.
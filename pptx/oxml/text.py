@@ -6,13 +6,15 @@ lxml custom element classes for text-related XML elements.
 
 from __future__ import absolute_import
 
+from lxml import etree
+
 from . import parse_xml
 from ..compat import to_unicode
 from ..enum.text import (
     MSO_AUTO_SIZE, MSO_TEXT_UNDERLINE_TYPE, MSO_VERTICAL_ANCHOR,
     PP_PARAGRAPH_ALIGNMENT
 )
-from .ns import nsdecls
+from .ns import nsdecls, qn
 from .simpletypes import (
     ST_Coordinate32, ST_TextFontScalePercentOrPercentString, ST_TextFontSize,
     ST_TextIndentLevelType, ST_TextSpacingPercentOrPercentString,
@@ -453,50 +455,31 @@ class CT_TextSpacingPoint(BaseOxmlElement):
 class _ParagraphTextAppender(object):
     """
     Service object that knows how to translate a Python string into run and
-    line break elements appended to a specified ``<a:p>`` element. Contiguous
-    sequences of regular characters are appended in a single ``<a:r>``
-    element. A newline character ('\n') causes a ``<a:br>`` element to be
-    appended.
+    line break elements appended to a specified ``<a:p>`` element. Each line
+    of the text is appended in a single ``<a:r>`` element and a newline
+    character ('\n') causes a ``<a:br>`` element to be appended. The text is
+    split into lines in one operation and the elements are created directly
+    in place, so appending a long text is not much more costly than the
+    splitting itself.
     """
-    def __init__(self, p):
-        self._p = p
-        self._bfr = []
-
     @classmethod
     def append_to_p_from_text(cls, p, text):
         """
-        Create a "one-shot" ``_ParagraphTextAppender`` instance and use it to
-        append ``<a:r>`` and ``<a:br>`` elements to *p* that correspond to
+        Append ``<a:r>`` and ``<a:br>`` elements to *p* that correspond to
         the contents of *text*.
         """
-        appender = cls(p)
-        appender._add_text(text)
+        r_tag, t_tag, br_tag = qn('a:r'), qn('a:t'), qn('a:br')
 
-    def _add_text(self, text):
-        """
-        Append the paragraph content elements corresponding to *text* to the
-        ``<a:p>`` element of this instance.
-        """
-        for char in text:
-            self._add_char(char)
-        self._flush()
+        endParaRPr = p.endParaRPr
+        if endParaRPr is not None:
+            p.remove(endParaRPr)
 
-    def _add_char(self, char):
-        """
-        Process the next character of input through the translation finite
-        state maching (FSM). There are two possible states, buffer pending
-        and not pending, but those are hidden behind the ``.flush()`` method
-        which must be called at the end of text to ensure any pending
-        ``<a:r>`` element is written.
-        """
-        if char == '\n':
-            self._flush()
-            self._p.add_br()
-        else:
-            self._bfr.append(char)
+        for idx, line in enumerate(text.split('\n')):
+            if idx:
+                etree.SubElement(p, br_tag)
+            if line:
+                r = etree.SubElement(p, r_tag)
+                etree.SubElement(r, t_tag).text = line
 
-    def _flush(self):
-        text = ''.join(self._bfr)
-        if text:
-            self._p.add_r(text)
-        del self._bfr[:]
+        if endParaRPr is not None:
+            p.append(endParaRPr)
@@ -7,6 +7,9 @@ Chart part objects, including Chart and Charts
 from __future__ import absolute_import, print_function, unicode_literals
 
 from ..chart.chart import Chart
+from ..chart.series import SeriesIndex
+from ..chart.template import ChartTemplate
+from ..chart.xlsx import WorkbookWriter, WorksheetPatcher
 from .embeddedpackage import EmbeddedXlsxPart
 from ..opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
 from ..opc.package import XmlPart
@@ -24,12 +27,18 @@ class ChartPart(XmlPart):
     def new(cls, chart_type, chart_data, package):
         """
         Return a new |ChartPart| instance added to *package* containing
-        a chart of *chart_type* and depicting *chart_data*.
+        a chart of *chart_type* and depicting *chart_data*. *chart_type* may
+        also be a |ChartTemplate| object, in which case the chart is produced
+        from the template rather than generated.
         """
-        chart_blob = chart_data.xml_bytes(chart_type)
         partname = package.next_partname(cls.partname_template)
         content_type = CT.DML_CHART
-        chart_part = cls.load(partname, content_type, chart_blob, package)
+        if isinstance(chart_type, ChartTemplate):
+            chartSpace = chart_type.new_chartSpace(chart_data)
+            chart_part = cls(partname, content_type, chartSpace, package)
+        else:
+            chart_blob = chart_data.xml_bytes(chart_type)
+            chart_part = cls.load(partname, content_type, chart_blob, package)
         xlsx_blob = chart_data.xlsx_blob
         chart_part.chart_workbook.update_from_xlsx_blob(xlsx_blob)
         return chart_part
@@ -49,6 +58,14 @@ class ChartPart(XmlPart):
         """
         return ChartWorkbook(self._element, self)
 
+    @lazyproperty
+    def series_index(self):
+        """
+        The |SeriesIndex| object caching the ``<c:ser>`` elements of the
+        chart in this part, sorted by idx.
+        """
+        return SeriesIndex(self._element)
+
 
 class ChartWorkbook(object):
     """
@@ -59,6 +76,48 @@ class ChartWorkbook(object):
         super(ChartWorkbook, self).__init__()
         self._chartSpace = chartSpace
         self._chart_part = chart_part
+        self._patchable_blob = None
+
+    def can_update_cells(self, ser_count):
+        """
+        |True| if the cells of the worksheet of the related |EmbeddedXlsxPart|
+        can be changed individually using :meth:`update_cells`. |False| when
+        there is no embedded workbook, when it has no worksheet, or when the
+        worksheet has the 'Source Index' column written for decimated chart
+        data, following the category column and *ser_count* series columns.
+        A workbook found suitable, or produced by :meth:`update_cells`, is
+        not read again, so a chart updated repeatedly has its workbook
+        unzipped and parsed only to patch it.
+        """
+        xlsx_part = self.xlsx_part
+        if xlsx_part is None:
+            return False
+        xlsx_blob = xlsx_part.blob
+        if xlsx_blob is self._patchable_blob:
+            return True
+        try:
+            header = WorksheetPatcher.cell_text(xlsx_blob, 0, ser_count + 1)
+        except KeyError:
+            return False
+        if header == WorkbookWriter.source_idx_header:
+            return False
+        self._patchable_blob = xlsx_blob
+        return True
+
+    def update_cells(self, cells, number_formats=None):
+        """
+        Change the worksheet cells identified in *cells*, a sequence of
+        ``(row_idx, col_idx, value)`` triples, in the Excel spreadsheet of
+        the related |EmbeddedXlsxPart|. All other cells are left undisturbed.
+        A *value* of |None| clears the cell. *number_formats* optionally maps
+        a column index to the number format of the numbers written in that
+        column.
+        """
+        xlsx_part = self.xlsx_part
+        xlsx_part.blob = WorksheetPatcher.patched_xlsx_blob(
+            xlsx_part.blob, cells, number_formats
+        )
+        self._patchable_blob = xlsx_part.blob
 
     def update_from_xlsx_blob(self, xlsx_blob):
         """
@@ -6,9 +6,10 @@ Presentation part, the main part in a .pptx package.
 
 from __future__ import absolute_import
 
+from copy import deepcopy
 from warnings import warn
 
-from ..opc.constants import RELATIONSHIP_TYPE as RT
+from ..opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
 from ..opc.package import XmlPart
 from ..opc.packuri import PackURI
 from .slide import Slide
@@ -129,6 +130,32 @@ class _Slides(object):
         self._sldIdLst.add_sldId(rId)
         return slide
 
+    def add_slides(self, slidelayout, count):
+        """
+        Return a list of *count* newly added slides that inherit layout from
+        *slidelayout*, each as :meth:`add_slide` would produce it. The
+        placeholders of the layout are cloned once, onto the first new
+        slide, and its shape tree is copied to the others. Partnames,
+        relationship ids, and slide ids are assigned from counters, so the
+        cost of adding a slide does not grow with the number of slides in
+        the presentation.
+        """
+        package = self._prs.package
+        first_partnum = len(self) + 1
+        slides, sld = [], None
+        for partnum in range(first_partnum, first_partnum + count):
+            partname = PackURI('/ppt/slides/slide%d.xml' % partnum)
+            if sld is None:
+                slide = Slide.new(slidelayout, partname, package)
+                sld = slide._element
+            else:
+                slide = Slide(partname, CT.PML_SLIDE, deepcopy(sld), package)
+                slide.relate_to(slidelayout, RT.SLIDE_LAYOUT)
+            slides.append(slide)
+        rIds = self._prs.rels.add_relationships(RT.SLIDE, slides)
+        self._sldIdLst.add_sldIds(rIds)
+        return slides
+
     def index(self, item):
         """
         Map *item* to an integer representing its zero-based position in this
@@ -11,17 +11,23 @@ from warnings import warn
 from .chart import ChartPart
 from ..opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
 from ..opc.package import XmlPart
+from ..oxml.ns import qn
 from ..oxml.parts.slide import CT_Slide
 from ..shapes.shapetree import SlideShapeFactory, SlideShapeTree
 from ..shared import ParentedElementProxy
 from ..util import lazyproperty
 
 
+_extLst_tag = qn('p:extLst')
+
+
 class BaseSlide(XmlPart):
     """
     Base class for slide parts, e.g. slide, slideLayout, slideMaster,
     notesSlide, notesMaster, and handoutMaster.
     """
+    _shape_tree_revision = 0
+
     def get_image(self, rId):
         """
         Return an |Image| object containing the image related to this slide
@@ -49,6 +55,78 @@ class BaseSlide(XmlPart):
         """
         return self._element.cSld.name
 
+    @lazyproperty
+    def placeholder_index(self):
+        """
+        |_PlaceholderIndex| object providing constant-time lookup of the
+        placeholder shape elements in this slide by idx and by type.
+        """
+        return _PlaceholderIndex(self)
+
+    @lazyproperty
+    def shape_id_allocator(self):
+        """
+        |_ShapeIdAllocator| object providing the next available shape id and
+        unused shape names in this slide without scanning its XML.
+        """
+        return _ShapeIdAllocator(self)
+
+    def shape_tree_changed(self):
+        """
+        Notify this slide of a change to its shape tree that is not seen by
+        :attr:`shape_tree_state`, such as a shape removed, replaced, or moved
+        other than at the end of the shape tree, or a change to the idx or
+        type of a placeholder in place. Call it after changing the shape
+        tree XML directly in such a way.
+        """
+        self._shape_tree_revision += 1
+
+    @property
+    def shape_tree_state(self):
+        """
+        A value that differs from an earlier one when the shape tree of this
+        slide has been replaced, its last two shapes have changed, as when
+        a shape is added, or :meth:`shape_tree_changed` has been called. It
+        is read in constant time, without walking the shape tree, so the
+        objects that cache what they know of the shape tree can check it on
+        each use.
+        """
+        spTree = self.spTree
+        last = next(spTree.iterchildren(reversed=True), None)
+        if last is not None and last.tag == _extLst_tag:
+            last = last.getprevious()
+        before_last = None if last is None else last.getprevious()
+        return (spTree, self._shape_tree_revision, last, before_last)
+
+    def shapes_added_since(self, state):
+        """
+        Return a ``(state, added)`` pair, where *state* is the current
+        :attr:`shape_tree_state` and *added* is the list of the children
+        added at the end of the shape tree since the earlier *state*, in
+        document order, empty if the shape tree has not changed. *added* is
+        |None| when the shape tree has changed in another way, or *state* is
+        |None|, so it must be read afresh. Only the added children are
+        visited.
+        """
+        new_state = self.shape_tree_state
+        if state is None:
+            return new_state, None
+        if new_state == state:
+            return new_state, []
+        spTree, revision, last = new_state[:3]
+        old_last, old_before_last = state[2:]
+        if (spTree is not state[0] or revision != state[1] or
+                old_last is None or old_last.getparent() is not spTree or
+                old_last.getprevious() is not old_before_last):
+            return new_state, None
+        added, e = [], old_last
+        while e is not last:
+            e = e.getnext()
+            if e is None or e.tag == _extLst_tag:
+                return new_state, None
+            added.append(e)
+        return new_state, added
+
     @property
     def spTree(self):
         """
@@ -135,17 +213,19 @@ class _SlidePlaceholders(ParentedElementProxy):
         |KeyError| if no placeholder with that idx value is in the
         collection.
         """
-        for e in self._element.iter_ph_elms():
-            if e.ph_idx == idx:
-                return SlideShapeFactory(e, self)
-        raise KeyError('no placeholder on this slide with idx == %d' % idx)
+        e = self._parent.placeholder_index.by_idx(idx)
+        if e is None:
+            raise KeyError(
+                'no placeholder on this slide with idx == %d' % idx
+            )
+        return SlideShapeFactory(e, self)
 
     def __iter__(self):
         """
         Generate placeholder shapes in `idx` order.
         """
         ph_elms = sorted(
-            [e for e in self._element.iter_ph_elms()], key=lambda e: e.ph_idx
+            self._parent.placeholder_index.ph_elms, key=lambda e: e.ph_idx
         )
         return (SlideShapeFactory(e, self) for e in ph_elms)
 
@@ -153,4 +233,181 @@ class _SlidePlaceholders(ParentedElementProxy):
         """
         Return count of placeholder shapes.
         """
-        return len(list(self._element.iter_ph_elms()))
+        return len(self._parent.placeholder_index.ph_elms)
+
+
+class _PlaceholderIndex(object):
+    """
+    Index of the placeholder shape elements in the shape tree of *slide*,
+    a slide, slide layout, or slide master part, by idx and by type, the
+    first in document order taking precedence for each key. The index is
+    checked against the :attr:`shape_tree_state` of *slide* on each use;
+    children added at the end of the shape tree are indexed as they are
+    found and any other change the state shows causes the index to be
+    rebuilt. A lookup is otherwise a dictionary access, so a placeholder not
+    in the index is reported absent without reading the shape tree again.
+    An element found that is no longer in the shape tree, or no longer has
+    the key it is found under, also causes the index to be rebuilt. Other
+    changes made to the XML directly, such as giving a placeholder a new idx
+    or type, are seen after ``shape_tree_changed()`` is called on *slide*.
+    """
+    def __init__(self, slide):
+        super(_PlaceholderIndex, self).__init__()
+        self._slide = slide
+        self._state = None
+        self._ph_elms = []
+        self._by_idx = {}
+        self._by_type = {}
+
+    def by_idx(self, idx):
+        """
+        Return the first placeholder element having *idx*, or |None| if there
+        is none.
+        """
+        spTree = self._refresh()
+        e = self._by_idx.get(idx)
+        if e is not None and (e.getparent() is not spTree or
+                              e.ph_idx != idx):
+            self._rebuild(spTree)
+            e = self._by_idx.get(idx)
+        return e
+
+    def by_type(self, ph_type):
+        """
+        Return the first placeholder element of *ph_type*, e.g.
+        ``PP_PLACEHOLDER.BODY``, or |None| if there is none.
+        """
+        spTree = self._refresh()
+        e = self._by_type.get(ph_type)
+        if e is not None and (e.getparent() is not spTree or
+                              e.ph_type != ph_type):
+            self._rebuild(spTree)
+            e = self._by_type.get(ph_type)
+        return e
+
+    @property
+    def ph_elms(self):
+        """
+        List of the placeholder elements in the shape tree, in document
+        order.
+        """
+        self._refresh()
+        return self._ph_elms
+
+    def _add(self, elms):
+        """
+        Index the placeholder elements among *elms*, which follow those
+        already indexed in document order.
+        """
+        by_idx, by_type = self._by_idx, self._by_type
+        for e in elms:
+            self._ph_elms.append(e)
+            by_idx.setdefault(e.ph_idx, e)
+            by_type.setdefault(e.ph_type, e)
+
+    def _refresh(self):
+        """
+        Bring the index up to date with the shape tree of the slide and
+        return the shape tree element.
+        """
+        self._state, added = self._slide.shapes_added_since(self._state)
+        spTree = self._state[0]
+        if added is None:
+            self._rebuild(spTree)
+        elif added:
+            self._add(spTree.iter_ph_elms(added))
+        return spTree
+
+    def _rebuild(self, spTree):
+        """
+        Index the placeholder elements of *spTree* afresh.
+        """
+        self._ph_elms, self._by_idx, self._by_type = [], {}, {}
+        self._add(spTree.iter_ph_elms())
+
+
+class _ShapeIdAllocator(object):
+    """
+    Keeps the set of drawing object ids and the set of shape names in use in
+    *slide*, a slide, slide layout, or slide master part, so the next
+    available id and an unused name are found without scanning the slide
+    XML. The sets are built with a single scan of the slide on first use.
+    Afterward, only the subtrees of children added at the end of the shape
+    tree since the last use are scanned, as found from the
+    :attr:`shape_tree_state` of *slide*. When the state shows any other
+    change, such as the removal of the last shape, the sets are built
+    afresh, so the ids of removed shapes are available again. The ids of
+    a shape removed from the middle of the shape tree directly become
+    available again after ``shape_tree_changed()`` is called on *slide*;
+    until then they are merely not reused.
+    """
+    def __init__(self, slide):
+        super(_ShapeIdAllocator, self).__init__()
+        self._slide = slide
+        self._state = None
+        self._ids = set()
+        self._names = set()
+        self._min_free_id = 1
+
+    @property
+    def next_id(self):
+        """
+        Next available positive integer drawing object id in the slide,
+        starting from 1 and making use of any gaps in numbering.
+        """
+        self._refresh()
+        ids, n = self._ids, self._min_free_id
+        while n in ids:
+            n += 1
+        self._min_free_id = n
+        return n
+
+    def unique_name(self, basename, numpart):
+        """
+        Return the shape name formed from *basename* and *numpart*, e.g.
+        'Title 1', incrementing *numpart* as necessary to make the name
+        unique within the slide.
+        """
+        self._refresh()
+        names = self._names
+        while True:
+            name = '%s %d' % (basename, numpart)
+            if name not in names:
+                return name
+            numpart += 1
+
+    def _add(self, elm):
+        """
+        Add the ids and shape names used in the subtree of *elm*.
+        """
+        ids = self._ids
+        for e in elm.iter():
+            id_str = e.get('id')
+            if id_str is not None and id_str.isdigit():
+                ids.add(int(id_str))
+        self._names.update(
+            cNvPr.get('name') for cNvPr in elm.iter(qn('p:cNvPr'))
+        )
+
+    def _rebuild(self, spTree):
+        """
+        Collect the ids and names in use in the slide containing *spTree*
+        afresh.
+        """
+        self._ids = set(
+            int(id_str) for id_str in spTree.xpath('//@id')
+            if id_str.isdigit()
+        )
+        self._names = set(spTree.xpath('//p:cNvPr/@name'))
+        self._min_free_id = 1
+
+    def _refresh(self):
+        """
+        Bring the id and name sets up to date with the shape tree.
+        """
+        self._state, added = self._slide.shapes_added_since(self._state)
+        if added is None:
+            self._rebuild(self._slide.spTree)
+            return
+        for child in added:
+            self._add(child)
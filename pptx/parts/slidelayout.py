@@ -11,7 +11,7 @@ from warnings import warn
 from ..enum.shapes import PP_PLACEHOLDER
 from ..opc.constants import RELATIONSHIP_TYPE as RT
 from ..oxml.ns import qn
-from ..shapes.placeholder import LayoutPlaceholder
+from ..shapes.placeholder import LayoutPlaceholder, PlaceholderInheritance
 from ..shapes.shapetree import (
     BasePlaceholders, BaseShapeFactory, BaseShapeTree
 )
@@ -38,6 +38,14 @@ class SlideLayout(BaseSlide):
             if ph.ph_type not in latent_ph_types:
                 yield ph
 
+    @lazyproperty
+    def placeholder_inheritance(self):
+        """
+        |PlaceholderInheritance| object that resolves the position and size
+        placeholders inherit through this slide layout.
+        """
+        return PlaceholderInheritance(self)
+
     @lazyproperty
     def placeholders(self):
         """
@@ -110,10 +118,10 @@ class _LayoutPlaceholders(BasePlaceholders):
         Return the first placeholder shape with matching *idx* value, or
         *default* if not found.
         """
-        for placeholder in self:
-            if placeholder.idx == idx:
-                return placeholder
-        return default
+        ph_elm = self._slide.placeholder_index.by_idx(idx)
+        if ph_elm is None:
+            return default
+        return self._shape_factory(ph_elm)
 
     def _shape_factory(self, shape_elm):
         """
@@ -154,10 +154,10 @@ class _MasterPlaceholders(BasePlaceholders):
         or *default* if no such placeholder shape is present in the
         collection.
         """
-        for placeholder in self:
-            if placeholder.ph_type == ph_type:
-                return placeholder
-        return default
+        ph_elm = self._slide.placeholder_index.by_type(ph_type)
+        if ph_elm is None:
+            return default
+        return self._shape_factory(ph_elm)
 
     def _shape_factory(self, shape_elm):
         """
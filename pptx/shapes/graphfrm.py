@@ -17,6 +17,10 @@ class GraphicFrame(BaseShape):
     Container shape for table, chart, smart art, and media objects.
     Corresponds to a ``<p:graphicFrame>`` element in the shape tree.
     """
+    def __init__(self, shape_elm, parent):
+        super(GraphicFrame, self).__init__(shape_elm, parent)
+        self._table = None
+
     @property
     def chart(self):
         """
@@ -71,9 +75,15 @@ class GraphicFrame(BaseShape):
     def table(self):
         """
         The |Table| object contained in this graphic frame. Raises
-        |ValueError| if this graphic frame does not contain a table.
+        |ValueError| if this graphic frame does not contain a table. The
+        same |Table| object is returned on each access while the table
+        element is unchanged, so what it knows of the frame size is kept
+        from one row or column resize to the next.
         """
         if not self.has_table:
             raise ValueError('shape does not contain a table')
         tbl = self._element.graphic.graphicData.tbl
-        return Table(tbl, self)
+        table = self._table
+        if table is None or table._tbl is not tbl:
+            table = self._table = Table(tbl, self)
+        return table
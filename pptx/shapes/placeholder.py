@@ -15,7 +15,7 @@ from .graphfrm import GraphicFrame
 from ..oxml.shapes.graphfrm import CT_GraphicalObjectFrame
 from ..oxml.shapes.picture import CT_Picture
 from .picture import Picture
-from ..util import Emu
+from ..util import Emu, lazyproperty
 
 
 class _InheritsDimensions(object):
@@ -102,13 +102,11 @@ class _InheritsDimensions(object):
     def _inherited_value(self, attr_name):
         """
         The attribute value, e.g. 'width' of the layout placeholder this
-        slide placeholder inherits from
+        slide placeholder inherits from, which in turn may inherit it from
+        its master placeholder.
         """
-        layout_placeholder = self._layout_placeholder
-        if layout_placeholder is None:
-            return None
-        inherited_value = getattr(layout_placeholder, attr_name)
-        return inherited_value
+        inheritance = self._slide_layout.placeholder_inheritance
+        return inheritance.layout_value(self._element.ph_idx, attr_name)
 
     @property
     def _layout_placeholder(self):
@@ -161,6 +159,7 @@ class _BaseSlidePlaceholder(_InheritsDimensions, BaseShape):
         self._element.addprevious(element)
         self._element.getparent().remove(self._element)
         self._element = None
+        self.part.shape_tree_changed()
 
 
 class BasePlaceholder(Shape):
@@ -265,33 +264,15 @@ class LayoutPlaceholder(BasePlaceholder):
         The attribute value, e.g. 'width' of the parent master placeholder of
         this placeholder shape
         """
-        master_placeholder = self._master_placeholder
-        if master_placeholder is None:
-            return None
-        inherited_value = getattr(master_placeholder, attr_name)
-        return inherited_value
+        inheritance = self.part.placeholder_inheritance
+        return inheritance.master_value(self._element.ph_idx, attr_name)
 
     @property
     def _master_placeholder(self):
         """
         The master placeholder shape this layout placeholder inherits from.
         """
-        inheritee_ph_type = {
-            PP_PLACEHOLDER.BODY:         PP_PLACEHOLDER.BODY,
-            PP_PLACEHOLDER.CHART:        PP_PLACEHOLDER.BODY,
-            PP_PLACEHOLDER.BITMAP:       PP_PLACEHOLDER.BODY,
-            PP_PLACEHOLDER.CENTER_TITLE: PP_PLACEHOLDER.TITLE,
-            PP_PLACEHOLDER.ORG_CHART:    PP_PLACEHOLDER.BODY,
-            PP_PLACEHOLDER.DATE:         PP_PLACEHOLDER.DATE,
-            PP_PLACEHOLDER.FOOTER:       PP_PLACEHOLDER.FOOTER,
-            PP_PLACEHOLDER.MEDIA_CLIP:   PP_PLACEHOLDER.BODY,
-            PP_PLACEHOLDER.OBJECT:       PP_PLACEHOLDER.BODY,
-            PP_PLACEHOLDER.PICTURE:      PP_PLACEHOLDER.BODY,
-            PP_PLACEHOLDER.SLIDE_NUMBER: PP_PLACEHOLDER.SLIDE_NUMBER,
-            PP_PLACEHOLDER.SUBTITLE:     PP_PLACEHOLDER.BODY,
-            PP_PLACEHOLDER.TABLE:        PP_PLACEHOLDER.BODY,
-            PP_PLACEHOLDER.TITLE:        PP_PLACEHOLDER.TITLE,
-        }[self.ph_type]
+        inheritee_ph_type = _inheritee_ph_types[self.ph_type]
         slide_master = self._slide_master
         master_placeholder = slide_master.placeholders.get(
             inheritee_ph_type, None
@@ -308,6 +289,126 @@ class LayoutPlaceholder(BasePlaceholder):
         return slide_master
 
 
+class PlaceholderInheritance(object):
+    """
+    Resolves the position and size a placeholder inherits through
+    *slide_layout*: a slide placeholder from the layout placeholder having
+    the same idx, and that layout placeholder from the master placeholder of
+    the type it inherits from. The placeholder elements for each idx are
+    found once and remembered, so a lookup reads the values directly from
+    those elements rather than walking from slide to layout to master again.
+    The master placeholder is only looked for once a value is wanted from
+    it, as when the layout placeholder has no value of its own. What is
+    remembered for an idx is discarded and found afresh when the
+    ``shape_tree_state`` of the layout, or of the master once looked to,
+    changes, when a remembered element leaves its shape tree, or when the
+    idx or type of one changes.
+    """
+    _xfrm_attr_names = {
+        'left': 'x', 'top': 'y', 'width': 'cx', 'height': 'cy'
+    }
+
+    def __init__(self, slide_layout):
+        super(PlaceholderInheritance, self).__init__()
+        self._slide_layout = slide_layout
+        self._chains = {}
+
+    def layout_value(self, idx, attr_name):
+        """
+        The value of *attr_name*, e.g. 'width', of the layout placeholder
+        having *idx*; its directly-applied value if it has one, otherwise
+        the value on the master placeholder it inherits from. |None| if
+        neither has a value or there is no such layout placeholder.
+        """
+        layout_ph_elm = self._ph_elms(idx, with_master=False)[0]
+        if layout_ph_elm is None:
+            return None
+        value = getattr(layout_ph_elm, self._xfrm_attr_names[attr_name])
+        if value is not None:
+            return value
+        return self.master_value(idx, attr_name)
+
+    def master_value(self, idx, attr_name):
+        """
+        The value of *attr_name*, e.g. 'width', of the master placeholder
+        that the layout placeholder having *idx* inherits from, or |None| if
+        there is no such placeholder or it has no value.
+        """
+        master_ph_elm = self._ph_elms(idx)[1]
+        if master_ph_elm is None:
+            return None
+        return getattr(master_ph_elm, self._xfrm_attr_names[attr_name])
+
+    def _ph_elms(self, idx, with_master=True):
+        """
+        Return a (layout_ph_elm, master_ph_elm) pair for the layout
+        placeholder having *idx*, either of which may be |None|, from those
+        remembered if they are still current. The master placeholder is
+        looked for only when *with_master* is True, otherwise
+        *master_ph_elm* may be |None| for not having been looked for.
+        """
+        chain = self._chains.get(idx)
+        if (chain is None or (with_master and not chain[2]) or
+                chain[1] != self._state(chain[2], *chain[0])):
+            ph_elms = self._find_ph_elms(idx, with_master)
+            chain = self._chains[idx] = (
+                ph_elms, self._state(with_master, *ph_elms), with_master
+            )
+        return chain[0][:2]
+
+    def _find_ph_elms(self, idx, with_master):
+        """
+        Return a (layout_ph_elm, master_ph_elm, layout_ph, master_ph) tuple
+        for the layout placeholder having *idx*, where the last two are the
+        ``<p:ph>`` elements of the first two. Any item may be |None|, the
+        master items when *with_master* is False or the layout placeholder
+        is of a type that does not inherit from the master.
+        """
+        layout_ph_elm = self._slide_layout.placeholder_index.by_idx(idx)
+        if layout_ph_elm is None:
+            return (None, None, None, None)
+        layout_ph = layout_ph_elm.ph
+        inheritee_ph_type = _inheritee_ph_types.get(layout_ph.type)
+        if not with_master or inheritee_ph_type is None:
+            return (layout_ph_elm, None, layout_ph, None)
+        master_ph_elm = self._slide_master.placeholder_index.by_type(
+            inheritee_ph_type
+        )
+        master_ph = None if master_ph_elm is None else master_ph_elm.ph
+        return (layout_ph_elm, master_ph_elm, layout_ph, master_ph)
+
+    @lazyproperty
+    def _slide_master(self):
+        return self._slide_layout.slide_master
+
+    def _state(self, with_master, layout_ph_elm, master_ph_elm, layout_ph,
+               master_ph):
+        """
+        Return a tuple that differs from a previous one for the same
+        elements when a change to the layout XML, or the master XML when
+        *with_master* is True, may have changed which placeholder elements
+        are found. It is read in constant time.
+        """
+        layout_state = self._slide_layout.shape_tree_state
+        state = (
+            layout_state,
+            None if layout_ph_elm is None else (
+                layout_ph_elm.getparent() is layout_state[0],
+                layout_ph.get('idx'), layout_ph.get('type'),
+            ),
+        )
+        if not with_master:
+            return state
+        master_state = self._slide_master.shape_tree_state
+        return state + (
+            master_state,
+            None if master_ph_elm is None else (
+                master_ph_elm.getparent() is master_state[0],
+                master_ph.get('type'),
+            ),
+        )
+
+
 class MasterPlaceholder(BasePlaceholder):
     """
     Placeholder shape on a slide master.
@@ -330,7 +431,8 @@ class ChartPlaceholder(_BaseSlidePlaceholder):
         Return a |PlaceholderGraphicFrame| object containing a new chart of
         *chart_type* depicting *chart_data* and having the same position and
         size as this placeholder. *chart_type* is one of the
-        :ref:`XlChartType` enumeration values. *chart_data* is a |ChartData|
+        :ref:`XlChartType` enumeration values, or a |ChartTemplate| object
+        from which the new chart is produced. *chart_data* is a |ChartData|
         object populated with the categories and series values for the chart.
         Note that the new |Chart| object is not returned directly. The chart
         object may be accessed using the
@@ -448,3 +550,21 @@ class TablePlaceholder(_BaseSlidePlaceholder):
         return CT_GraphicalObjectFrame.new_table_graphicFrame(
             id_, name, rows, cols, self.left, self.top, self.width, height
         )
+
+
+_inheritee_ph_types = {
+    PP_PLACEHOLDER.BODY:         PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.CHART:        PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.BITMAP:       PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.CENTER_TITLE: PP_PLACEHOLDER.TITLE,
+    PP_PLACEHOLDER.ORG_CHART:    PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.DATE:         PP_PLACEHOLDER.DATE,
+    PP_PLACEHOLDER.FOOTER:       PP_PLACEHOLDER.FOOTER,
+    PP_PLACEHOLDER.MEDIA_CLIP:   PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.OBJECT:       PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.PICTURE:      PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.SLIDE_NUMBER: PP_PLACEHOLDER.SLIDE_NUMBER,
+    PP_PLACEHOLDER.SUBTITLE:     PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.TABLE:        PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.TITLE:        PP_PLACEHOLDER.TITLE,
+}
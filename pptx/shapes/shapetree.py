@@ -13,34 +13,49 @@ from ..enum.shapes import PP_PLACEHOLDER
 from .factory import BaseShapeFactory, SlideShapeFactory
 from ..oxml.shapes.graphfrm import CT_GraphicalObjectFrame
 from ..oxml.simpletypes import ST_Direction
+from .spatial import iter_shape_bounds, SpatialIndex
 
 
 class BaseShapeTree(object):
     """
     Base class for a shape collection appearing in a slide-type object,
     include Slide, SlideLayout, and SlideMaster, providing common methods.
+
+    The member elements of the collection are listed once and the list is
+    kept up to date using the :attr:`shape_tree_state` of the slide, read in
+    constant time, so indexed access and |len| do not filter the shape tree
+    each time. Shapes added at the end of the shape tree are appended to the
+    list; any other change the state shows causes it to be listed afresh.
+    A change to the XML it does not show, such as removing a shape from the
+    middle of the shape tree directly, is signalled by calling
+    ``shape_tree_changed()`` on the slide. The shape object constructed for
+    each member element is remembered too, so accessing the same shape again
+    returns the same object.
     """
     def __init__(self, slide):
         super(BaseShapeTree, self).__init__()
         self._slide = slide
+        self._state = None
+        self._members = None
+        self._shapes = {}
 
     def __getitem__(self, idx):
         """
         Return shape at *idx* in sequence, e.g. ``shapes[2]``.
         """
-        shape_elms = list(self._iter_member_elms())
+        shape_elms = self._member_elms()
         try:
             shape_elm = shape_elms[idx]
         except IndexError:
             raise IndexError('shape index out of range')
-        return self._shape_factory(shape_elm)
+        return self._shape(shape_elm)
 
     def __iter__(self):
         """
         Generate a reference to each shape in the collection, in sequence.
         """
         for shape_elm in self._iter_member_elms():
-            yield self._shape_factory(shape_elm)
+            yield self._shape(shape_elm)
 
     def __len__(self):
         """
@@ -48,8 +63,18 @@ class BaseShapeTree(object):
         1 to the total, without regard to the number of shapes contained in
         the group.
         """
-        shape_elms = list(self._iter_member_elms())
-        return len(shape_elms)
+        return len(self._member_elms())
+
+    def iter_shape_bounds(self):
+        """
+        Generate a |ShapeBounds| object for each shape in this collection,
+        giving the shape and its position and size in slide coordinates.
+        A group shape is replaced by the shapes it contains, to any depth,
+        their position and size transformed by each enclosing group. Shapes
+        are generated in document order; a shape whose position or size is
+        not known is skipped.
+        """
+        return iter_shape_bounds(self._iter_member_elms(), self._shape)
 
     @property
     def part(self):
@@ -59,6 +84,17 @@ class BaseShapeTree(object):
         """
         return self._slide
 
+    def spatial_index(self, cell_size=None):
+        """
+        Return a |SpatialIndex| object for hit-testing and finding
+        overlapping shapes among the shapes in this collection, including
+        those nested in group shapes. The index is built from the shapes as
+        they are when this method is called; call it again after shapes are
+        added or moved. *cell_size* is the side, in EMU, of the cells of the
+        grid the index uses, by default the average size of the shapes.
+        """
+        return SpatialIndex(self.iter_shape_bounds(), cell_size)
+
     @staticmethod
     def _is_member_elm(shape_elm):
         """
@@ -67,16 +103,57 @@ class BaseShapeTree(object):
         """
         return True
 
-    def _iter_member_elms(self):
+    def _iter_member_elms(self, children=None):
         """
         Generate each child of the ``<p:spTree>`` element that corresponds to
-        a shape, in the sequence they appear in the XML.
+        a shape, in the sequence they appear in the XML, from among
+        *children* if a sequence of child elements is given.
         """
         spTree = self._slide.spTree
-        for shape_elm in spTree.iter_shape_elms():
+        for shape_elm in spTree.iter_shape_elms(children):
             if self._is_member_elm(shape_elm):
                 yield shape_elm
 
+    def _member_elms(self):
+        """
+        Return the list of member elements of the shape tree, extended with
+        the members among children added at the end of the shape tree since
+        the last use and listed afresh after any other change.
+        """
+        self._state, added = self._slide.shapes_added_since(self._state)
+        if added is None:
+            shape_elms = list(self._iter_member_elms())
+            positions = dict((e, i) for i, e in enumerate(shape_elms))
+            self._members = (shape_elms, positions)
+            self._shapes = dict(
+                (e, shape) for e, shape in self._shapes.items()
+                if e in positions
+            )
+        elif added:
+            shape_elms, positions = self._members
+            for e in self._iter_member_elms(added):
+                positions[e] = len(shape_elms)
+                shape_elms.append(e)
+        return self._members[0]
+
+    def _member_idx(self, shape_elm):
+        """
+        Return the position of *shape_elm* among the member elements of this
+        shape tree, or |None| if it is not a member.
+        """
+        self._member_elms()
+        return self._members[1].get(shape_elm)
+
+    def _shape(self, shape_elm):
+        """
+        Return the shape object for *shape_elm*, the one constructed on an
+        earlier access when there was one.
+        """
+        shape = self._shapes.get(shape_elm)
+        if shape is None or shape.element is not shape_elm:
+            shape = self._shapes[shape_elm] = self._shape_factory(shape_elm)
+        return shape
+
     @property
     def _next_shape_id(self):
         """
@@ -85,11 +162,7 @@ class BaseShapeTree(object):
         the minimum id is 2 because the spTree element is always assigned
         id="1".
         """
-        id_str_lst = self._spTree.xpath('//@id')
-        used_ids = [int(id_str) for id_str in id_str_lst if id_str.isdigit()]
-        for n in range(1, len(used_ids)+2):
-            if n not in used_ids:
-                return n
+        return self._slide.shape_id_allocator.next_id
 
     def _shape_factory(self, shape_elm):
         """
@@ -129,7 +202,8 @@ class SlideShapeTree(BaseShapeTree):
         """
         Add a new chart of *chart_type* to the slide, positioned at (*x*,
         *y*), having size (*cx*, *cy*), and depicting *chart_data*.
-        *chart_type* is one of the :ref:`XlChartType` enumeration values.
+        *chart_type* is one of the :ref:`XlChartType` enumeration values, or
+        a |ChartTemplate| object from which the new chart is produced.
         *chart_data* is a |ChartData| object populated with the categories
         and series values for the chart. Note that a |GraphicFrame| shape
         object is returned, not the |Chart| object contained in that graphic
@@ -165,17 +239,20 @@ class SlideShapeTree(BaseShapeTree):
         shape = self._shape_factory(sp)
         return shape
 
-    def add_table(self, rows, cols, left, top, width, height):
+    def add_table(self, rows, cols, left, top, width, height, texts=None):
         """
         Add a |GraphicFrame| object containing a table with the specified
         number of *rows* and *cols* and the specified position and size.
         *width* is evenly distributed between the columns of the new table.
-        Likewise, *height* is evenly distributed between the rows. Note that
-        the ``.table`` property on the returned |GraphicFrame| shape must be
+        Likewise, *height* is evenly distributed between the rows. When
+        *texts* is given, it is a sequence of rows, each a sequence of cell
+        text strings, written into the cells as the table is generated, as
+        a faster alternative to populating it afterward. Note that the
+        ``.table`` property on the returned |GraphicFrame| shape must be
         used to access the enclosed |Table| object.
         """
         graphicFrame = self._add_graphicFrame_containing_table(
-            rows, cols, left, top, width, height
+            rows, cols, left, top, width, height, texts
         )
         graphic_frame = self._shape_factory(graphicFrame)
         return graphic_frame
@@ -202,11 +279,10 @@ class SlideShapeTree(BaseShapeTree):
         Return the index of *shape* in this sequence, raising |ValueError| if
         *shape* is not in the collection.
         """
-        shape_elm = shape.element
-        for idx, elm in enumerate(self._spTree.iter_shape_elms()):
-            if elm is shape_elm:
-                return idx
-        raise ValueError('shape not in collection')
+        idx = self._member_idx(shape.element)
+        if idx is None:
+            raise ValueError('shape not in collection')
+        return idx
 
     @property
     def placeholders(self):
@@ -222,10 +298,10 @@ class SlideShapeTree(BaseShapeTree):
         The title placeholder shape on the slide or |None| if the slide has
         no title placeholder.
         """
-        for elm in self._spTree.iter_ph_elms():
-            if elm.ph_idx == 0:
-                return self._shape_factory(elm)
-        return None
+        elm = self._slide.placeholder_index.by_idx(0)
+        if elm is None:
+            return None
+        return self._shape_factory(elm)
 
     def _add_chart_graphicFrame(self, rId, x, y, cx, cy):
         """
@@ -250,15 +326,17 @@ class SlideShapeTree(BaseShapeTree):
         graphic_frame = self._shape_factory(graphicFrame)
         return graphic_frame
 
-    def _add_graphicFrame_containing_table(self, rows, cols, x, y, cx, cy):
+    def _add_graphicFrame_containing_table(self, rows, cols, x, y, cx, cy,
+                                           texts=None):
         """
         Return a newly added ``<p:graphicFrame>`` element containing a table
-        as specified by the parameters.
+        as specified by the parameters, its cells pre-filled from *texts*
+        when it is not |None|.
         """
         id_ = self._next_shape_id
         name = 'Table %d' % (id_-1)
         graphicFrame = self._spTree.add_table(
-            id_, name, rows, cols, x, y, cx, cy
+            id_, name, rows, cols, x, y, cx, cy, texts
         )
         return graphicFrame
 
@@ -351,15 +429,7 @@ class SlideShapeTree(BaseShapeTree):
             basename = 'Vertical %s' % basename
 
         # increment numpart as necessary to make name unique
-        numpart = id - 1
-        names = self._spTree.xpath('//p:cNvPr/@name')
-        while True:
-            name = '%s %d' % (basename, numpart)
-            if name not in names:
-                break
-            numpart += 1
-
-        return name
+        return self._slide.shape_id_allocator.unique_name(basename, id - 1)
 
     def _shape_factory(self, shape_elm):
         """
@@ -0,0 +1,267 @@
+# encoding: utf-8
+
+"""
+ShapeBounds, SpatialIndex, and related objects, for locating the shapes on
+a slide by position, including shapes nested in group shapes.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from ..oxml.ns import qn
+from ..oxml.shapes.shared import BaseShapeElement
+from ..util import Emu
+
+
+class ShapeBounds(tuple):
+    """
+    Immutable value object holding a shape and the bounding box it occupies
+    on the slide, in slide coordinates. The rotation of a shape, or of
+    a group containing it, is not taken into account.
+    """
+    def __new__(cls, shape, left, top, width, height):
+        return tuple.__new__(cls, (shape, left, top, width, height))
+
+    @property
+    def bottom(self):
+        """
+        |Length| value of the distance from the top edge of the slide to the
+        bottom edge of the shape.
+        """
+        return Emu(self[2] + self[4])
+
+    def contains(self, x, y):
+        """
+        Return |True| if the point (*x*, *y*) lies within this bounding box,
+        including its top and left edges but not its bottom and right ones.
+        """
+        return self[1] <= x < self[1] + self[3] and (
+            self[2] <= y < self[2] + self[4]
+        )
+
+    @property
+    def height(self):
+        """
+        |Length| value of the height of the shape on the slide.
+        """
+        return self[4]
+
+    def intersects(self, left, top, width, height):
+        """
+        Return |True| if this bounding box and the rectangle at *left*, *top*
+        of *width* and *height* share some area. Boxes that only touch do
+        not intersect.
+        """
+        return (
+            self[1] < left + width and left < self[1] + self[3] and
+            self[2] < top + height and top < self[2] + self[4]
+        )
+
+    @property
+    def left(self):
+        """
+        |Length| value of the distance from the left edge of the slide to the
+        left edge of the shape.
+        """
+        return self[1]
+
+    @property
+    def right(self):
+        """
+        |Length| value of the distance from the left edge of the slide to the
+        right edge of the shape.
+        """
+        return Emu(self[1] + self[3])
+
+    @property
+    def shape(self):
+        """
+        The shape object, e.g. |Shape| or |Picture|, these are the bounds of.
+        """
+        return self[0]
+
+    @property
+    def top(self):
+        """
+        |Length| value of the distance from the top edge of the slide to the
+        top edge of the shape.
+        """
+        return self[2]
+
+    @property
+    def width(self):
+        """
+        |Length| value of the width of the shape on the slide.
+        """
+        return self[3]
+
+
+class SpatialIndex(object):
+    """
+    Grid index over the |ShapeBounds| objects in *bounds*, for finding the
+    shapes at a point, the shapes in a rectangle, and the shapes that overlap
+    one another, without comparing every shape with every other. Each shape
+    is entered in every square cell of the grid its bounding box reaches.
+    Cells are *cell_size* EMU on a side, by default the average of the
+    larger dimension of the shapes, so a typical shape reaches only a few
+    cells. The index holds the shapes as they were when it was built; it
+    does not change when shapes are later added, removed, or moved.
+    """
+    def __init__(self, bounds, cell_size=None):
+        super(SpatialIndex, self).__init__()
+        self._bounds = tuple(bounds)
+        if cell_size is None:
+            cell_size = self._default_cell_size(self._bounds)
+        self._cell_size = int(cell_size)
+        cells = self._cells = {}
+        for idx, b in enumerate(self._bounds):
+            for key in self._cell_keys(b.left, b.top, b.width, b.height):
+                cells.setdefault(key, []).append(idx)
+
+    def __len__(self):
+        """
+        Return the number of shapes in the index.
+        """
+        return len(self._bounds)
+
+    def overlapping_pairs(self):
+        """
+        Return a list of (a, b) pairs of |ShapeBounds| objects whose bounding
+        boxes overlap, each pair appearing once with *a* before *b* in
+        document order. Pairs are listed in document order of *a*, then of
+        *b*.
+        """
+        bounds, pairs = self._bounds, set()
+        for idxs in self._cells.values():
+            for i, a_idx in enumerate(idxs):
+                a = bounds[a_idx]
+                for b_idx in idxs[i+1:]:
+                    if (a_idx, b_idx) in pairs:
+                        continue
+                    b = bounds[b_idx]
+                    if a.intersects(b.left, b.top, b.width, b.height):
+                        pairs.add((a_idx, b_idx))
+        return [
+            (bounds[a_idx], bounds[b_idx]) for a_idx, b_idx in sorted(pairs)
+        ]
+
+    def shapes_at(self, x, y):
+        """
+        Return a list of the |ShapeBounds| objects whose bounding box
+        contains the point (*x*, *y*), front-most first.
+        """
+        cell_size, bounds = self._cell_size, self._bounds
+        idxs = self._cells.get((x // cell_size, y // cell_size), ())
+        return [
+            bounds[idx] for idx in reversed(idxs)
+            if bounds[idx].contains(x, y)
+        ]
+
+    def shapes_in(self, left, top, width, height):
+        """
+        Return a list of the |ShapeBounds| objects whose bounding box shares
+        some area with the rectangle at *left*, *top* of *width* and
+        *height*, in document order.
+        """
+        cells, idxs = self._cells, set()
+        for key in self._cell_keys(left, top, width, height):
+            idxs.update(cells.get(key, ()))
+        bounds = self._bounds
+        return [
+            bounds[idx] for idx in sorted(idxs)
+            if bounds[idx].intersects(left, top, width, height)
+        ]
+
+    def _cell_keys(self, left, top, width, height):
+        """
+        Generate the (column, row) key of each grid cell the rectangle at
+        *left*, *top* of *width* and *height* reaches.
+        """
+        cell_size = self._cell_size
+        first_col, first_row = left // cell_size, top // cell_size
+        last_col = (left + max(width, 1) - 1) // cell_size
+        last_row = (top + max(height, 1) - 1) // cell_size
+        for col in range(first_col, last_col + 1):
+            for row in range(first_row, last_row + 1):
+                yield (col, row)
+
+    @staticmethod
+    def _default_cell_size(bounds):
+        """
+        Return the average of the larger dimension of the shapes in
+        *bounds*, at least 1.
+        """
+        if not bounds:
+            return 1
+        total = sum(max(b.width, b.height) for b in bounds)
+        return max(total // len(bounds), 1)
+
+
+def iter_shape_bounds(shape_elms, shape_factory):
+    """
+    Generate a |ShapeBounds| object for each shape element in *shape_elms*,
+    in document order, descending into group shapes to any depth in place
+    of the group shape itself. *shape_factory* is called with a shape
+    element to get its shape object, whose position and size, transformed
+    by those of the groups containing it, give its slide coordinates.
+    A shape whose position or size is not known is skipped.
+    """
+    return _iter_shape_bounds(shape_elms, shape_factory, (1.0, 1.0, 0, 0))
+
+
+def _child_transform(grpSp, transform):
+    """
+    Return the (scale_x, scale_y, offset_x, offset_y) transform from the
+    child coordinates of group shape *grpSp* to slide coordinates, where
+    *transform* is that of the group's parent. A group maps the rectangle
+    given by its child offset and extents onto the one given by its own
+    offset and extents.
+    """
+    scale_x, scale_y, offset_x, offset_y = transform
+    xfrm = grpSp.xfrm
+    if xfrm is None:
+        return transform
+    off, ext = xfrm.off, xfrm.ext
+    chOff, chExt = xfrm.chOff, xfrm.chExt
+    x, y = (0, 0) if off is None else (off.x, off.y)
+    ch_x, ch_y = (x, y) if chOff is None else (chOff.x, chOff.y)
+    sx = sy = 1.0
+    if ext is not None and chExt is not None:
+        if chExt.cx:
+            sx = ext.cx / chExt.cx
+        if chExt.cy:
+            sy = ext.cy / chExt.cy
+    return (
+        scale_x * sx, scale_y * sy,
+        offset_x + scale_x * (x - ch_x * sx),
+        offset_y + scale_y * (y - ch_y * sy),
+    )
+
+
+def _iter_shape_bounds(shape_elms, shape_factory, transform):
+    """
+    Generate the |ShapeBounds| objects for *shape_elms*, the shapes of
+    a group having child-to-slide *transform*, recursively.
+    """
+    grpSp_tag = qn('p:grpSp')
+    scale_x, scale_y, offset_x, offset_y = transform
+    for shape_elm in shape_elms:
+        if not isinstance(shape_elm, BaseShapeElement):
+            continue
+        if shape_elm.tag == grpSp_tag:
+            for bounds in _iter_shape_bounds(
+                    shape_elm.iter_shape_elms(), shape_factory,
+                    _child_transform(shape_elm, transform)):
+                yield bounds
+            continue
+        shape = shape_factory(shape_elm)
+        left, top = shape.left, shape.top
+        width, height = shape.width, shape.height
+        if None in (left, top, width, height):
+            continue
+        yield ShapeBounds(
+            shape,
+            Emu(int(round(offset_x + scale_x * left))),
+            Emu(int(round(offset_y + scale_y * top))),
+            Emu(int(round(scale_x * width))),
+            Emu(int(round(scale_y * height))),
+        )
@@ -6,10 +6,11 @@ Table-related objects such as Table and Cell.
 
 from __future__ import absolute_import, print_function
 
+from numbers import Number
 from warnings import warn
 
 from . import Subshape
-from ..compat import is_integer, to_unicode
+from ..compat import is_integer, is_string, to_unicode, Unicode
 from ..dml.fill import FillFormat
 from ..text.text import TextFrame
 from ..util import lazyproperty
@@ -24,6 +25,8 @@ class Table(object):
         super(Table, self).__init__()
         self._tbl = tbl
         self._graphic_frame = graphic_frame
+        self._synced_height = None
+        self._synced_width = None
 
     def cell(self, row_idx, col_idx):
         """
@@ -105,22 +108,38 @@ class Table(object):
     def last_row(self, value):
         self._tbl.lastRow = value
 
-    def notify_height_changed(self):
-        """
-        Called by a row when its height changes, triggering the graphic frame
-        to recalculate its total height (as the sum of the row heights).
-        """
-        new_table_height = sum([row.height for row in self.rows])
-        self._graphic_frame.height = new_table_height
-
-    def notify_width_changed(self):
-        """
-        Called by a column when its width changes, triggering the graphic
-        frame to recalculate its total width (as the sum of the column
-        widths).
-        """
-        new_table_width = sum([col.width for col in self.columns])
-        self._graphic_frame.width = new_table_width
+    def notify_height_changed(self, delta=None):
+        """
+        Called by a row when its height changes by *delta*, triggering the
+        graphic frame to adjust its total height to match. The height is
+        recalculated as the sum of the row heights on first use, when
+        *delta* is |None|, and when the graphic frame height is no longer the
+        one this table last set. Otherwise *delta* is added to it, so
+        resizing one row costs the same however many rows the table has.
+        """
+        graphic_frame = self._graphic_frame
+        if delta is None or graphic_frame.height != self._synced_height:
+            new_table_height = sum([tr.h for tr in self._tbl.tr_lst])
+        else:
+            new_table_height = graphic_frame.height + delta
+        graphic_frame.height = new_table_height
+        self._synced_height = graphic_frame.height
+
+    def notify_width_changed(self, delta=None):
+        """
+        Called by a column when its width changes by *delta*, triggering the
+        graphic frame to adjust its total width to match, in the same way
+        :meth:`notify_height_changed` adjusts its height.
+        """
+        graphic_frame = self._graphic_frame
+        if delta is None or graphic_frame.width != self._synced_width:
+            new_table_width = sum(
+                [gridCol.w for gridCol in self._tbl.tblGrid.gridCol_lst]
+            )
+        else:
+            new_table_width = graphic_frame.width + delta
+        graphic_frame.width = new_table_width
+        self._synced_width = graphic_frame.width
 
     @property
     def part(self):
@@ -129,6 +148,42 @@ class Table(object):
         """
         return self._graphic_frame.part
 
+    def populate(self, data, number_formats=None):
+        """
+        Replace the text of the cells of this table with the values in
+        *data*, a sequence of rows such as a list of lists, a 2-D NumPy
+        array, or an iterator of row sequences, starting at the top-left
+        cell. Cells beyond the extent of *data* are left unchanged. Each
+        value is written as its string form, |None| as an empty cell. When
+        *number_formats* is given, it is a sequence with an item for each
+        column, either |None| or a format specification such as ``'.2f'``
+        or ``'.1%'``, applied to the numbers in that column. Note that the
+        ``','`` thousands separator option, as in ``',.2f'``, requires
+        Python 2.7 or later. The text is written directly in the XML in
+        a single pass, without constructing a cell or text frame object for
+        each cell. Raises |IndexError| if *data* has more rows or columns
+        than the table, and |ValueError| if a number format is not valid for
+        a value in its column.
+        """
+        number_formats = tuple(number_formats or ())
+        tr_lst = self._tbl.tr_lst
+        for row_idx, row in enumerate(data):
+            if row_idx >= len(tr_lst):
+                raise IndexError("row index [%d] out of range" % row_idx)
+            tc_lst = tr_lst[row_idx].tc_lst
+            for col_idx, value in enumerate(row):
+                if col_idx >= len(tc_lst):
+                    raise IndexError(
+                        "cell index [%d] out of range" % col_idx
+                    )
+                number_format = (
+                    number_formats[col_idx]
+                    if col_idx < len(number_formats) else None
+                )
+                tc_lst[col_idx].set_text(
+                    self._cell_text(value, number_format)
+                )
+
     @lazyproperty
     def rows(self):
         """
@@ -150,6 +205,32 @@ class Table(object):
     def vert_banding(self, value):
         self._tbl.bandCol = value
 
+    @staticmethod
+    def _cell_text(value, number_format):
+        """
+        Return the unicode text to write in a cell for *value*, formatted
+        with *number_format* when it is a number and *number_format* is not
+        |None|. Raises |ValueError| if *number_format* cannot format
+        *value*.
+        """
+        if value is None:
+            return u''
+        if is_string(value):
+            return to_unicode(value)
+        if (number_format is not None and isinstance(value, Number) and
+                not isinstance(value, bool)):
+            try:
+                return to_unicode(format(value, number_format))
+            except ValueError as e:
+                tmpl = "number format '%s' cannot format %r: %s"
+                if ',' in number_format:
+                    tmpl += (
+                        " (the ',' thousands separator requires Python 2.7"
+                        " or later)"
+                    )
+                raise ValueError(tmpl % (number_format, value, e))
+        return Unicode(value)
+
 
 class _Cell(Subshape):
     """
@@ -299,8 +380,9 @@ class _Column(Subshape):
 
     @width.setter
     def width(self, width):
+        delta = width - self._gridCol.w
         self._gridCol.w = width
-        self._parent.notify_width_changed()
+        self._parent.notify_width_changed(delta)
 
 
 class _Row(Subshape):
@@ -328,8 +410,9 @@ class _Row(Subshape):
 
     @height.setter
     def height(self, height):
+        delta = height - self._tr.h
         self._tr.h = height
-        self._parent.notify_height_changed()
+        self._parent.notify_height_changed(delta)
 
 
 class _CellCollection(Subshape):
@@ -349,6 +432,14 @@ class _CellCollection(Subshape):
             raise IndexError(msg)
         return _Cell(self._tr.tc_lst[idx], self)
 
+    def __iter__(self):
+        """
+        Generate a |_Cell| object for each cell in this row, locating the
+        cell elements only once.
+        """
+        for tc in self._tr.tc_lst:
+            yield _Cell(tc, self)
+
     def __len__(self):
         """
         Supports len() function (e.g. 'len(cells) == 1').
@@ -373,17 +464,25 @@ class _ColumnCollection(Subshape):
             raise IndexError(msg)
         return _Column(self._tbl.tblGrid.gridCol_lst[idx], self)
 
+    def __iter__(self):
+        """
+        Generate a |_Column| object for each column in this table, locating
+        the column elements only once.
+        """
+        for gridCol in self._tbl.tblGrid.gridCol_lst:
+            yield _Column(gridCol, self)
+
     def __len__(self):
         """
         Supports len() function (e.g. 'len(columns) == 1').
         """
         return len(self._tbl.tblGrid.gridCol_lst)
 
-    def notify_width_changed(self):
+    def notify_width_changed(self, delta=None):
         """
         Called by a column when its width changes. Pass along to parent.
         """
-        self._parent.notify_width_changed()
+        self._parent.notify_width_changed(delta)
 
 
 class _RowCollection(Subshape):
@@ -403,14 +502,22 @@ class _RowCollection(Subshape):
             raise IndexError(msg)
         return _Row(self._tbl.tr_lst[idx], self)
 
+    def __iter__(self):
+        """
+        Generate a |_Row| object for each row in this table, locating the
+        row elements only once.
+        """
+        for tr in self._tbl.tr_lst:
+            yield _Row(tr, self)
+
     def __len__(self):
         """
         Supports len() function (e.g. 'len(rows) == 1').
         """
         return len(self._tbl.tr_lst)
 
-    def notify_height_changed(self):
+    def notify_height_changed(self, delta=None):
         """
         Called by a row when its height changes. Pass along to parent.
         """
-        self._parent.notify_height_changed()
+        self._parent.notify_height_changed(delta)
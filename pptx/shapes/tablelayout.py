@@ -0,0 +1,191 @@
+# encoding: utf-8
+
+"""
+TablePaginator, for laying out a table too long for one slide across as many
+slides as it needs.
+"""
+
+from __future__ import absolute_import, print_function
+
+from ..oxml.ns import qn
+from ..text.fonts import FontFiles
+from ..text.layout import ParagraphFitter
+from ..util import lazyproperty
+from .table import Table
+
+# default cell margins, as applied by PowerPoint when a cell specifies none
+_MARGIN_LEFT_RIGHT = 91440
+_MARGIN_TOP_BOTTOM = 45720
+
+
+class TablePaginator(object):
+    """
+    Lays out rows of text as a table split across as many slides as needed,
+    each a new slide from *slide_layout* carrying one table at *left*, *top*
+    and no taller than *height*. The columns divide *width* evenly unless
+    *col_widths* gives the width of each. When *header* is given, it is
+    a sequence of column headings repeated as the first row on every slide.
+    One of *col_widths* and *header* is required, to fix the number of
+    columns. Text is measured at *point_size* using the font defined in
+    *font_file*, Calibri by default, with the metrics used by
+    :meth:`.TextFrame.fit_text`, and is set at that size. *number_formats*
+    has the meaning it has for :meth:`.Table.populate`.
+    """
+    def __init__(self, slide_layout, left, top, width, height,
+                 col_widths=None, header=None, point_size=18, font_file=None,
+                 number_formats=None):
+        super(TablePaginator, self).__init__()
+        self._slide_layout = slide_layout
+        self._left, self._top = left, top
+        self._height = height
+        self._col_widths = tuple(col_widths) if col_widths else None
+        self._width = width if col_widths is None else sum(col_widths)
+        self._header = None if header is None else tuple(header)
+        self._point_size = point_size
+        self._font_file_arg = font_file
+        self._number_formats = tuple(number_formats or ())
+        self._text_heights = {}
+
+    def paginate(self, slides, rows):
+        """
+        Add to *slides*, the slide collection of a presentation, as many
+        slides as it takes to hold the rows in *rows* and return a list of
+        the |GraphicFrame| shape containing the table on each. *rows* is an
+        iterable of sequences of cell values and is consumed once, row by
+        row, so it can be a generator of arbitrary length; only the rows of
+        the page being filled are held at any time. A row taller than
+        a whole page is placed on a page of its own and overflows it.
+        """
+        header_height = self._header_height
+        page_height = self._height - header_height
+
+        graphic_frames, page, row_heights, used = [], [], [], 0
+        for row in rows:
+            texts = self._row_texts(row)
+            row_height = self._row_height(texts)
+            if page and used + row_height > page_height:
+                graphic_frames.append(
+                    self._add_page(slides, page, row_heights)
+                )
+                page, row_heights, used = [], [], 0
+            page.append(texts)
+            row_heights.append(row_height)
+            used += row_height
+        if page:
+            graphic_frames.append(self._add_page(slides, page, row_heights))
+        return graphic_frames
+
+    def _add_page(self, slides, page, row_heights):
+        """
+        Add a slide to *slides* containing a table of the rows of text in
+        *page*, preceded by the header if there is one, having row heights
+        *row_heights*. The table is added with its text in a single pass,
+        then its row heights and column widths are set and its font size is
+        set directly on its elements. The font size is set on each run and
+        on the end-of-paragraph properties, so an empty cell is no taller
+        than it was measured.
+        """
+        if self._header is not None:
+            page = [self._header_texts] + page
+            row_heights = [self._header_height] + row_heights
+        col_widths = self._column_widths
+
+        shapes = slides.add_slide(self._slide_layout).shapes
+        graphic_frame = shapes.add_table(
+            len(page), len(col_widths), self._left, self._top, self._width,
+            sum(row_heights), texts=page
+        )
+        table = graphic_frame.table
+        table.first_row = self._header is not None
+        for row, row_height in zip(table.rows, row_heights):
+            row.height = row_height
+        for column, col_width in zip(table.columns, col_widths):
+            column.width = col_width
+        tbl = table._tbl
+        sz = int(round(self._point_size * 100))
+        for r in tbl.iter(qn('a:r')):
+            r.get_or_add_rPr().sz = sz
+        for p in tbl.iter(qn('a:p')):
+            p.get_or_add_endParaRPr().sz = sz
+        return graphic_frame
+
+    @lazyproperty
+    def _column_widths(self):
+        """
+        Tuple of the width of each column, an even division of the table
+        width, the last column absorbing any remainder, when no column
+        widths were given.
+        """
+        if self._col_widths is not None:
+            return self._col_widths
+        cols = len(self._header) if self._header is not None else None
+        if cols is None:
+            raise ValueError('col_widths or header is required')
+        col_width = self._width // cols
+        return (col_width,) * (cols-1) + (self._width - (cols-1)*col_width,)
+
+    @lazyproperty
+    def _font_file(self):
+        """
+        Path of the font file used to measure text.
+        """
+        if self._font_file_arg is not None:
+            return self._font_file_arg
+        return FontFiles.find('Calibri', False, False)
+
+    @lazyproperty
+    def _header_height(self):
+        """
+        Height of the header row, 0 when there is none.
+        """
+        if self._header is None:
+            return 0
+        return self._row_height(self._header_texts)
+
+    @lazyproperty
+    def _header_texts(self):
+        return self._row_texts(self._header)
+
+    def _row_height(self, texts):
+        """
+        Return the height of a row having cell text *texts*, the height of
+        its tallest cell. Cell heights are remembered by text and column,
+        so repeated values are measured only once.
+        """
+        text_heights = self._text_heights
+        cell_height = 0
+        for col_idx, (text, col_width) in enumerate(
+                zip(texts or ('',), self._column_widths)):
+            key = (text, col_idx)
+            text_height = text_heights.get(key)
+            if text_height is None:
+                text_height = ParagraphFitter.text_height(
+                    text, col_width - 2*_MARGIN_LEFT_RIGHT,
+                    self._point_size, self._font_file
+                )
+                text_heights[key] = text_height
+            cell_height = max(cell_height, text_height)
+        return cell_height + 2*_MARGIN_TOP_BOTTOM
+
+    def _row_texts(self, row):
+        """
+        Return a tuple containing the cell text for each value in *row*.
+        Raises |ValueError| if *row* has more values than the table has
+        columns.
+        """
+        row = tuple(row)
+        col_count = len(self._column_widths)
+        if len(row) > col_count:
+            raise ValueError(
+                'row has %d values but table has %d columns'
+                % (len(row), col_count)
+            )
+        number_formats = self._number_formats
+        return tuple(
+            Table._cell_text(
+                value,
+                number_formats[col_idx]
+                if col_idx < len(number_formats) else None
+            )
+            for col_idx, value in enumerate(row)
+        )
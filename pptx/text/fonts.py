@@ -6,10 +6,13 @@ Objects related to system font file lookup.
 
 from __future__ import absolute_import, print_function
 
+import json
 import os
 import sys
+import tempfile
 
 from struct import calcsize, unpack_from
+from xml.etree import ElementTree
 
 from ..util import lazyproperty
 
@@ -17,9 +20,23 @@ from ..util import lazyproperty
 class FontFiles(object):
     """
     A class-based singleton serving as a lazy cache for system font details.
+    The font files found are also recorded in an index file on disk, so
+    a new process can reuse them without parsing each font file again.
     """
 
     _font_files = None
+    _user_directories = []
+
+    @classmethod
+    def add_directory(cls, directory):
+        """
+        Add *directory* to the directories searched for font files, for
+        example a directory of fonts deployed with an application. Fonts in
+        an added directory take precedence over installed fonts having the
+        same family name and style.
+        """
+        cls._user_directories = cls._user_directories + [directory]
+        cls._font_files = None
 
     @classmethod
     def find(cls, family_name, is_bold, is_italic):
@@ -38,10 +55,13 @@ class FontFiles(object):
         containing all the font files resident on the current machine. The
         font descriptor is a (family_name, is_bold, is_italic) 3-tuple.
         """
+        font_index = _FontIndex.load(cls._index_path())
         fonts = {}
         for d in cls._font_directories():
-            for key, path in cls._iter_font_files_in(d):
+            for key, path in font_index.font_files_in(
+                    d, cls._iter_font_files_in):
                 fonts[key] = path
+        font_index.save()
         return fonts
 
     @classmethod
@@ -51,10 +71,53 @@ class FontFiles(object):
         current platform.
         """
         if sys.platform.startswith('darwin'):
-            return cls._os_x_font_directories()
+            font_dirs = cls._os_x_font_directories()
+        elif sys.platform.startswith('win32'):
+            font_dirs = cls._windows_font_directories()
+        else:
+            font_dirs = cls._linux_font_directories()
+        return font_dirs + cls._user_directories
+
+    @staticmethod
+    def _fontconfig_directories(fonts_conf_path='/etc/fonts/fonts.conf'):
+        """
+        Return the font directories listed in the ``<dir>`` elements of the
+        fontconfig configuration file at *fonts_conf_path*, or an empty list
+        if the file is not present or cannot be parsed.
+        """
+        try:
+            fontconfig = ElementTree.parse(fonts_conf_path).getroot()
+        except (IOError, OSError, ElementTree.ParseError):
+            return []
+        xdg_data_home = os.environ.get(
+            'XDG_DATA_HOME', os.path.expanduser('~/.local/share')
+        )
+        font_dirs = []
+        for dir_ in fontconfig.iter('dir'):
+            path = (dir_.text or '').strip()
+            if not path:
+                continue
+            if dir_.get('prefix') == 'xdg':
+                path = os.path.join(xdg_data_home, path)
+            font_dirs.append(os.path.expanduser(path))
+        return font_dirs
+
+    @classmethod
+    def _index_path(cls):
+        """
+        Return the path of the font index file, the value of the
+        ``PPTX_FONT_INDEX`` environment variable when set, otherwise a file
+        in the user cache directory.
+        """
+        path = os.environ.get('PPTX_FONT_INDEX')
+        if path:
+            return path
+        cache_dir = os.environ.get(
+            'XDG_CACHE_HOME', os.path.expanduser(os.path.join('~', '.cache'))
+        )
         if sys.platform.startswith('win32'):
-            return cls._windows_font_directories()
-        raise OSError('unsupported operating system')
+            cache_dir = os.environ.get('LOCALAPPDATA', cache_dir)
+        return os.path.join(cache_dir, 'python-pptx', 'font-index.json')
 
     @classmethod
     def _iter_font_files_in(cls, directory):
@@ -73,6 +136,29 @@ class FontFiles(object):
                 with _Font.open(path) as f:
                     yield ((f.family_name, f.is_bold, f.is_italic), path)
 
+    @classmethod
+    def _linux_font_directories(cls):
+        """
+        Return a sequence of directory paths on Linux and other Unix-like
+        systems in which fonts are likely to be located, those configured
+        for fontconfig followed by any of the customary directories not
+        already included.
+        """
+        font_dirs = cls._fontconfig_directories()
+        xdg_data_home = os.environ.get(
+            'XDG_DATA_HOME', os.path.expanduser('~/.local/share')
+        )
+        customary_dirs = [
+            '/usr/share/fonts',
+            '/usr/local/share/fonts',
+            os.path.join(xdg_data_home, 'fonts'),
+            os.path.expanduser('~/.fonts'),
+        ]
+        for font_dir in customary_dirs:
+            if font_dir not in font_dirs:
+                font_dirs.append(font_dir)
+        return font_dirs
+
     @classmethod
     def _os_x_font_directories(cls):
         """
@@ -101,6 +187,226 @@ class FontFiles(object):
         return [r'C:\Windows\Fonts']
 
 
+class _FontIndex(object):
+    """
+    The font files found in each font directory, as recorded on disk. The
+    entry for a directory is reused until the modification time of the
+    directory or one of its subdirectories changes, indicating a font file
+    may have been added or removed.
+    """
+    def __init__(self, path, entries):
+        super(_FontIndex, self).__init__()
+        self._path = path
+        self._entries = entries
+        self._is_dirty = False
+
+    @classmethod
+    def load(cls, path):
+        """
+        Return a |_FontIndex| object loaded from the index file at *path*.
+        The index is empty when the file is missing or unreadable.
+        """
+        try:
+            with open(path) as f:
+                entries = json.load(f)
+        except (IOError, OSError, ValueError):
+            entries = {}
+        if not isinstance(entries, dict):
+            entries = {}
+        return cls(path, entries)
+
+    def font_files_in(self, directory, scan):
+        """
+        Return a list of the (key, path) pairs for the font files in and
+        under *directory*, as recorded in this index if still current,
+        otherwise as produced by calling *scan* with *directory*.
+        """
+        signature = self._signature(directory)
+        entry = self._entries.get(directory)
+        if entry is not None and entry.get('signature') == signature:
+            return [
+                ((family_name, is_bold, is_italic), path)
+                for family_name, is_bold, is_italic, path in entry['fonts']
+            ]
+        font_files = list(scan(directory)) if signature else []
+        self._entries[directory] = {
+            'signature': signature,
+            'fonts': [list(key) + [path] for key, path in font_files],
+        }
+        self._is_dirty = True
+        return font_files
+
+    def save(self):
+        """
+        Write this index to its file if it has changed since it was loaded.
+        The file is replaced atomically so a concurrent process never reads
+        a partial index. A failure to write, for example in a read-only
+        location, is ignored; the index is then rebuilt on next use. The
+        temporary file is removed if it is not renamed into place.
+        """
+        if not self._is_dirty:
+            return
+        tmp_path = None
+        try:
+            index_dir = os.path.dirname(self._path)
+            if index_dir and not os.path.isdir(index_dir):
+                os.makedirs(index_dir)
+            fd, tmp_path = tempfile.mkstemp(dir=index_dir or None)
+            with os.fdopen(fd, 'w') as f:
+                json.dump(self._entries, f)
+            if os.path.exists(self._path) and sys.platform == 'win32':
+                os.remove(self._path)
+            os.rename(tmp_path, self._path)
+            tmp_path = None
+        except (IOError, OSError):
+            return
+        finally:
+            if tmp_path is not None:
+                self._remove(tmp_path)
+        self._is_dirty = False
+
+    @staticmethod
+    def _remove(path):
+        """
+        Remove the file at *path*, ignoring a failure to do so.
+        """
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _signature(directory):
+        """
+        Return a list of [path, mtime] pairs for *directory* and each of its
+        subdirectories, empty when *directory* does not exist.
+        """
+        signature = []
+        for root, dirs, files in os.walk(directory):
+            try:
+                signature.append([root, os.path.getmtime(root)])
+            except OSError:
+                continue
+        return sorted(signature)
+
+
+class FontMetrics(object):
+    """
+    The glyph metrics of a font file, read once, from which the rendered
+    width and line height of text can be computed at any point size without
+    rendering it. Widths are accumulated at unit size, in font design units,
+    and scaled by point size, so one instance serves all point sizes.
+    """
+    max_word_widths = 65536
+
+    def __init__(self, units_per_em, ascender, descender, glyph_ids,
+                 advance_widths, kerning_pairs):
+        super(FontMetrics, self).__init__()
+        self._units_per_em = units_per_em
+        self._ascender = ascender
+        self._descender = descender
+        self._glyph_ids = glyph_ids
+        self._advance_widths = advance_widths
+        self._kerning_pairs = kerning_pairs
+        self._word_widths = {}
+
+    @classmethod
+    def load(cls, font_file_path):
+        """
+        Return a |FontMetrics| object containing the metrics read from the
+        OpenType font file at *font_file_path*.
+        """
+        with _Font.open(font_file_path) as f:
+            return cls(
+                f.units_per_em, f.ascender, f.descender, f.glyph_ids,
+                f.advance_widths, f.kerning_pairs
+            )
+
+    def line_height(self, point_size):
+        """
+        The height in points of a line of text rendered at *point_size*,
+        from the top of its tallest ascender to the bottom of its lowest
+        descender.
+        """
+        units = self._ascender - self._descender
+        return units * point_size / float(self._units_per_em)
+
+    def text_width(self, text, point_size):
+        """
+        The width in points of *text* when rendered as a single line at
+        *point_size*, including the kerning between adjacent characters.
+        The width of each word is computed once from the glyph advance
+        widths and remembered, so measuring the many candidate lines formed
+        from the same words is cheap. No more than *max_word_widths* words
+        are remembered, the memo being started afresh when it is full.
+        """
+        words = text.split(' ')
+        word_widths = self._word_widths
+        units = 0
+        for word in words:
+            width = word_widths.get(word)
+            if width is None:
+                if len(word_widths) >= self.max_word_widths:
+                    word_widths.clear()
+                width = word_widths[word] = self._units_width(word)
+            units += width
+        if len(words) > 1:
+            space_gid = self._glyph_id(' ')
+            units += (len(words) - 1) * self._advance(space_gid)
+            units += self._word_boundary_kerning(words, space_gid)
+        return units * point_size / float(self._units_per_em)
+
+    def _advance(self, glyph_id):
+        """
+        The advance width of the glyph having *glyph_id*, in font design
+        units. Glyphs beyond the last horizontal metric share its advance.
+        """
+        advance_widths = self._advance_widths
+        if glyph_id < len(advance_widths):
+            return advance_widths[glyph_id]
+        return advance_widths[-1] if advance_widths else 0
+
+    def _glyph_id(self, char):
+        """
+        The glyph id used to render *char*, 0 if this font has no glyph for
+        it.
+        """
+        return self._glyph_ids.get(ord(char), 0)
+
+    def _units_width(self, word):
+        """
+        The width of *word* in font design units, the sum of the advance
+        widths of its glyphs adjusted by the kerning between each pair.
+        """
+        kerning_pairs = self._kerning_pairs
+        units, prior_gid = 0, None
+        for char in word:
+            gid = self._glyph_id(char)
+            units += self._advance(gid)
+            if prior_gid is not None and kerning_pairs:
+                units += kerning_pairs.get((prior_gid, gid), 0)
+            prior_gid = gid
+        return units
+
+    def _word_boundary_kerning(self, words, space_gid):
+        """
+        The total kerning in font design units between the spaces separating
+        *words* and the characters on either side of them.
+        """
+        kerning_pairs = self._kerning_pairs
+        if not kerning_pairs:
+            return 0
+        units = 0
+        for left, right in zip(words[:-1], words[1:]):
+            if left:
+                left_gid = self._glyph_id(left[-1])
+                units += kerning_pairs.get((left_gid, space_gid), 0)
+            if right:
+                right_gid = self._glyph_id(right[0])
+                units += kerning_pairs.get((space_gid, right_gid), 0)
+        return units
+
+
 class _Font(object):
     """
     A wrapper around an OTF/TTF font file stream that knows how to parse it
@@ -115,6 +421,43 @@ class _Font(object):
     def __exit__(self, exception_type, exception_value, exception_tb):
         self._stream.close()
 
+    @property
+    def advance_widths(self):
+        """
+        A sequence containing the advance width of each glyph in this font,
+        indexed by glyph id and expressed in font design units.
+        """
+        metric_count = self._tables['hhea'].metric_count
+        return self._tables['hmtx'].advance_widths(metric_count)
+
+    @property
+    def ascender(self):
+        """
+        The typographic ascent of this font in font design units, a positive
+        value.
+        """
+        return self._tables['hhea'].ascender
+
+    @property
+    def descender(self):
+        """
+        The typographic descent of this font in font design units, generally
+        a negative value.
+        """
+        return self._tables['hhea'].descender
+
+    @property
+    def glyph_ids(self):
+        """
+        A mapping of unicode code point to the glyph id for that character
+        in this font. A character not in the mapping is rendered using glyph
+        0, the missing-character glyph.
+        """
+        try:
+            return self._tables['cmap'].glyph_ids
+        except KeyError:
+            return {}
+
     @property
     def is_bold(self):
         """
@@ -137,6 +480,19 @@ class _Font(object):
             # some files don't have a head table
             return False
 
+    @property
+    def kerning_pairs(self):
+        """
+        A mapping of (left_glyph_id, right_glyph_id) pairs to the horizontal
+        kerning adjustment in font design units to be applied between them.
+        Only a 'kern' table is consulted, so the mapping is empty for a font
+        providing its kerning only in a 'GPOS' table.
+        """
+        try:
+            return self._tables['kern'].pairs
+        except KeyError:
+            return {}
+
     @classmethod
     def open(cls, font_file_path):
         """
@@ -144,6 +500,15 @@ class _Font(object):
         """
         return cls(_Stream.open(font_file_path))
 
+    @property
+    def units_per_em(self):
+        """
+        The number of font design units per em for this font, e.g. 2048.
+        A glyph metric in font design units is converted to points by
+        multiplying by point size and dividing by this value.
+        """
+        return self._tables['head'].units_per_em
+
     @property
     def family_name(self):
         """
@@ -246,6 +611,108 @@ class _BaseTable(object):
         self._length = length
 
 
+class _CmapTable(_BaseTable):
+    """
+    OpenType font table having the tag 'cmap' and containing the mapping of
+    character code points to glyph ids. Only the Unicode subtables in format
+    4 (Basic Multilingual Plane) and format 12 (full repertoire) are read.
+    """
+    def __init__(self, tag, stream, offset, length):
+        super(_CmapTable, self).__init__(tag, stream, offset, length)
+
+    @lazyproperty
+    def glyph_ids(self):
+        """
+        A dict mapping each unicode code point in this font to its glyph id.
+        """
+        bufr = self._stream.read(self._offset, self._length)
+        subtable_offset = self._subtable_offset(bufr)
+        if subtable_offset is None:
+            return {}
+        format_ = unpack_from('>H', bufr, subtable_offset)[0]
+        if format_ == 4:
+            return self._format_4_glyph_ids(bufr, subtable_offset)
+        return self._format_12_glyph_ids(bufr, subtable_offset)
+
+    @staticmethod
+    def _format_4_glyph_ids(bufr, offset):
+        """
+        Return the code point to glyph id mapping in the format 4 subtable
+        at *offset* in *bufr*.
+        """
+        seg_count = unpack_from('>H', bufr, offset + 6)[0] // 2
+        end_codes_offset = offset + 14
+        start_codes_offset = end_codes_offset + seg_count * 2 + 2
+        deltas_offset = start_codes_offset + seg_count * 2
+        range_offsets_offset = deltas_offset + seg_count * 2
+        tmpl = '>%dH' % seg_count
+        end_codes = unpack_from(tmpl, bufr, end_codes_offset)
+        start_codes = unpack_from(tmpl, bufr, start_codes_offset)
+        deltas = unpack_from('>%dh' % seg_count, bufr, deltas_offset)
+        range_offsets = unpack_from(tmpl, bufr, range_offsets_offset)
+
+        glyph_ids = {}
+        for seg_idx in range(seg_count):
+            start, end = start_codes[seg_idx], end_codes[seg_idx]
+            delta, range_offset = deltas[seg_idx], range_offsets[seg_idx]
+            if start == 0xFFFF:
+                continue
+            if range_offset == 0:
+                for code_point in range(start, end + 1):
+                    glyph_ids[code_point] = (code_point + delta) & 0xFFFF
+                continue
+            range_offset_addr = range_offsets_offset + seg_idx * 2
+            for code_point in range(start, end + 1):
+                addr = range_offset_addr + range_offset + (
+                    (code_point - start) * 2
+                )
+                gid = unpack_from('>H', bufr, addr)[0]
+                if gid:
+                    glyph_ids[code_point] = (gid + delta) & 0xFFFF
+        return glyph_ids
+
+    @staticmethod
+    def _format_12_glyph_ids(bufr, offset):
+        """
+        Return the code point to glyph id mapping in the format 12 subtable
+        at *offset* in *bufr*.
+        """
+        group_count = unpack_from('>L', bufr, offset + 12)[0]
+        glyph_ids = {}
+        for idx in range(group_count):
+            start, end, start_gid = unpack_from(
+                '>LLL', bufr, offset + 16 + idx * 12
+            )
+            for code_point in range(start, end + 1):
+                glyph_ids[code_point] = start_gid + code_point - start
+        return glyph_ids
+
+    @staticmethod
+    def _subtable_offset(bufr):
+        """
+        Return the offset in *bufr* of the preferred Unicode subtable, or
+        |None| if there is no subtable in a supported format. A format 12
+        subtable is preferred over format 4.
+        """
+        table_count = unpack_from('>H', bufr, 2)[0]
+        candidates = []
+        for idx in range(table_count):
+            platform_id, encoding_id, offset = unpack_from(
+                '>HHL', bufr, 4 + idx * 8
+            )
+            is_unicode = platform_id == 0 or (
+                platform_id == 3 and encoding_id in (1, 10)
+            )
+            if not is_unicode:
+                continue
+            format_ = unpack_from('>H', bufr, offset)[0]
+            if format_ in (4, 12):
+                candidates.append((format_, offset))
+        if not candidates:
+            return None
+        return max(candidates)[1]
+
+
 class _HeadTable(_BaseTable):
     """
     OpenType font table having the tag 'head' and containing certain header
@@ -275,6 +742,14 @@ class _HeadTable(_BaseTable):
         """
         return self._stream.read_fields('>4s4sLLHHqqhhhhHHHHH', self._offset)
 
+    @property
+    def units_per_em(self):
+        """
+        The 'unitsPerEm' field of this head table, the number of font design
+        units per em.
+        """
+        return self._fields[5]
+
     @property
     def _macStyle(self):
         """
@@ -283,6 +758,98 @@ class _HeadTable(_BaseTable):
         return self._fields[12]
 
 
+class _HheaTable(_BaseTable):
+    """
+    OpenType font table having the tag 'hhea' and containing the font-wide
+    metrics for horizontal layout, such as ascender and descender.
+    """
+    def __init__(self, tag, stream, offset, length):
+        super(_HheaTable, self).__init__(tag, stream, offset, length)
+
+    @property
+    def ascender(self):
+        """
+        The typographic ascent in font design units.
+        """
+        return self._fields[1]
+
+    @property
+    def descender(self):
+        """
+        The typographic descent in font design units, generally negative.
+        """
+        return self._fields[2]
+
+    @property
+    def metric_count(self):
+        """
+        The 'numberOfHMetrics' field, the number of advance width entries in
+        the 'hmtx' table.
+        """
+        return self._fields[-1]
+
+    @lazyproperty
+    def _fields(self):
+        """
+        A 17-tuple containing the fields in this table.
+        """
+        return self._stream.read_fields('>4shhhH6h4hhH', self._offset)
+
+
+class _HmtxTable(_BaseTable):
+    """
+    OpenType font table having the tag 'hmtx' and containing the advance
+    width and left side bearing of each glyph.
+    """
+    def __init__(self, tag, stream, offset, length):
+        super(_HmtxTable, self).__init__(tag, stream, offset, length)
+
+    def advance_widths(self, metric_count):
+        """
+        Return a tuple containing the first *metric_count* advance widths in
+        this table, indexed by glyph id. Any glyph having a higher id has the
+        same advance width as the last of these.
+        """
+        bufr = self._stream.read(self._offset, metric_count * 4)
+        return unpack_from('>%s' % ('Hh' * metric_count), bufr)[::2]
+
+
+class _KernTable(_BaseTable):
+    """
+    OpenType font table having the tag 'kern' and containing the kerning
+    adjustments between pairs of glyphs. Only horizontal kerning subtables
+    in format 0 are read.
+    """
+    def __init__(self, tag, stream, offset, length):
+        super(_KernTable, self).__init__(tag, stream, offset, length)
+
+    @lazyproperty
+    def pairs(self):
+        """
+        A dict mapping (left_glyph_id, right_glyph_id) pairs to a kerning
+        value in font design units.
+        """
+        bufr = self._stream.read(self._offset, self._length)
+        version, table_count = unpack_from('>HH', bufr)
+        if version != 0:
+            return {}
+        pairs = {}
+        offset = 4
+        for _ in range(table_count):
+            _, length, coverage = unpack_from('>HHH', bufr, offset)
+            is_horizontal_format_0 = (coverage & 0xFF07) == 0x0001
+            if is_horizontal_format_0:
+                pair_count = unpack_from('>H', bufr, offset + 6)[0]
+                pair_offset = offset + 14
+                for idx in range(pair_count):
+                    left, right, value = unpack_from(
+                        '>HHh', bufr, pair_offset + idx * 6
+                    )
+                    pairs[(left, right)] = value
+            offset += length
+        return pairs
+
+
 class _NameTable(_BaseTable):
     """
     An OpenType font table having the tag 'name' and containing the
@@ -415,7 +982,11 @@ def _TableFactory(tag, stream, offset, length):
     *font_file* with content of *length* starting at *offset*.
     """
     TableClass = {
+        'cmap': _CmapTable,
         'head': _HeadTable,
+        'hhea': _HheaTable,
+        'hmtx': _HmtxTable,
+        'kern': _KernTable,
         'name': _NameTable,
     }.get(tag, _BaseTable)
     return TableClass(tag, stream, offset, length)
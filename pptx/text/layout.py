@@ -6,13 +6,24 @@ Objects related to layout of rendered text, such as TextFitter.
 
 from __future__ import absolute_import, print_function
 
-from PIL import ImageFont
+import math
+
+from collections import namedtuple
+from multiprocessing import Pool
+from threading import Lock
+
+from .fonts import FontMetrics
+from ..util import Length, lazyproperty
+
+_EMU_PER_POINT = 12700
 
 
 class TextFitter(tuple):
     """
     Value object that knows how to fit text into given rectangular extents.
     """
+    _size_step = 1
+
     def __new__(cls, line_source, extents, font_file):
         width, height = extents
         return tuple.__new__(cls, (line_source, width, height, font_file))
@@ -28,61 +39,113 @@ class TextFitter(tuple):
         text_fitter = cls(line_source, extents, font_file)
         return text_fitter._best_fit_font_size(max_size)
 
-    def _best_fit_font_size(self, max_size):
-        """
-        Return the largest whole-number point size less than or equal to
-        *max_size* that this fitter can fit.
-        """
-        predicate = self._fits_inside_predicate
-        sizes = _BinarySearchTree.from_ordered_sequence(
-            range(1, int(max_size)+1)
-        )
-        return sizes.find_max(predicate)
+    @classmethod
+    def best_fit_font_sizes(cls, jobs, processes=None):
+        """
+        Return a list containing the best-fit font size for each job in
+        *jobs*, an iterable of (text, extents, max_size, font_file) tuples
+        having the meaning of the arguments to :meth:`best_fit_font_size`.
+        Identical jobs are fitted only once. Font metrics are shared by all
+        jobs using the same font file. When *processes* is a positive
+        integer, the distinct jobs are divided among a pool of that many
+        worker processes.
+        """
+        jobs = list(jobs)
+        distinct_jobs = list(dict.fromkeys(jobs))
+        if processes:
+            pool = Pool(processes)
+            try:
+                chunksize = max(1, len(distinct_jobs) // (processes * 4))
+                sizes = pool.map(
+                    _best_fit_job, [(cls, job) for job in distinct_jobs],
+                    chunksize
+                )
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            sizes = [_best_fit_job((cls, job)) for job in distinct_jobs]
+        size_by_job = dict(zip(distinct_jobs, sizes))
+        return [size_by_job[job] for job in jobs]
 
-    def _break_line(self, line_source, point_size):
-        """
-        Return a (line, remainder) pair where *line* is the longest line in
-        *line_source* that will fit in this fitter's width and *remainder* is
-        a |_LineSource| object containing the text following the break point.
+    def _best_fit_font_size(self, max_size):
         """
-        lines = _BinarySearchTree.from_ordered_sequence(line_source)
-        predicate = self._fits_in_width_predicate(point_size)
-        return lines.find_max(predicate)
+        Return the largest point size on this fitter's size grid, less than
+        or equal to *max_size*, that this fitter can fit, or |None| if the
+        text does not fit even at the smallest size on the grid. The search
+        starts from an upper bound estimated from the area the text occupies,
+        which is usually the answer or close to it, and bisects below that
+        bound only when the text does not fit there.
+        """
+        step = self._size_step
+        upper = int(min(max_size, self._max_size_by_area) / step)
+        if upper < 1:
+            return None
+        if self._fits_inside(upper * step):
+            return upper * step
+        # ---invariant: text fits at lower (0 standing in for no size) and
+        # does not fit at upper, both counted in grid steps---
+        lower = 0
+        while upper - lower > 1:
+            steps = (lower + upper) // 2
+            if self._fits_inside(steps * step):
+                lower = steps
+            else:
+                upper = steps
+        return lower * step if lower else None
+
+    def _break_lines(self, point_size):
+        """
+        Return a list of (start, end) word-index pairs, one for each line of
+        the text in this fitter wrapped within its width when rendered at
+        *point_size*, or |None| if a single word is wider than this fitter.
+        """
+        return self._break_words(self._word_widths, point_size)
+
+    def _break_words(self, word_widths, point_size, overflow=False):
+        """
+        Return a list of (start, end) word-index pairs, one for each line
+        formed by wrapping words having *word_widths* (at 1 point) within the
+        width of this fitter when rendered at *point_size*, or |None| if
+        a single word is wider than this fitter. When *overflow* is |True|,
+        such a word is instead placed on a line of its own. Lines are broken
+        greedily, in a single pass over the word widths.
+        """
+        max_width = self._width / (point_size * _EMU_PER_POINT)
+        space_width = self._space_width
+
+        lines, start, line_width = [], 0, None
+        for idx, word_width in enumerate(word_widths):
+            if word_width > max_width and not overflow:
+                return None
+            if line_width is None:
+                line_width = word_width
+            elif line_width + space_width + word_width <= max_width:
+                line_width += space_width + word_width
+            else:
+                lines.append((start, idx))
+                start, line_width = idx, word_width
+        if line_width is not None:
+            lines.append((start, len(word_widths)))
+        return lines
 
-    def _fits_in_width_predicate(self, point_size):
+    def _fits_inside(self, point_size):
         """
-        Return a function taking a text string value and returns |True| if
-        that text fits in this fitter when rendered at *point_size*. Used as
-        predicate for _break_line()
+        Return |True| if the text in this fitter can be wrapped to fit
+        entirely within its extents when rendered at *point_size*.
         """
-        def predicate(line):
-            """
-            Return |True| if *line* fits in this fitter when rendered at
-            *point_size*.
-            """
-            cx = _rendered_size(line.text, point_size, self._font_file)[0]
-            return cx <= self._width
-
-        return predicate
+        lines = self._break_lines(point_size)
+        if lines is None:
+            return False
+        line_height = self._font.line_height(point_size) * _EMU_PER_POINT
+        return len(lines) * line_height <= self._height
 
-    @property
-    def _fits_inside_predicate(self):
+    @lazyproperty
+    def _font(self):
         """
-        Return a function taking an integer point size argument that returns
-        |True| if the text in this fitter can be wrapped to fit entirely
-        within its extents when rendered at that point size.
+        The |FontMetrics| object for the font file of this fitter.
         """
-        def predicate(point_size):
-            """
-            Return |True| if the text in *line_source* can be wrapped to fit
-            entirely within *extents* when rendered at *point_size* using the
-            font defined in *font_file*.
-            """
-            text_lines = self._wrap_lines(self._line_source, point_size)
-            cy = _rendered_size('Ty', point_size, self._font_file)[1]
-            return (cy * len(text_lines)) <= self._height
-
-        return predicate
+        return FontMetricsCache.font(self._font_file)
 
     @property
     def _font_file(self):
@@ -97,124 +160,179 @@ class TextFitter(tuple):
         return self[0]
 
     @property
-    def _width(self):
-        return self[1]
-
-    def _wrap_lines(self, line_source, point_size):
+    def _max_size_by_area(self):
         """
-        Return a sequence of str values representing the text in
-        *line_source* wrapped within this fitter when rendered at
-        *point_size*.
+        The largest whole-number point size at which the words of the text,
+        packed into lines without any waste, would not exceed the area of
+        this fitter. No larger size can fit, since every line holds at most
+        the width of this fitter.
         """
-        text, remainder = self._break_line(line_source, point_size)
-        lines = [text]
-        if remainder:
-            lines.extend(self._wrap_lines(remainder, point_size))
-        return lines
+        text_area = sum(self._word_widths) * self._font.line_height(1)
+        if text_area <= 0:
+            return int(self._height / (
+                self._font.line_height(1) * _EMU_PER_POINT
+            ))
+        area = self._width * self._height / _EMU_PER_POINT ** 2
+        return int(math.sqrt(area / text_area))
 
-
-class _BinarySearchTree(object):
-    """
-    A node in a binary search tree. Uniform for root, subtree root, and leaf
-    nodes.
-    """
-    def __init__(self, value):
-        self._value = value
-        self._lesser = None
-        self._greater = None
-
-    def find_max(self, predicate, max_=None):
+    @lazyproperty
+    def _space_width(self):
         """
-        Return the largest item in or under this node that satisfies
-        *predicate*.
+        The width of a space, in points, when rendered at 1 point.
         """
-        if predicate(self.value):
-            max_ = self.value
-            next_node = self._greater
-        else:
-            next_node = self._lesser
-        if next_node is None:
-            return max_
-        return next_node.find_max(predicate, max_)
+        return self._font.text_width(' ', 1)
 
-    @classmethod
-    def from_ordered_sequence(cls, iseq):
-        """
-        Return the root of a balanced binary search tree populated with the
-        values in iterable *iseq*.
-        """
-        seq = list(iseq)
-        # optimize for usually all fits by making longest first
-        bst = cls(seq.pop())
-        bst._insert_from_ordered_sequence(seq)
-        return bst
+    @property
+    def _width(self):
+        return self[1]
 
-    def insert(self, value):
+    @lazyproperty
+    def _word_widths(self):
         """
-        Insert a new node containing *value* into this tree such that its
-        structure as a binary search tree is preserved.
+        List of the width, in points, of each word of the text in this
+        fitter when rendered at 1 point. Widths scale linearly with point
+        size, so these serve every candidate size.
         """
-        side = '_lesser' if value < self.value else '_greater'
-        child = getattr(self, side)
-        if child is None:
-            setattr(self, side, _BinarySearchTree(value))
-        else:
-            child.insert(value)
+        text_width = self._font.text_width
+        return [text_width(word, 1) for word in self._line_source.words]
 
-    def tree(self, level=0, prefix=''):
+    def _wrap_lines(self, point_size):
         """
-        A string representation of the tree rooted in this node, useful for
-        debugging purposes.
+        Return a list of str values representing the text in this fitter
+        wrapped within its width when rendered at *point_size*, or |None| if
+        a single word is wider than this fitter.
         """
-        text = '%s%s\n' % (prefix, self.value.text)
-        prefix = '%s└── ' % ('    ' * level)
-        if self._lesser:
-            text += self._lesser.tree(level+1, prefix)
-        if self._greater:
-            text += self._greater.tree(level+1, prefix)
-        return text
+        lines = self._break_lines(point_size)
+        if lines is None:
+            return None
+        words = self._line_source.words
+        return [' '.join(words[start:end]) for start, end in lines]
 
-    @property
-    def value(self):
+
+class ParagraphFitter(TextFitter):
+    """
+    A |TextFitter| for text made up of paragraphs. Each paragraph starts on
+    a new line and is broken into lines at its line breaks, and is laid out
+    using its own line spacing and space before and after. Point sizes are
+    searched on a half-point grid.
+    """
+    _size_step = 0.5
+
+    @classmethod
+    def best_fit_font_size(cls, paragraphs, extents, max_size, font_file):
         """
-        The value object contained in this node.
+        Return the largest half-point size less than or equal to *max_size*
+        that allows the text in *paragraphs* to fit completely within
+        *extents* when rendered using the font defined in *font_file*.
+        *paragraphs* is a sequence of (text, line_spacing, space_before,
+        space_after) tuples, having the meaning of the like-named
+        |_Paragraph| properties, where a line feed in *text* is a line break.
         """
-        return self._value
+        paragraph_sources = tuple(
+            _ParagraphSource(*paragraph) for paragraph in paragraphs
+        )
+        paragraph_fitter = cls(paragraph_sources, extents, font_file)
+        return paragraph_fitter._best_fit_font_size(max_size)
 
-    @staticmethod
-    def _bisect(seq):
+    @classmethod
+    def text_height(cls, text, width, point_size, font_file):
         """
-        Return a (medial_value, greater_values, lesser_values) 3-tuple
-        obtained by bisecting sequence *seq*.
+        Return the height, as a |Length| value, of *text* wrapped within
+        *width* when rendered at *point_size* using the font defined in
+        *font_file*, a line feed in *text* starting a new line. A word wider
+        than *width* takes a line of its own, overflowing it, as it would
+        when rendered.
         """
-        if len(seq) == 0:
-            return [], None, []
-        mid_idx = int(len(seq)/2)
-        mid = seq[mid_idx]
-        greater = seq[mid_idx+1:]
-        lesser = seq[:mid_idx]
-        return mid, greater, lesser
+        paragraph_fitter = cls(
+            (_ParagraphSource(text, None, None, None),), (width, 0), font_file
+        )
+        return paragraph_fitter._text_height(point_size)
+
+    def _fits_inside(self, point_size):
+        """
+        Return |True| if the paragraphs in this fitter can be wrapped to fit
+        entirely within its extents when rendered at *point_size*.
+        """
+        line_height = self._font.line_height(point_size) * _EMU_PER_POINT
+        height = 0
+        for paragraph, lines_word_widths in zip(
+                self._line_source, self._word_widths):
+            line_count = 0
+            for word_widths in lines_word_widths:
+                lines = self._break_words(word_widths, point_size)
+                if lines is None:
+                    return False
+                line_count += max(len(lines), 1)
+            height += (
+                line_count * paragraph.line_pitch(line_height) +
+                paragraph.space_before + paragraph.space_after
+            )
+            if height > self._height:
+                return False
+        return True
 
-    def _insert_from_ordered_sequence(self, seq):
+    @property
+    def _max_size_by_area(self):
+        """
+        The largest point size at which the words of each paragraph, packed
+        into lines without any waste and spaced by its line spacing, would
+        not exceed the area of this fitter. Fixed line spacing and space
+        before and after are left out, so no larger size can fit.
+        """
+        line_height = self._font.line_height(1)
+        text_area = sum(
+            sum(sum(word_widths) for word_widths in lines_word_widths) *
+            paragraph.line_pitch(line_height, fixed=0)
+            for paragraph, lines_word_widths in zip(
+                self._line_source, self._word_widths
+            )
+        )
+        if text_area <= 0:
+            return float('inf')
+        area = self._width * self._height / _EMU_PER_POINT ** 2
+        return math.sqrt(area / text_area)
+
+    def _text_height(self, point_size):
+        """
+        Return the height, as a |Length| value, of the paragraphs in this
+        fitter wrapped within its width at *point_size*, allowing words
+        wider than its width to overflow.
+        """
+        line_height = self._font.line_height(point_size) * _EMU_PER_POINT
+        height = 0
+        for paragraph, lines_word_widths in zip(
+                self._line_source, self._word_widths):
+            line_count = sum(
+                max(len(self._break_words(word_widths, point_size, True)), 1)
+                for word_widths in lines_word_widths
+            )
+            height += (
+                line_count * paragraph.line_pitch(line_height) +
+                paragraph.space_before + paragraph.space_after
+            )
+        return Length(int(math.ceil(height)))
+
+    @lazyproperty
+    def _word_widths(self):
         """
-        Insert the new values contained in *seq* into this tree such that
-        a balanced tree is produced.
+        For each paragraph, a list containing for each of its lines the list
+        of the width, in points, of each word when rendered at 1 point.
         """
-        if len(seq) == 0:
-            return
-        mid, greater, lesser = self._bisect(seq)
-        self.insert(mid)
-        self._insert_from_ordered_sequence(greater)
-        self._insert_from_ordered_sequence(lesser)
+        text_width = self._font.text_width
+        return [
+            [
+                [text_width(word, 1) for word in line_source.words]
+                for line_source in paragraph.line_sources
+            ]
+            for paragraph in self._line_source
+        ]
 
 
 class _LineSource(object):
     """
-    Generates all the possible even-word line breaks in a string of text,
-    each in the form of a (line, remainder) 2-tuple where *line* contains the
-    text before the break and *remainder* the text after as a |_LineSource|
-    object. Its boolean value is |True| when it contains text, |False| when
-    its text is the empty string or whitespace only.
+    The text to be fitted, broken into words at whitespace. Its boolean value
+    is |True| when it contains text, |False| when its text is the empty
+    string or whitespace only.
     """
     def __init__(self, text):
         self._text = text
@@ -229,19 +347,6 @@ class _LineSource(object):
     def __eq__(self, other):
         return self._text == other._text
 
-    def __iter__(self):
-        """
-        Generate a (text, remainder) pair for each possible even-word line
-        break in this line source, where *text* is a str value and remainder
-        is a |_LineSource| value.
-        """
-        words = self._text.split()
-        for idx in range(1, len(words)+1):
-            line_text = ' '.join(words[:idx])
-            remainder_text = ' '.join(words[idx:])
-            remainder = _LineSource(remainder_text)
-            yield _Line(line_text, remainder)
-
     def __nonzero__(self):
         """
         Gives this object boolean behaviors (in Python 2). bool(line_source)
@@ -252,65 +357,159 @@ class _LineSource(object):
     def __repr__(self):
         return "<_LineSource('%s')>" % self._text
 
+    @lazyproperty
+    def words(self):
+        """
+        List of the whitespace-separated words in this line source.
+        """
+        return self._text.split()
 
-class _Line(tuple):
+
+class _ParagraphSource(tuple):
     """
-    A candidate line broken at an even word boundary from a string of text,
-    and a |_LineSource| value containing the text that remains after the line
-    is broken at this spot.
+    The text and spacing of a paragraph to be fitted. Hashable, so jobs
+    containing paragraphs can be deduplicated.
     """
-    def __new__(cls, text, remainder):
-        return tuple.__new__(cls, (text, remainder))
-
-    def __gt__(self, other):
-        return len(self.text) > len(other.text)
-
-    def __lt__(self, other):
-        return not self.__gt__(other)
+    def __new__(cls, text, line_spacing, space_before, space_after):
+        return tuple.__new__(
+            cls, (text, line_spacing, space_before, space_after)
+        )
 
-    def __len__(self):
-        return len(self.text)
+    @property
+    def line_sources(self):
+        """
+        A |_LineSource| object for each line of this paragraph, as broken by
+        its line breaks.
+        """
+        return [_LineSource(text) for text in self[0].split('\n')]
 
-    def __repr__(self):
-        return "'%s' => '%s'" % (self.text, self.remainder)
+    def line_pitch(self, line_height, fixed=None):
+        """
+        The distance between successive baselines in this paragraph, given
+        the *line_height* of its font. Line spacing in lines is a multiple of
+        *line_height*, no line spacing is single spacing, and fixed line
+        spacing is the |Length| value of the line spacing, or *fixed* when
+        *fixed* is not |None|.
+        """
+        line_spacing = self[1]
+        if isinstance(line_spacing, Length):
+            return line_spacing if fixed is None else fixed
+        if line_spacing is None:
+            return line_height
+        return line_spacing * line_height
 
     @property
-    def remainder(self):
-        return self[1]
+    def space_after(self):
+        return self[3] or 0
 
     @property
-    def text(self):
-        return self[0]
+    def space_before(self):
+        return self[2] or 0
 
 
-class _Fonts(object):
+class FontMetricsCache(object):
     """
-    A memoizing cache for ImageFont objects.
+    The bounded, thread-safe, least-recently-used cache of the |FontMetrics|
+    objects used to measure text when fitting it, shared by the whole
+    process. The metrics of a font file do not depend on point size, so
+    a single entry per font file serves all point sizes. No more than
+    :attr:`capacity` fonts are held, the least recently used being dropped
+    to make room for a new one. A long-lived process can inspect the cache
+    with :meth:`cache_info`, change its limit with :meth:`set_capacity`,
+    and release its memory with :meth:`clear`.
     """
-    fonts = {}
+    capacity = 32
+    hits = 0
+    misses = 0
+    _fonts = {}
+    _tick = 0
+    _lock = Lock()
 
     @classmethod
-    def font(cls, font_path, point_size):
-        if (font_path, point_size) not in cls.fonts:
-            cls.fonts[(font_path, point_size)] = ImageFont.truetype(
-                font_path, point_size
+    def cache_info(cls):
+        """
+        Return a (hits, misses, capacity, size) named tuple describing the
+        use of this cache since it was last cleared.
+        """
+        with cls._lock:
+            return _CacheInfo(
+                cls.hits, cls.misses, cls.capacity, len(cls._fonts)
             )
-        return cls.fonts[(font_path, point_size)]
 
+    @classmethod
+    def clear(cls):
+        """
+        Drop all cached fonts and reset the hit and miss counts, for example
+        to release memory in a long-lived process.
+        """
+        with cls._lock:
+            cls._fonts.clear()
+            cls.hits = cls.misses = 0
 
-def _rendered_size(text, point_size, font_file):
-    """
-    Return a (width, height) pair representing the size of *text* in English
-    Metric Units (EMU) when rendered at *point_size* in the font defined in
-    *font_file*.
-    """
-    emu_per_inch = 914400
-    px_per_inch = 72.0
+    @classmethod
+    def font(cls, font_path):
+        """
+        Return the |FontMetrics| object for the font file at *font_path*,
+        loading it on first use. The font file is read outside the lock, so
+        a slow load does not hold up other threads.
+        """
+        with cls._lock:
+            entry = cls._fonts.get(font_path)
+            if entry is not None:
+                cls.hits += 1
+                cls._use(font_path, entry[1])
+                return entry[1]
+            cls.misses += 1
+
+        font = FontMetrics.load(font_path)
+
+        with cls._lock:
+            entry = cls._fonts.get(font_path)
+            if entry is not None:
+                font = entry[1]
+            cls._use(font_path, font)
+            cls._evict()
+        return font
+
+    @classmethod
+    def set_capacity(cls, capacity):
+        """
+        Change the number of fonts this cache holds to *capacity*, at least
+        1, dropping the least recently used fonts if it now holds more.
+        """
+        with cls._lock:
+            cls.capacity = max(int(capacity), 1)
+            cls._evict()
 
-    font = _Fonts.font(font_file, point_size)
-    px_width, px_height = font.getsize(text)
+    @classmethod
+    def _evict(cls):
+        """
+        Drop the least recently used fonts until no more than
+        :attr:`capacity` remain. Called with the lock held.
+        """
+        fonts = cls._fonts
+        while len(fonts) > max(cls.capacity, 1):
+            del fonts[min(fonts, key=lambda font_path: fonts[font_path][0])]
 
-    emu_width = int(px_width / px_per_inch * emu_per_inch)
-    emu_height = int(px_height / px_per_inch * emu_per_inch)
+    @classmethod
+    def _use(cls, font_path, font):
+        """
+        Record *font* as the most recently used, cached under *font_path*.
+        Called with the lock held.
+        """
+        cls._tick += 1
+        cls._fonts[font_path] = (cls._tick, font)
 
-    return emu_width, emu_height
+
+_CacheInfo = namedtuple('_CacheInfo', 'hits misses capacity size')
+
+
+def _best_fit_job(cls_and_job):
+    """
+    Return the best-fit font size for a job, from a (cls, job) pair where
+    *cls* is the fitter class and *job* is a tuple of the arguments to its
+    `best_fit_font_size()` method. A module-level function so it can be sent
+    to a worker process.
+    """
+    cls, job = cls_and_job
+    return cls.best_fit_font_size(*job)
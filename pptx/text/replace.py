@@ -0,0 +1,167 @@
+# encoding: utf-8
+
+"""
+TextReplacer and related objects, for replacing text in bulk throughout the
+parts of a presentation.
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import re
+
+from bisect import bisect_right
+from multiprocessing import Pool
+
+from lxml import etree
+
+from ..oxml.ns import namespaces, qn
+
+
+class TextReplacer(object):
+    """
+    Service object that replaces text in the ``<a:t>`` elements of parts in
+    bulk, without constructing text frame, paragraph, or run objects. All
+    the search strings are matched in a single pass by one compiled regular
+    expression, the longest taking precedence where several match at the
+    same place. The text of each line of a paragraph is matched as a whole,
+    so a search string split across runs, as PowerPoint often leaves text
+    that has been edited, is still found. A replacement takes on the
+    formatting of the run in which its match starts.
+    """
+    _text_nodes = etree.XPath(
+        'descendant-or-self::a:p/*[self::a:r or self::a:fld]/a:t'
+        ' | descendant-or-self::a:p/a:br',
+        namespaces=namespaces('a')
+    )
+
+    def __init__(self, replacements):
+        super(TextReplacer, self).__init__()
+        self._replacements = dict(replacements)
+        if '' in self._replacements:
+            raise ValueError('search text must not be empty')
+        search_texts = sorted(self._replacements, key=len, reverse=True)
+        self._pattern = re.compile(
+            '|'.join(re.escape(text) for text in search_texts)
+        ) if search_texts else None
+
+    @classmethod
+    def from_tokens(cls, values, start='{{', end='}}'):
+        """
+        Return a |TextReplacer| object that substitutes the value in the
+        mapping *values* for each token formed from a key in *values*
+        enclosed by *start* and *end*, e.g. ``'{{name}}'``. A value that is
+        not a string is converted to one.
+        """
+        return cls(
+            ('%s%s%s' % (start, name, end), '%s' % value)
+            for name, value in values.items()
+        )
+
+    def replace_in_parts(self, parts, processes=None):
+        """
+        Replace text in each of the XML parts in *parts* and return the
+        number of replacements made. The XML of each part is searched once
+        for the elements containing its text. When *processes* is a positive
+        integer, the matching is divided among a pool of that many worker
+        processes, only the text itself being sent to each worker; as for
+        any use of :mod:`multiprocessing`, the main module must then be
+        protected by an ``if __name__ == '__main__':`` guard on platforms
+        that spawn worker processes.
+        """
+        if self._pattern is None:
+            return 0
+        node_groups = [self._text_node_groups(part._element) for part in parts]
+        jobs = [
+            (self, [[t.text or '' for t in group] for group in groups])
+            for groups in node_groups
+        ]
+        if processes:
+            pool = Pool(processes)
+            try:
+                chunksize = max(1, len(jobs) // (processes * 4))
+                results = pool.map(_replace_job, jobs, chunksize)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            results = [_replace_job(job) for job in jobs]
+
+        count = 0
+        for groups, result in zip(node_groups, results):
+            for group, new_texts in zip(groups, result):
+                if new_texts is None:
+                    continue
+                count += new_texts[0]
+                for t, text in zip(group, new_texts[1]):
+                    if (t.text or '') != text:
+                        t.text = text or None
+        return count
+
+    def _replace_texts(self, texts):
+        """
+        Return a (count, new_texts) pair for *texts*, the text of each of
+        the ``<a:t>`` elements of a line, where *new_texts* has the text of
+        each element after replacement and *count* is the number of
+        replacements made. Return |None| if there is nothing to replace.
+        """
+        text = ''.join(texts)
+        matches = list(self._pattern.finditer(text))
+        if not matches:
+            return None
+
+        ends, end = [], 0
+        for t_text in texts:
+            end += len(t_text)
+            ends.append(end)
+        pieces = [[] for _ in texts]
+
+        def copy(start, stop):
+            idx = bisect_right(ends, start)
+            while start < stop:
+                piece_end = min(ends[idx], stop)
+                pieces[idx].append(text[start:piece_end])
+                start, idx = piece_end, idx + 1
+
+        position = 0
+        for match in matches:
+            copy(position, match.start())
+            owner_idx = bisect_right(ends, match.start())
+            pieces[owner_idx].append(self._replacements[match.group(0)])
+            position = match.end()
+        copy(position, len(text))
+
+        return len(matches), [''.join(piece) for piece in pieces]
+
+    @classmethod
+    def _text_node_groups(cls, element):
+        """
+        Return a list containing, for each line of each paragraph under
+        *element*, the list of its ``<a:t>`` elements in document order. A
+        line ends at a line break or at the end of its paragraph.
+        """
+        br_tag = qn('a:br')
+        groups, group, p = [], [], None
+        for node in cls._text_nodes(element):
+            is_br = node.tag == br_tag
+            node_p = (
+                node.getparent() if is_br else node.getparent().getparent()
+            )
+            if is_br or node_p is not p:
+                if group:
+                    groups.append(group)
+                group, p = [], node_p
+            if not is_br:
+                group.append(node)
+        if group:
+            groups.append(group)
+        return groups
+
+
+def _replace_job(job):
+    """
+    Return a list containing the result of replacing text in each line of
+    a part, from *job*, a (replacer, line_texts) pair. A module-level
+    function so it can be sent to a worker process.
+    """
+    replacer, line_texts = job
+    return [replacer._replace_texts(texts) for texts in line_texts]
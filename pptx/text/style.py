@@ -0,0 +1,250 @@
+# encoding: utf-8
+
+"""
+TextStyleResolver and related objects, for computing the effective character
+properties of text from the style hierarchy of a presentation.
+"""
+
+from __future__ import absolute_import, print_function
+
+from ..enum.shapes import PP_PLACEHOLDER
+from ..opc.constants import RELATIONSHIP_TYPE as RT
+from ..oxml import parse_xml
+from ..oxml.ns import qn
+from ..util import Centipoints
+
+
+class EffectiveFont(tuple):
+    """
+    Immutable value object holding the effective character properties of
+    a run of text, as determined by its style hierarchy. A property is
+    |None| only when no level of the hierarchy specifies it.
+    """
+    def __new__(cls, name, size, bold, italic):
+        return tuple.__new__(cls, (name, size, bold, italic))
+
+    @property
+    def bold(self):
+        """
+        |True| if the text is bold, |False| if it is explicitly not bold.
+        """
+        return self[2]
+
+    @property
+    def italic(self):
+        """
+        |True| if the text is italic, |False| if it is explicitly not
+        italic.
+        """
+        return self[3]
+
+    @property
+    def name(self):
+        """
+        The typeface name of the text, e.g. 'Calibri'. A reference to
+        a theme font, such as '+mn-lt', is resolved to the typeface it
+        names when the theme can be found.
+        """
+        return self[0]
+
+    @property
+    def size(self):
+        """
+        |Length| value of the font height, e.g. ``Pt(18)``.
+        """
+        return self[1]
+
+
+class TextStyleResolver(object):
+    """
+    Computes the effective character properties of runs of text on slides by
+    walking the style hierarchy: run, paragraph, shape list style, layout
+    placeholder, master placeholder, master text styles, and finally the
+    presentation default text style. The part of the walk above the shape
+    depends only on the slide layout, the placeholder, and the paragraph
+    level, so it is computed once for each such combination and remembered,
+    making each subsequent lookup a handful of attribute reads. The
+    remembered styles are not updated when a layout or master is changed;
+    call :meth:`clear` after making such a change.
+    """
+    def __init__(self):
+        super(TextStyleResolver, self).__init__()
+        self._inherited_styles = {}
+        self._theme_fonts = {}
+
+    def clear(self):
+        """
+        Forget all remembered styles, so they are recomputed on next use.
+        """
+        self._inherited_styles.clear()
+        self._theme_fonts.clear()
+
+    def font(self, run):
+        """
+        Return an |EffectiveFont| object containing the effective character
+        properties of |_Run| object *run*.
+        """
+        return self.font_of_element(run._r, run.part)
+
+    def font_of_element(self, r, part):
+        """
+        Return an |EffectiveFont| object containing the effective character
+        properties of *r*, an ``<a:r>`` or ``<a:fld>`` element in slide
+        *part*. Allows runs to be resolved without constructing a |_Run|
+        object for each.
+        """
+        p = r.getparent()
+        txBody = p.getparent()
+        pPr = p.pPr
+        level = 0 if pPr is None else pPr.lvl
+
+        style = dict(self._inherited_style(part, txBody.getparent(), level))
+        for rPr in (
+                self._lvl_defRPr(txBody.find(qn('a:lstStyle')), level),
+                None if pPr is None else pPr.defRPr,
+                r.rPr):
+            style.update(self._rPr_style(rPr))
+
+        name = style.get('name')
+        if name is not None and name.startswith('+'):
+            name = self._theme_fonts_for(part).get(name[1:3], name)
+        return EffectiveFont(
+            name, style.get('size'), style.get('bold'), style.get('italic')
+        )
+
+    def _inherited_style(self, part, shape_elm, level):
+        """
+        Return a dict containing the character properties inherited at
+        paragraph *level* by text in *shape_elm* on slide *part*, from its
+        layout, master, and the presentation defaults. The dict is computed
+        on first use and remembered.
+        """
+        layout = getattr(part, 'slide_layout', None)
+        ph = getattr(shape_elm, 'ph', None)
+        ph_idx = None if ph is None else ph.idx
+        ph_type = None if ph is None else ph.type
+        key = (layout, ph_idx, ph_type, level)
+
+        style = self._inherited_styles.get(key)
+        if style is None:
+            style = {}
+            list_styles = self._inherited_list_styles(
+                part, layout, ph_idx, ph_type
+            )
+            for list_style in reversed(list_styles):
+                style.update(
+                    self._rPr_style(self._lvl_defRPr(list_style, level))
+                )
+            self._inherited_styles[key] = style
+        return style
+
+    @staticmethod
+    def _inherited_list_styles(part, layout, ph_idx, ph_type):
+        """
+        Return a list of the list-style elements, such as ``<a:lstStyle>``,
+        that text in a shape on *part* inherits from, nearest first. The
+        shape is a placeholder when *ph_type* is not |None|.
+        """
+        list_styles = []
+        if ph_type is not None and layout is not None:
+            layout_ph = layout.placeholders.get(idx=ph_idx)
+            master_ph = None
+            if layout_ph is not None:
+                list_styles.append(_lstStyle(layout_ph._element))
+                master_ph = layout_ph._master_placeholder
+            if master_ph is not None:
+                list_styles.append(_lstStyle(master_ph._element))
+            txStyles = layout.slide_master._element.find(qn('p:txStyles'))
+            if txStyles is not None:
+                list_styles.append(txStyles.find(qn(
+                    _txStyles_tagname.get(ph_type, 'p:bodyStyle')
+                )))
+        presentation = part.package.presentation
+        list_styles.append(
+            presentation._element.find(qn('p:defaultTextStyle'))
+        )
+        return list_styles
+
+    @staticmethod
+    def _lvl_defRPr(list_style, level):
+        """
+        Return the ``<a:defRPr>`` element for paragraph *level* in
+        *list_style*, or |None| if it has none.
+        """
+        if list_style is None:
+            return None
+        lvl_pPr = list_style.find(qn('a:lvl%dpPr' % (level + 1)))
+        if lvl_pPr is None:
+            return None
+        return lvl_pPr.find(qn('a:defRPr'))
+
+    @staticmethod
+    def _rPr_style(rPr):
+        """
+        Return a dict containing the character properties specified by
+        *rPr*, a ``<a:rPr>`` or ``<a:defRPr>`` element, or an empty dict if
+        *rPr* is |None|.
+        """
+        style = {}
+        if rPr is None:
+            return style
+        if rPr.sz is not None:
+            style['size'] = Centipoints(rPr.sz)
+        if rPr.b is not None:
+            style['bold'] = rPr.b
+        if rPr.i is not None:
+            style['italic'] = rPr.i
+        latin = rPr.latin
+        if latin is not None and latin.typeface:
+            style['name'] = latin.typeface
+        return style
+
+    def _theme_fonts_for(self, part):
+        """
+        Return a dict mapping 'mj' and 'mn' to the major and minor latin
+        typefaces of the theme of the slide master of *part*, empty if it
+        has none. Remembered for each slide master.
+        """
+        layout = getattr(part, 'slide_layout', None)
+        if layout is None:
+            return {}
+        slide_master = layout.slide_master
+        theme_fonts = self._theme_fonts.get(slide_master)
+        if theme_fonts is None:
+            theme_fonts = self._theme_fonts[slide_master] = {}
+            try:
+                theme_part = slide_master.part_related_by(RT.THEME)
+            except KeyError:
+                return theme_fonts
+            fontScheme = parse_xml(theme_part.blob).find(
+                '%s/%s' % (qn('a:themeElements'), qn('a:fontScheme'))
+            )
+            if fontScheme is None:
+                return theme_fonts
+            for key, tagname in (('mj', 'majorFont'), ('mn', 'minorFont')):
+                latin = fontScheme.find(
+                    '%s/%s' % (qn('a:%s' % tagname), qn('a:latin'))
+                )
+                if latin is not None:
+                    theme_fonts[key] = latin.get('typeface')
+        return theme_fonts
+
+
+def _lstStyle(shape_elm):
+    """
+    Return the ``<a:lstStyle>`` element of the text body of *shape_elm*, or
+    |None| if it has none.
+    """
+    txBody = shape_elm.txBody
+    if txBody is None:
+        return None
+    return txBody.find(qn('a:lstStyle'))
+
+
+_txStyles_tagname = {
+    PP_PLACEHOLDER.CENTER_TITLE: 'p:titleStyle',
+    PP_PLACEHOLDER.TITLE:        'p:titleStyle',
+    PP_PLACEHOLDER.DATE:         'p:otherStyle',
+    PP_PLACEHOLDER.FOOTER:       'p:otherStyle',
+    PP_PLACEHOLDER.SLIDE_NUMBER: 'p:otherStyle',
+}
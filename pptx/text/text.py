@@ -11,7 +11,7 @@ from ..dml.fill import FillFormat
 from ..enum.dml import MSO_FILL
 from ..enum.text import MSO_AUTO_SIZE, MSO_UNDERLINE
 from .fonts import FontFiles
-from .layout import TextFitter
+from .layout import ParagraphFitter
 from ..opc.constants import RELATIONSHIP_TYPE as RT
 from ..oxml.simpletypes import ST_TextWrappingType
 from ..shapes import Subshape
@@ -67,18 +67,69 @@ class TextFrame(Subshape):
         shape by setting word wrap on and applying the "best-fit" font size
         to all the text it contains. :attr:`TextFrame.auto_size` is set to
         :attr:`MSO_AUTO_SIZE.NONE`. The font size will not be set larger than
-        *max_size* points. If the path to a matching TrueType font is
-        provided as *font_file*, that font file will be used for the font
-        metrics. If *font_file* is |None|, best efforts are made to locate
-        a font file with mathching *font_family*, *bold*, and *italic*
-        installed on the current system (usually succeeds if the font is
-        installed).
+        *max_size* points and is a whole or half point size. Each paragraph
+        and line break starts a new line, and the line spacing and space
+        before and after of each paragraph is taken into account. If the path
+        to a matching TrueType font is provided as *font_file*, that font
+        file will be used for the font metrics. If *font_file* is |None|,
+        best efforts are made to locate a font file with mathching
+        *font_family*, *bold*, and *italic* installed on the current system
+        (usually succeeds if the font is installed). Additional directories
+        to search can be added with
+        ``pptx.text.fonts.FontFiles.add_directory()``. The metrics of each
+        font file are loaded once and held in
+        ``pptx.text.layout.FontMetricsCache``, which can be sized and
+        cleared. Raises |ValueError|, leaving the text frame unchanged, if
+        the text does not fit even at the smallest size, as when a word is
+        wider than the text frame.
         """
         font_size = self._best_fit_font_size(
             font_family, max_size, bold, italic, font_file
         )
+        if font_size is None:
+            raise ValueError(
+                'text does not fit in text frame at any size up to %s pt'
+                % max_size
+            )
         self._apply_fit(font_family, font_size, bold, italic)
 
+    @classmethod
+    def fit_text_frames(
+            cls, text_frames, font_family='Calibri', max_size=18,
+            bold=False, italic=False, font_file=None, processes=None):
+        """
+        Like :meth:`fit_text`, but fits each of the text frames in
+        *text_frames* in a single operation, for example when auto-fitting
+        the text boxes of a generated presentation. The font file is located
+        once and its metrics are shared by all the text frames, and text
+        frames having the same text and extents are fitted only once. When
+        *processes* is a positive integer, the fitting is divided among
+        a pool of that many worker processes; as for any use of
+        :mod:`multiprocessing`, the main module must then be protected by
+        an ``if __name__ == '__main__':`` guard on platforms that spawn
+        worker processes. Raises |ValueError|, leaving all the text frames
+        unchanged, if the text of any of them does not fit even at the
+        smallest size.
+        """
+        text_frames = list(text_frames)
+        if font_file is None:
+            font_file = FontFiles.find(font_family, bold, italic)
+        jobs = [
+            (
+                text_frame._fit_paragraphs, text_frame._extents, max_size,
+                font_file
+            )
+            for text_frame in text_frames
+        ]
+        font_sizes = ParagraphFitter.best_fit_font_sizes(jobs, processes)
+        if None in font_sizes:
+            raise ValueError(
+                'text of text frame %d does not fit at any size up to %s pt'
+                % (font_sizes.index(None), max_size)
+            )
+        for text_frame, font_size in zip(text_frames, font_sizes):
+            text_frame._apply_fit(font_family, font_size, bold, italic)
+
     @property
     def margin_bottom(self):
         """
@@ -210,16 +261,16 @@ class TextFrame(Subshape):
 
     def _best_fit_font_size(self, family, max_size, bold, italic, font_file):
         """
-        Return the largest integer point size not greater than *max_size*
-        that allows all the text in this text frame to fit inside its extents
+        Return the largest half-point size not greater than *max_size* that
+        allows all the text in this text frame to fit inside its extents
         when rendered using the font described by *family*, *bold*, and
         *italic*. If *font_file* is specified, it is used to calculate the
         fit, whether or not it matches *family*, *bold*, and *italic*.
         """
         if font_file is None:
             font_file = FontFiles.find(family, bold, italic)
-        return TextFitter.best_fit_font_size(
-            self.text, self._extents, max_size, font_file
+        return ParagraphFitter.best_fit_font_size(
+            self._fit_paragraphs, self._extents, max_size, font_file
         )
 
     @property
@@ -237,6 +288,20 @@ class TextFrame(Subshape):
             self._parent.height - self.margin_top - self.margin_bottom
         )
 
+    @property
+    def _fit_paragraphs(self):
+        """
+        A tuple containing a (text, line_spacing, space_before, space_after)
+        tuple for each paragraph in this text frame, the form in which
+        paragraphs are fitted by |ParagraphFitter|. The text of a paragraph
+        is that of all its runs and fields, so a word split across runs is
+        measured as a single word.
+        """
+        return tuple(
+            (p.text, p.line_spacing, p.space_before, p.space_after)
+            for p in self.paragraphs
+        )
+
     def _set_font(self, family, size, bold, italic):
         """
         Set the font properties of all the text in this text frame to
@@ -0,0 +1,99 @@
+# encoding: utf-8
+
+"""
+FontUsageAnalyzer and related objects, for reporting which fonts and glyphs
+the text of a presentation uses.
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+from lxml import etree
+
+from ..oxml.ns import namespaces
+from .style import TextStyleResolver
+
+
+class FontUsage(tuple):
+    """
+    Immutable value object describing the use of one font by the text of
+    a presentation.
+    """
+    def __new__(cls, name, glyphs, character_count):
+        return tuple.__new__(cls, (name, glyphs, character_count))
+
+    @property
+    def character_count(self):
+        """
+        Number of characters of text set in this font, counting repeats.
+        """
+        return self[2]
+
+    @property
+    def glyphs(self):
+        """
+        Frozenset of the distinct characters set in this font, the glyphs
+        a subset of the font would need to contain.
+        """
+        return self[1]
+
+    @property
+    def name(self):
+        """
+        Typeface name of this font, e.g. 'Calibri', or |None| for text
+        whose font is not specified anywhere in its style hierarchy.
+        """
+        return self[0]
+
+
+class FontUsageAnalyzer(object):
+    """
+    Service object that collects the fonts used by the text in XML parts in
+    a single pass over the runs of each part, without constructing text
+    frame, paragraph, or run objects. A run with an explicit typeface in its
+    ``<a:rPr>`` is attributed to that font directly; otherwise its font is
+    looked up with a |TextStyleResolver|, which remembers the fonts
+    inherited from layouts and masters.
+    """
+    _runs = etree.XPath(
+        'descendant-or-self::a:p/*[self::a:r or self::a:fld]',
+        namespaces=namespaces('a')
+    )
+
+    def __init__(self, resolver=None):
+        super(FontUsageAnalyzer, self).__init__()
+        self._resolver = (
+            TextStyleResolver() if resolver is None else resolver
+        )
+
+    def analyze(self, parts):
+        """
+        Return a dict mapping each typeface name used by the text in
+        *parts* to a |FontUsage| object describing its use.
+        """
+        glyphs, counts = {}, {}
+        for part in parts:
+            for r in self._runs(part._element):
+                text = r.text
+                if not text:
+                    continue
+                name = self._font_name(r, part)
+                if name not in glyphs:
+                    glyphs[name], counts[name] = set(), 0
+                glyphs[name].update(text)
+                counts[name] += len(text)
+        return dict(
+            (name, FontUsage(name, frozenset(glyphs[name]), counts[name]))
+            for name in glyphs
+        )
+
+    def _font_name(self, r, part):
+        """
+        Return the typeface name of the font of run element *r* in *part*.
+        """
+        rPr = r.rPr
+        latin = None if rPr is None else rPr.latin
+        if latin is not None:
+            typeface = latin.typeface
+            if typeface and not typeface.startswith('+'):
+                return typeface
+        return self._resolver.font_of_element(r, part).name
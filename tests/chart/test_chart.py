@@ -12,10 +12,12 @@ from pptx.chart.axis import CategoryAxis, ValueAxis
 from pptx.chart.chart import Chart, Legend, _Plots, _SeriesRewriter
 from pptx.chart.data import ChartData, _SeriesData
 from pptx.chart.plot import Plot
-from pptx.chart.series import SeriesCollection
+from pptx.chart.series import SeriesCollection, SeriesIndex
 from pptx.enum.base import EnumValue
+from pptx.enum.chart import XL_CHART_TYPE
 from pptx.oxml import parse_xml
 from pptx.oxml.chart.chart import CT_ChartSpace
+from pptx.oxml.chart.plot import BaseChartElement
 from pptx.oxml.chart.series import CT_SeriesComposite
 from pptx.parts.chart import ChartPart
 
@@ -51,15 +53,17 @@ class DescribeChart(object):
             chart.value_axis
 
     def it_provides_access_to_its_series(self, series_fixture):
-        chart, SeriesCollection_, chartSpace_, series_ = series_fixture
+        chart, SeriesCollection_, chartSpace_, series_index_, series_ = (
+            series_fixture
+        )
         series = chart.series
-        SeriesCollection_.assert_called_once_with(chartSpace_)
+        SeriesCollection_.assert_called_once_with(chartSpace_, series_index_)
         assert series is series_
 
     def it_provides_access_to_its_plots(self, plots_fixture):
-        chart, plots_, _Plots_, plotArea = plots_fixture
+        chart, plots_, _Plots_, plotArea, series_index_ = plots_fixture
         plots = chart.plots
-        _Plots_.assert_called_once_with(plotArea, chart)
+        _Plots_.assert_called_once_with(plotArea, chart, series_index_)
         assert plots is plots_
 
     def it_knows_whether_it_has_a_legend(self, has_legend_get_fixture):
@@ -98,11 +102,79 @@ class DescribeChart(object):
         )
         chart.replace_data(chart_data_)
         _SeriesRewriter_.replace_series_data.assert_called_once_with(
-            chartSpace_, chart_data_
+            chartSpace_, chart_data_, chart._chart_part.series_index
+        )
+        workbook_.update_from_xlsx_blob.assert_called_once_with(
+            chart_data_.xlsx_blob
+        )
+
+    def it_can_extract_the_values_of_all_its_series(self, values_fixture):
+        chart, expected_value = values_fixture
+        series_values = chart.series_values()
+        assert [
+            (name, list(values)) for name, values in series_values
+        ] == expected_value
+
+    def it_can_update_the_chart_data(self, update_data_fixture):
+        chart, chart_data_, _SeriesRewriter_, chartSpace_ = (
+            update_data_fixture[:4]
+        )
+        workbook_, cells_ = update_data_fixture[4:]
+
+        chart.update_data(chart_data_)
+
+        _SeriesRewriter_.update_series_data.assert_called_once_with(
+            chartSpace_, chart_data_, chart._chart_part.series_index
+        )
+        workbook_.update_cells.assert_called_once_with(
+            cells_, {3: '0.0%'}
+        )
+
+    def but_it_adds_a_workbook_on_update_when_there_is_none(
+            self, update_data_fixture):
+        chart, chart_data_, workbook_ = (
+            update_data_fixture[0], update_data_fixture[1],
+            update_data_fixture[4]
+        )
+        workbook_.xlsx_part = None
+
+        chart.update_data(chart_data_)
+
+        workbook_.update_from_xlsx_blob.assert_called_once_with(
+            chart_data_.xlsx_blob
+        )
+        assert workbook_.update_cells.call_count == 0
+
+    def and_it_rewrites_the_workbook_for_decimated_data(
+            self, update_data_fixture):
+        chart, chart_data_, workbook_ = (
+            update_data_fixture[0], update_data_fixture[1],
+            update_data_fixture[4]
         )
+        chart_data_.source_indices = (0, 7, 9)
+
+        chart.update_data(chart_data_)
+
         workbook_.update_from_xlsx_blob.assert_called_once_with(
             chart_data_.xlsx_blob
         )
+        assert workbook_.update_cells.call_count == 0
+
+    def and_it_rewrites_the_workbook_replacing_decimated_data(
+            self, update_data_fixture):
+        chart, chart_data_, workbook_ = (
+            update_data_fixture[0], update_data_fixture[1],
+            update_data_fixture[4]
+        )
+        workbook_.can_update_cells.return_value = False
+
+        chart.update_data(chart_data_)
+
+        workbook_.can_update_cells.assert_called_once_with(2)
+        workbook_.update_from_xlsx_blob.assert_called_once_with(
+            chart_data_.xlsx_blob
+        )
+        assert workbook_.update_cells.call_count == 0
 
     # fixtures -------------------------------------------------------
 
@@ -159,11 +231,12 @@ class DescribeChart(object):
         return chart, Legend_, expected_calls, expected_value
 
     @pytest.fixture
-    def plots_fixture(self, _Plots_, plots_):
+    def plots_fixture(self, _Plots_, plots_, chart_part_):
         chartSpace = element('c:chartSpace/c:chart/c:plotArea')
         plotArea = chartSpace.xpath('./c:chart/c:plotArea')[0]
-        chart = Chart(chartSpace, None)
-        return chart, plots_, _Plots_, plotArea
+        chart = Chart(chartSpace, chart_part_)
+        series_index_ = chart_part_.series_index
+        return chart, plots_, _Plots_, plotArea, series_index_
 
     @pytest.fixture
     def replace_data_fixture(
@@ -176,9 +249,14 @@ class DescribeChart(object):
 
     @pytest.fixture
     def series_fixture(
-            self, SeriesCollection_, chartSpace_, series_collection_):
-        chart = Chart(chartSpace_, None)
-        return chart, SeriesCollection_, chartSpace_, series_collection_
+            self, SeriesCollection_, chartSpace_, chart_part_,
+            series_collection_):
+        chart = Chart(chartSpace_, chart_part_)
+        series_index_ = chart_part_.series_index
+        return (
+            chart, SeriesCollection_, chartSpace_, series_index_,
+            series_collection_
+        )
 
     @pytest.fixture(params=[
         ('c:chartSpace/c:style{val=42}', 42),
@@ -201,6 +279,37 @@ class DescribeChart(object):
         expected_xml = xml(expected_chartSpace_cxml)
         return chart, new_value, expected_xml
 
+    @pytest.fixture
+    def update_data_fixture(
+            self, chartSpace_, chart_part_, chart_data_, _SeriesRewriter_):
+        chart = Chart(chartSpace_, chart_part_)
+        workbook_ = chart_part_.chart_workbook
+        cells_ = [(1, 1, 42.0)]
+        chart_data_.source_indices = None
+        chart_data_.series = [
+            _SeriesData(idx, 'S%d' % idx, (1.0,), None, number_format)
+            for idx, number_format in enumerate(('0.0', '0.00', '0.0%'))
+        ]
+        chart_part_.series_index.sers = ['ser', 'ser_2']
+        workbook_.can_update_cells.return_value = True
+        _SeriesRewriter_.update_series_data.return_value = cells_
+        return (
+            chart, chart_data_, _SeriesRewriter_, chartSpace_, workbook_,
+            cells_
+        )
+
+    @pytest.fixture
+    def values_fixture(self):
+        chart_data = ChartData()
+        chart_data.categories = ('Foo', 'Bar')
+        chart_data.add_series('S1', (1, 2))
+        chart_data.add_series('S2', (3.5, 4.5))
+        chartSpace = parse_xml(chart_data.xml_bytes(XL_CHART_TYPE.LINE))
+        chart_part = ChartPart(None, None, chartSpace)
+        chart = Chart(chartSpace, chart_part)
+        expected_value = [('S1', [1.0, 2.0]), ('S2', [3.5, 4.5])]
+        return chart, expected_value
+
     @pytest.fixture
     def val_ax_fixture(self, ValueAxis_, value_axis_):
         chartSpace = element('c:chartSpace/c:chart/c:plotArea/c:valAx')
@@ -313,6 +422,12 @@ class Describe_Plots(object):
         plots, expected_len = len_fixture
         assert len(plots) == expected_len
 
+    def it_uses_a_series_index_when_it_has_one(self, index_fixture):
+        plots, PlotFactory_, xChart_, chart_ = index_fixture
+        plots[0]
+        assert len(plots) == 1
+        PlotFactory_.assert_called_once_with(xChart_, chart_)
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture(params=[
@@ -326,6 +441,13 @@ class Describe_Plots(object):
         plots = _Plots(plotArea, chart_)
         return plots, idx, PlotFactory_, plot_elm, chart_, plot_
 
+    @pytest.fixture
+    def index_fixture(self, request, PlotFactory_, chart_):
+        xChart_ = instance_mock(request, BaseChartElement)
+        series_index_ = instance_mock(request, SeriesIndex, xCharts=[xChart_])
+        plots = _Plots(None, chart_, series_index_)
+        return plots, PlotFactory_, xChart_, chart_
+
     @pytest.fixture(params=[
         ('c:plotArea',                          0),
         ('c:plotArea/c:barChart',               1),
@@ -356,24 +478,33 @@ class Describe_Plots(object):
 class Describe_SeriesRewriter(object):
 
     def it_can_replace_the_sers_in_a_chartSpace(self, replace_fixture):
-        chartSpace_, chart_data_, series_count, expected_calls = (
-            replace_fixture
+        chartSpace_, chart_data_, series_index_, series_count = (
+            replace_fixture[:4]
         )
+        expected_calls = replace_fixture[4]
 
-        _SeriesRewriter.replace_series_data(chartSpace_, chart_data_)
+        _SeriesRewriter.replace_series_data(
+            chartSpace_, chart_data_, series_index_
+        )
 
         _SeriesRewriter._adjust_ser_count.assert_called_once_with(
-            chartSpace_, series_count
+            chartSpace_, series_count, series_index_
         )
         assert _SeriesRewriter._rewrite_ser_data.call_args_list == (
             expected_calls
         )
+        series_index_.invalidate.assert_called_once_with()
 
     def it_can_change_the_number_of_sers_in_a_chartSpace(
             self, adjust_fixture):
         chartSpace, new_ser_count, expected_xml = adjust_fixture
-        _SeriesRewriter._adjust_ser_count(chartSpace, new_ser_count)
+        series_index = SeriesIndex(chartSpace)
+        sers = _SeriesRewriter._adjust_ser_count(
+            chartSpace, new_ser_count, series_index
+        )
         assert chartSpace.xml == expected_xml
+        assert sers == chartSpace.sers
+        assert series_index.sers == chartSpace.sers
 
     def it_rewrites_ser_data_to_help_replace_series_data(
             self, rewrite_ser_fixture):
@@ -381,6 +512,27 @@ class Describe_SeriesRewriter(object):
         _SeriesRewriter._rewrite_ser_data(ser, series_data)
         assert ser.xml == expected_xml
 
+    def it_can_update_the_sers_in_a_chartSpace_in_place(
+            self, update_fixture):
+        chartSpace, chart_data, expected_values, expected_cells = (
+            update_fixture
+        )
+        pt = chartSpace.xpath('.//c:ser[1]/c:val//c:pt')[0]
+
+        cells = _SeriesRewriter.update_series_data(chartSpace, chart_data)
+
+        assert [ser.val_pts[-1].value for ser in chartSpace.sers] == (
+            expected_values
+        )
+        assert chartSpace.xpath('.//c:ser[1]/c:val//c:pt')[0] is pt
+        assert cells == expected_cells
+
+    def it_edits_only_the_pts_that_changed(self, update_pts_fixture):
+        ser, cache, texts, expected_idxs, expected_xml = update_pts_fixture
+        changed_idxs = _SeriesRewriter._update_pts(cache, texts)
+        assert changed_idxs == expected_idxs
+        assert ser.xml == expected_xml
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture(params=[
@@ -403,7 +555,7 @@ class Describe_SeriesRewriter(object):
 
     @pytest.fixture
     def replace_fixture(
-            self, chartSpace_, chart_data_, _adjust_ser_count_,
+            self, chartSpace_, chart_data_, series_index_, _adjust_ser_count_,
             _rewrite_ser_data_, ser_, ser_2_, series_data_, series_data_2_):
         _adjust_ser_count_.return_value = [ser_, ser_2_]
         series_count = 2
@@ -411,7 +563,52 @@ class Describe_SeriesRewriter(object):
             call(ser_,   series_data_),
             call(ser_2_, series_data_2_)
         ]
-        return chartSpace_, chart_data_, series_count, expected_calls
+        return (
+            chartSpace_, chart_data_, series_index_, series_count,
+            expected_calls
+        )
+
+    @pytest.fixture(params=[
+        # one value changed
+        ((('S1', (1, 7)), ('S2', (3, 4))), [7.0, 4.0], [(2, 1, 7)]),
+        # a point added to each series
+        ((('S1', (1, 2, 5)), ('S2', (3, 4, 6))), [5.0, 6.0],
+         [(3, 0, 'Baz'), (3, 1, 5), (3, 2, 6)]),
+        # a series removed and its name changed
+        ((('S9', (1, 2)),), [2.0],
+         [(0, 1, 'S9'), (0, 2, None), (1, 2, None), (2, 2, None)]),
+    ])
+    def update_fixture(self, request):
+        series, expected_values, expected_cells = request.param
+        old_data = ChartData()
+        old_data.categories = ('Foo', 'Bar')
+        old_data.add_series('S1', (1, 2))
+        old_data.add_series('S2', (3, 4))
+        chartSpace = parse_xml(old_data.xml_bytes(XL_CHART_TYPE.LINE))
+        chart_data = ChartData()
+        chart_data.categories = ('Foo', 'Bar', 'Baz')[:len(series[0][1])]
+        for name, values in series:
+            chart_data.add_series(name, values)
+        return chartSpace, chart_data, expected_values, expected_cells
+
+    @pytest.fixture(params=[
+        ('c:numCache/(c:ptCount{val=2},c:pt{idx=0}/c:v"1",c:pt{idx=1}/c:v'
+         '"2")', ['1', '3'], [1],
+         'c:numCache/(c:ptCount{val=2},c:pt{idx=0}/c:v"1",c:pt{idx=1}/c:v'
+         '"3")'),
+        ('c:numCache/(c:ptCount{val=1},c:pt{idx=0}/c:v"1")', ['1', '2'], [1],
+         'c:numCache/(c:ptCount{val=2},c:pt{idx=0}/c:v"1",c:pt{idx=1}/c:v'
+         '"2")'),
+        ('c:numCache/(c:ptCount{val=2},c:pt{idx=0}/c:v"1",c:pt{idx=1}/c:v'
+         '"2")', ['1'], [],
+         'c:numCache/(c:ptCount{val=1},c:pt{idx=0}/c:v"1")'),
+    ])
+    def update_pts_fixture(self, request):
+        cache_cxml, texts, expected_idxs, expected_cxml = request.param
+        ser = element('c:ser/c:val/c:numRef/%s' % cache_cxml)
+        cache = ser.xpath('./c:val/c:numRef/c:numCache')[0]
+        expected_xml = xml('c:ser/c:val/c:numRef/%s' % expected_cxml)
+        return ser, cache, texts, expected_idxs, expected_xml
 
     @pytest.fixture
     def rewrite_ser_fixture(self):
@@ -440,6 +637,10 @@ class Describe_SeriesRewriter(object):
     def _rewrite_ser_data_(self, request):
         return method_mock(request, _SeriesRewriter, '_rewrite_ser_data')
 
+    @pytest.fixture
+    def series_index_(self, request):
+        return instance_mock(request, SeriesIndex)
+
     @pytest.fixture
     def ser_(self, request):
         return instance_mock(request, CT_SeriesComposite)
@@ -54,10 +54,30 @@ class DescribeChartData(object):
         categories, series_, xlsx_blob_ = xlsx_fixture[2:]
         xlsx_blob = chart_data.xlsx_blob
         WorkbookWriter_.xlsx_blob.assert_called_once_with(
-            categories, series_
+            categories, series_, None
         )
         assert xlsx_blob is xlsx_blob_
 
+    def it_can_decimate_its_data(self, decimate_fixture):
+        chart_data, Decimator_, expected_values = decimate_fixture[:3]
+        expected_categories, expected_source_indices = decimate_fixture[3:]
+
+        chart_data.decimate(3, 'minmax')
+
+        Decimator_.point_idxs.assert_called_once_with(
+            [(1, 2, 3, 4, 5), (6, 7, 8, 9)], 3, 'minmax'
+        )
+        assert chart_data.categories == expected_categories
+        assert [s.values for s in chart_data.series] == expected_values
+        assert chart_data.source_indices == expected_source_indices
+
+    def it_composes_the_source_indices_when_decimated_again(
+            self, decimate_fixture):
+        chart_data = decimate_fixture[0]
+        chart_data._source_idxs = (0, 10, 20, 30, 40)
+        chart_data.decimate(3, 'minmax')
+        assert chart_data.source_indices == (0, 20, 40)
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -69,6 +89,22 @@ class DescribeChartData(object):
         values = (1.1, 2.2, 3.3)
         return chart_data, name, values, _SeriesData_, series_data_
 
+    @pytest.fixture
+    def decimate_fixture(self, request):
+        chart_data = ChartData()
+        chart_data.categories = ('a', 'b', 'c', 'd')
+        chart_data.add_series('S1', (1, 2, 3, 4, 5))
+        chart_data.add_series('S2', (6, 7, 8, 9))
+        Decimator_ = class_mock(request, 'pptx.chart.data.Decimator')
+        Decimator_.point_idxs.return_value = [0, 2, 4]
+        expected_values = [[1, 3, 5], [6, 8]]
+        expected_categories = ('a', 'c')
+        expected_source_indices = (0, 2, 4)
+        return (
+            chart_data, Decimator_, expected_values, expected_categories,
+            expected_source_indices
+        )
+
     @pytest.fixture
     def categories_get_fixture(self, categories):
         chart_data = ChartData()
@@ -0,0 +1,73 @@
+# encoding: utf-8
+
+"""
+Test suite for pptx.chart.decimation module
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import pytest
+
+from pptx.chart.decimation import Decimator
+
+
+class DescribeDecimator(object):
+
+    def it_keeps_all_points_when_there_are_few_enough(self):
+        point_idxs = Decimator.point_idxs([(1, 2, 3), (4, 5)], 3)
+        assert point_idxs == [0, 1, 2]
+
+    def it_can_keep_every_nth_point(self):
+        point_idxs = Decimator.point_idxs([range(10)], 4, 'nth')
+        assert point_idxs == [0, 3, 6, 9]
+
+    def it_can_keep_the_min_and_max_in_each_bucket(self, minmax_fixture):
+        value_seqs, max_points, expected_value = minmax_fixture
+        point_idxs = Decimator.point_idxs(value_seqs, max_points, 'minmax')
+        assert point_idxs == expected_value
+
+    def it_can_keep_the_largest_triangle_in_each_bucket(self, lttb_fixture):
+        value_seqs, max_points, expected_value = lttb_fixture
+        point_idxs = Decimator.point_idxs(value_seqs, max_points)
+        assert point_idxs == expected_value
+
+    def it_raises_on_a_bad_method_or_point_count(self, raise_fixture):
+        method, max_points = raise_fixture
+        with pytest.raises(ValueError):
+            Decimator.point_idxs([range(10)], max_points, method)
+
+    def it_raises_when_too_few_points_for_minmax_of_each_series(self):
+        value_seqs = [range(i, i + 100) for i in range(10)]
+        assert len(Decimator.point_idxs(value_seqs, 20, 'minmax')) <= 20
+        with pytest.raises(ValueError):
+            Decimator.point_idxs(value_seqs, 19, 'minmax')
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        # one spike in each series, the second series shorter
+        ([(0, 0, 9, 0, 0, 0, 0, 0), (1, 1, 1, 1, -5)], 4, [0, 2, 4, 7]),
+        # missing values are ignored
+        ([(None, 3, 1, 2, None, None)], 4, [0, 1, 3, 5]),
+    ])
+    def lttb_fixture(self, request):
+        value_seqs, max_points, expected_value = request.param
+        return value_seqs, max_points, expected_value
+
+    @pytest.fixture(params=[
+        ([(3, 1, 4, 1, 5, 9, 2, 6)], 4, [1, 2, 5, 6]),
+        ([(3, 1, 4, 1, 5, 9, 2, 6), (0, 0, 0, 0, 0, 0, 0, 0)], 4,
+         [0, 1, 5, 7]),
+        ([(None, None, None, 1, 2)], 2, [3, 4]),
+    ])
+    def minmax_fixture(self, request):
+        value_seqs, max_points, expected_value = request.param
+        return value_seqs, max_points, expected_value
+
+    @pytest.fixture(params=[
+        ('foobar', 4),
+        ('lttb', 1),
+    ])
+    def raise_fixture(self, request):
+        method, max_points = request.param
+        return method, max_points
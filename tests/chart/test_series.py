@@ -8,15 +8,23 @@ from __future__ import absolute_import, print_function
 
 import pytest
 
+from array import array
+from math import isnan
+
 from pptx.chart.series import (
     BarSeries, _BaseSeries, LineSeries, PieSeries, SeriesCollection,
-    _SeriesFactory
+    _SeriesFactory, SeriesIndex
 )
 from pptx.dml.fill import FillFormat
 from pptx.dml.line import LineFormat
+from pptx.oxml.chart.chart import CT_ChartSpace
+from pptx.oxml.chart.series import CT_SeriesComposite
+from pptx.oxml.xmlchemy import BaseOxmlElement
 
 from ..unitutil.cxml import element, xml
-from ..unitutil.mock import class_mock, function_mock, instance_mock
+from ..unitutil.mock import (
+    call, class_mock, function_mock, instance_mock, method_mock
+)
 
 
 class Describe_BaseSeries(object):
@@ -33,6 +41,15 @@ class Describe_BaseSeries(object):
         series, expected_value = values_get_fixture
         assert series.values == expected_value
 
+    def it_provides_its_values_as_an_array(self, values_array_fixture):
+        series, expected_value = values_array_fixture
+        values_array = series.values_array
+        assert isinstance(values_array, array)
+        assert values_array.typecode == 'd'
+        assert [
+            None if isnan(value) else value for value in values_array
+        ] == expected_value
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -67,6 +84,26 @@ class Describe_BaseSeries(object):
         series = _BaseSeries(element(ser_cxml))
         return series, expected_value
 
+    @pytest.fixture(params=[
+        ('c:ser', []),
+        ('c:ser/c:val/c:numRef/c:numCache', []),
+        ('c:ser/c:val/c:numRef/c:numCache/(c:ptCount{val=3},c:pt{idx=1}/c:v'
+         '"2.3",c:pt{idx=0}/c:v"1.2",c:pt{idx=2}/c:v"3.4")',
+         [1.2, 2.3, 3.4]),
+        ('c:ser/c:val/c:numRef/c:numCache/(c:ptCount{val=4},c:pt{idx=2}/c:v'
+         '"3.4")',
+         [None, None, 3.4, None]),
+        ('c:ser/c:val/c:numLit/(c:pt{idx=1}/c:v"5.6",c:pt{idx=0}/c:v"4.5")',
+         [4.5, 5.6]),
+        ('c:ser/c:val/c:numRef/c:numCache/(c:ptCount{val=3},c:pt{idx=0}/c:v'
+         ',c:pt{idx=1}/c:v"2.3",c:pt{idx=2}/c:v"3.4")',
+         [None, 2.3, 3.4]),
+    ])
+    def values_array_fixture(self, request):
+        ser_cxml, expected_value = request.param
+        series = _BaseSeries(element(ser_cxml))
+        return series, expected_value
+
 
 class DescribeBarSeries(object):
 
@@ -244,6 +281,18 @@ class DescribeSeriesCollection(object):
         series_collection, expected_len = len_fixture
         assert len(series_collection) == expected_len
 
+    def it_uses_a_series_index_when_it_has_one(self, index_fixture):
+        series_collection, _SeriesFactory_, ser_ = index_fixture
+        series_collection[0]
+        assert len(series_collection) == 1
+        _SeriesFactory_.assert_called_once_with(ser_)
+
+    def it_can_iterate_over_its_series(self, iter_fixture):
+        series_collection, _SeriesFactory_, expected_calls = iter_fixture
+        series_lst = list(series_collection)
+        assert _SeriesFactory_.call_args_list == expected_calls
+        assert len(series_lst) == len(expected_calls)
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture(params=[
@@ -259,6 +308,24 @@ class DescribeSeriesCollection(object):
         series_collection = SeriesCollection(parent_elm)
         return series_collection, idx, _SeriesFactory_, ser, series_
 
+    @pytest.fixture
+    def index_fixture(self, request, _SeriesFactory_):
+        ser_ = instance_mock(request, CT_SeriesComposite)
+        series_index_ = instance_mock(request, SeriesIndex, sers=[ser_])
+        series_collection = SeriesCollection(None, series_index_)
+        return series_collection, _SeriesFactory_, ser_
+
+    @pytest.fixture
+    def iter_fixture(self, _SeriesFactory_):
+        parent_elm = element(
+            'c:chartSpace/(c:barChart/c:ser/c:idx{val=1},c:lineChart/c:ser/c'
+            ':idx{val=0})'
+        )
+        sers = parent_elm.xpath('.//c:ser')
+        series_collection = SeriesCollection(parent_elm)
+        expected_calls = [call(sers[1]), call(sers[0])]
+        return series_collection, _SeriesFactory_, expected_calls
+
     @pytest.fixture(params=[
         ('c:barChart',                     0),
         ('c:barChart/c:ser',               1),
@@ -345,3 +412,60 @@ class Describe_SeriesFactory(object):
     @pytest.fixture
     def pie_series_(self, request):
         return instance_mock(request, PieSeries)
+
+
+class DescribeSeriesIndex(object):
+
+    def it_provides_the_sers_in_idx_order(self, sers_fixture):
+        series_index, expected_sers = sers_fixture
+        assert series_index.sers == expected_sers
+        assert series_index[1] is expected_sers[1]
+
+    def it_provides_the_xCharts(self, sers_fixture):
+        series_index = sers_fixture[0]
+        plotArea = series_index._chartSpace.chart.plotArea
+        assert series_index.xCharts == list(plotArea.iter_plots())
+
+    def it_caches_the_sers(self, sers_fixture):
+        series_index = sers_fixture[0]
+        assert series_index.sers is series_index.sers
+
+    def it_rereads_the_sers_after_invalidation(self, sers_fixture):
+        series_index = sers_fixture[0]
+        sers = series_index.sers
+        series_index.invalidate()
+        assert series_index.sers is not sers
+
+    def it_reads_no_XML_until_invalidated(self, sers_fixture, xpath_):
+        series_index, expected_sers = sers_fixture
+        series_index.sers, series_index.xCharts
+        xpath_.reset_mock()
+        expected_sers[0].getparent().remove(expected_sers[0])
+        series_index[1], series_index.sers, series_index.xCharts
+        assert xpath_.call_count == 0
+        assert series_index.sers == expected_sers
+        series_index.invalidate()
+        assert series_index.sers == expected_sers[1:]
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def sers_fixture(self):
+        chartSpace = element(
+            'c:chartSpace/c:chart/c:plotArea/(c:barChart/(c:ser/(c:idx{val=1'
+            '},c:order),c:ser/(c:idx{val=0},c:order)),c:lineChart/c:ser/(c:i'
+            'dx{val=2},c:order))'
+        )
+        sers = chartSpace.xpath('.//c:ser')
+        expected_sers = [sers[1], sers[0], sers[2]]
+        series_index = SeriesIndex(chartSpace)
+        return series_index, expected_sers
+
+    # fixture components ---------------------------------------------
+
+    @pytest.fixture
+    def xpath_(self, request):
+        return method_mock(
+            request, CT_ChartSpace, 'xpath', autospec=True,
+            side_effect=BaseOxmlElement.xpath
+        )
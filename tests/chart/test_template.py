@@ -0,0 +1,143 @@
+# encoding: utf-8
+
+"""
+Test suite for pptx.chart.template module
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import pytest
+
+from pptx.chart.chart import Chart
+from pptx.chart.data import ChartData
+from pptx.chart.template import ChartTemplate
+from pptx.enum.chart import XL_CHART_TYPE
+from pptx.oxml import parse_xml
+
+from ..unitutil.cxml import element
+
+
+class DescribeChartTemplate(object):
+
+    def it_caches_the_template_for_each_chart_type(self):
+        XL = XL_CHART_TYPE
+        template = ChartTemplate.from_chart_type(XL.LINE)
+        assert ChartTemplate.from_chart_type(XL.LINE) is template
+        assert ChartTemplate.from_chart_type(XL.PIE) is not template
+
+    def it_produces_the_same_xml_as_the_chart_writer(self, writer_fixture):
+        template, chart_data, expected_xml = writer_fixture
+        chartSpace = template.new_chartSpace(chart_data)
+        assert chartSpace.xml == expected_xml
+
+    def it_can_be_made_from_an_existing_chart(self, from_chart_fixture):
+        chart, chart_data, expected_xml = from_chart_fixture
+        template = ChartTemplate.from_chart(chart)
+        chartSpace = template.new_chartSpace(chart_data)
+        assert chartSpace.xml == expected_xml
+
+    def it_formats_extra_series_like_the_last_one(self, extra_fixture):
+        template, chart_data, expected_xml = extra_fixture
+        chartSpace = template.new_chartSpace(chart_data)
+        assert chartSpace.xml == expected_xml
+
+    def it_removes_a_plot_left_without_series(self, empty_plot_fixture):
+        template, chart_data, expected_xml = empty_plot_fixture
+        chartSpace = template.new_chartSpace(chart_data)
+        assert chartSpace.xml == expected_xml
+
+    def it_raises_on_a_chart_having_no_series(self):
+        with pytest.raises(ValueError):
+            ChartTemplate(
+                element('c:chartSpace/c:chart/c:plotArea/c:barChart')
+            )
+
+    @pytest.mark.parametrize('xChart_cxml', [
+        'c:scatterChart/c:ser/(c:idx{val=0},c:order{val=0},c:xVal,c:yVal)',
+        'c:bubbleChart/c:ser/(c:idx{val=0},c:order{val=0},c:xVal,c:yVal,'
+        'c:bubbleSize)',
+    ])
+    def it_raises_on_a_chart_having_xy_series(self, xChart_cxml):
+        chartSpace = element(
+            'c:chartSpace/c:chart/c:plotArea/%s' % xChart_cxml
+        )
+        with pytest.raises(ValueError):
+            ChartTemplate.from_chart(Chart(chartSpace, None))
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def empty_plot_fixture(self):
+        template = ChartTemplate(element(
+            'c:chartSpace/c:chart/c:plotArea/(c:barChart/(c:ser/(c:idx{val=0}'
+            ',c:order{val=0}),c:axId{val=1}),c:lineChart/(c:ser/(c:idx{val=1}'
+            ',c:order{val=1},c:smooth{val=0}),c:axId{val=1}))'
+        ))
+        chart_data = self._chart_data(1)
+        expected_xml = self._expected_xml(
+            chart_data, '<c:barChart>%s<c:axId val="1"/></c:barChart>'
+        )
+        return template, chart_data, expected_xml
+
+    @pytest.fixture
+    def extra_fixture(self):
+        template = ChartTemplate(element(
+            'c:chartSpace/c:chart/c:plotArea/c:barChart/(c:ser/(c:idx{val=0},'
+            'c:order{val=0},c:invertIfNegative{val=0}),c:ser/(c:idx{val=1},c:'
+            'order{val=1},c:invertIfNegative{val=1}),c:axId{val=1})'
+        ))
+        chart_data = self._chart_data(3)
+        expected_xml = self._expected_xml(
+            chart_data, '<c:barChart>%s<c:axId val="1"/></c:barChart>',
+            ('0', '1', '1')
+        )
+        return template, chart_data, expected_xml
+
+    @pytest.fixture
+    def from_chart_fixture(self):
+        chart_type = XL_CHART_TYPE.COLUMN_CLUSTERED
+        chart_data = self._chart_data(2)
+        chartSpace = parse_xml(chart_data.xml_bytes(chart_type))
+        expected_xml = chartSpace.xml
+        chartSpace.append(element('c:externalData{r:id=rId1}'))
+        chart = Chart(chartSpace, None)
+        return chart, chart_data, expected_xml
+
+    @pytest.fixture(params=[
+        XL_CHART_TYPE.BAR_CLUSTERED,
+        XL_CHART_TYPE.COLUMN_CLUSTERED,
+        XL_CHART_TYPE.LINE,
+        XL_CHART_TYPE.PIE,
+    ])
+    def writer_fixture(self, request):
+        chart_type = request.param
+        chart_data = self._chart_data(3)
+        template = ChartTemplate.from_chart_type(chart_type)
+        expected_xml = parse_xml(chart_data.xml_bytes(chart_type)).xml
+        return template, chart_data, expected_xml
+
+    # fixture components ---------------------------------------------
+
+    @staticmethod
+    def _chart_data(series_count):
+        chart_data = ChartData()
+        chart_data.categories = ('Foo', 'Bar')
+        for idx in range(series_count):
+            chart_data.add_series('Series %d' % idx, (idx, 1.5 * idx))
+        return chart_data
+
+    @staticmethod
+    def _expected_xml(chart_data, xChart_tmpl, inverts=None):
+        inverts = inverts or ('',) * len(chart_data.series)
+        sers_xml = ''.join(
+            '<c:ser><c:idx val="%d"/><c:order val="%d"/>%s%s%s%s</c:ser>' % (
+                s.index, s.index, s.tx_xml,
+                '<c:invertIfNegative val="%s"/>' % invert if invert else '',
+                s.cat_xml, s.val_xml
+            ) for s, invert in zip(chart_data.series, inverts)
+        )
+        return parse_xml(
+            '<c:chartSpace xmlns:c="http://schemas.openxmlformats.org/drawingm'
+            'l/2006/chart"><c:chart><c:plotArea>%s</c:plotArea></c:chart></c:'
+            'chartSpace>' % (xChart_tmpl % sers_xml)
+        ).xml
@@ -15,7 +15,7 @@ from xlsxwriter.format import Format
 from xlsxwriter.worksheet import Worksheet
 
 from pptx.chart.data import _SeriesData
-from pptx.chart.xlsx import WorkbookWriter
+from pptx.chart.xlsx import WorkbookWriter, WorksheetPatcher
 from pptx.compat import BytesIO
 
 from ..unitutil.mock import call, class_mock, instance_mock, method_mock
@@ -36,6 +36,18 @@ class Describe_WorkbookWriter(object):
         )
         assert xlsx_blob is xlsx_blob_
 
+    def it_writes_the_source_indices_of_decimated_data(
+            self, xlsx_blob_fixture):
+        categories_, worksheet_ = xlsx_blob_fixture[0], xlsx_blob_fixture[5]
+        series = (None, None)
+
+        WorkbookWriter.xlsx_blob(categories_, series, (0, 5, 9))
+
+        assert worksheet_.mock_calls == [
+            call.write(0, 3, 'Source Index'),
+            call.write_column(1, 3, (0, 5, 9)),
+        ]
+
     def it_can_open_a_worksheet_in_a_context(self):
         xlsx_file = BytesIO()
         with WorkbookWriter._open_worksheet(xlsx_file) as (wrkbook, wrksht):
@@ -134,3 +146,149 @@ class Describe_WorkbookWriter(object):
         xlsx_file_ = instance_mock(request, BytesIO)
         xlsx_file_.getvalue.return_value = xlsx_blob_
         return xlsx_file_
+
+
+class DescribeWorksheetPatcher(object):
+
+    def it_can_patch_cells_in_an_Excel_blob(self, patch_fixture):
+        xlsx_blob, cells, expected_fragments, expected_dimension = (
+            patch_fixture
+        )
+
+        patched_blob = WorksheetPatcher.patched_xlsx_blob(xlsx_blob, cells)
+
+        zipf = ZipFile(BytesIO(patched_blob))
+        sheet_xml = zipf.read('xl/worksheets/sheet1.xml').decode('utf-8')
+        zipf.close()
+        for fragment in expected_fragments:
+            assert fragment in sheet_xml
+        assert expected_dimension in sheet_xml
+
+    def it_can_read_the_text_of_a_cell(self, patch_fixture):
+        xlsx_blob = patch_fixture[0]
+        patched_blob = WorksheetPatcher.patched_xlsx_blob(
+            xlsx_blob, [(3, 1, 'Baz')]
+        )
+        assert WorksheetPatcher.cell_text(xlsx_blob, 0, 2) == 'Series 2'
+        assert WorksheetPatcher.cell_text(patched_blob, 3, 1) == 'Baz'
+        assert WorksheetPatcher.cell_text(xlsx_blob, 1, 1) is None
+        assert WorksheetPatcher.cell_text(xlsx_blob, 0, 3) is None
+        assert WorksheetPatcher.cell_text(xlsx_blob, 9, 0) is None
+
+    def it_finds_the_worksheet_through_the_workbook_relationships(
+            self, patch_fixture):
+        xlsx_blob = _renamed_members_blob(patch_fixture[0], {
+            'xl/worksheets/sheet1.xml': 'xl/worksheets/data.xml',
+            'xl/sharedStrings.xml': 'xl/strings.xml',
+        })
+
+        patched_blob = WorksheetPatcher.patched_xlsx_blob(
+            xlsx_blob, [(3, 1, 'Baz')]
+        )
+
+        assert WorksheetPatcher.cell_text(xlsx_blob, 0, 2) == 'Series 2'
+        assert WorksheetPatcher.cell_text(patched_blob, 3, 1) == 'Baz'
+        zipf = ZipFile(BytesIO(patched_blob))
+        assert 'xl/worksheets/sheet1.xml' not in zipf.namelist()
+        sheet_xml = zipf.read('xl/worksheets/data.xml').decode('utf-8')
+        zipf.close()
+        assert '<t>Baz</t>' in sheet_xml
+
+    def it_raises_when_the_workbook_has_no_worksheet(self, patch_fixture):
+        xlsx_blob = _renamed_members_blob(patch_fixture[0], {
+            'xl/_rels/workbook.xml.rels': 'xl/_rels/other.xml.rels',
+        })
+        with pytest.raises(KeyError):
+            WorksheetPatcher.cell_text(xlsx_blob, 0, 2)
+        with pytest.raises(KeyError):
+            WorksheetPatcher.patched_xlsx_blob(xlsx_blob, [(3, 1, 'Baz')])
+
+    @pytest.mark.parametrize('number_format, expected_s, expected_numFmt', [
+        ('0.00', '2', None),
+        ('0.000', '3', '<numFmt numFmtId="166" formatCode="0.000"/>'),
+        ('0%', '3', '<xf numFmtId="9" fontId="0" fillId="0" borderId="0"'),
+        ('General', None, None),
+    ])
+    def it_gives_numbers_in_a_new_column_their_number_format(
+            self, number_format, expected_s, expected_numFmt):
+        categories = ('Foo', 'Bar')
+        xlsx_blob = WorkbookWriter.xlsx_blob(categories, (
+            _SeriesData(0, 'Series 1', (1.1, 2.2), categories, '0.0'),
+            _SeriesData(1, 'Series 2', (3.3, 4.4), categories, '0.00'),
+        ))
+        cells = [(0, 3, 'Series 3'), (1, 3, 1.5), (2, 3, 2.5)]
+
+        patched_blob = WorksheetPatcher.patched_xlsx_blob(
+            xlsx_blob, cells, {3: number_format}
+        )
+
+        zipf = ZipFile(BytesIO(patched_blob))
+        sheet_xml = zipf.read('xl/worksheets/sheet1.xml').decode('utf-8')
+        styles_xml = zipf.read('xl/styles.xml').decode('utf-8')
+        zipf.close()
+        s_attr = '' if expected_s is None else ' s="%s"' % expected_s
+        assert '<c r="D2"%s><v>1.5</v></c>' % s_attr in sheet_xml
+        assert '<c r="D3"%s><v>2.5</v></c>' % s_attr in sheet_xml
+        assert '<c r="D1" t="inlineStr">' in sheet_xml
+        if expected_numFmt is not None:
+            assert expected_numFmt in styles_xml
+
+    def it_knows_the_column_letters_for_a_column_index(self, col_fixture):
+        col_idx, letters = col_fixture
+        assert WorksheetPatcher._col_letters(col_idx) == letters
+        assert WorksheetPatcher._col_idx('%s42' % letters) == col_idx
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        (0, 'A'), (2, 'C'), (25, 'Z'), (26, 'AA'), (701, 'ZZ'),
+    ])
+    def col_fixture(self, request):
+        col_idx, letters = request.param
+        return col_idx, letters
+
+    @pytest.fixture(params=[
+        # a value changed, keeping the cell's number format
+        ([(2, 1, 9.9)], ['<c r="B3" s="1"><v>9.9</v></c>'], 'A1:C3'),
+        # a row added, taking number format from cell above
+        ([(3, 0, 'Baz'), (3, 1, 5.5)],
+         ['<row r="4"><c r="A4" t="inlineStr"><is><t>Baz</t></is></c>'
+          '<c r="B4" s="1"><v>5.5</v></c></row>'], 'A1:C4'),
+        # a column removed
+        ([(0, 2, None), (1, 2, None), (2, 2, None)],
+         ['<c r="B3" s="1"><v>2.2</v></c></row>'], 'A1:B3'),
+    ])
+    def patch_fixture(self, request):
+        cells, expected_fragments, dimension = request.param
+        categories = ('Foo', 'Bar')
+        series = (
+            _SeriesData(0, 'Series 1', (1.1, 2.2), categories, '0.0'),
+            _SeriesData(1, 'Series 2', (3.3, 4.4), categories, '0.00'),
+        )
+        xlsx_blob = WorkbookWriter.xlsx_blob(categories, series)
+        expected_dimension = '<dimension ref="%s"/>' % dimension
+        return xlsx_blob, cells, expected_fragments, expected_dimension
+
+
+# helpers ------------------------------------------------------------
+
+def _renamed_members_blob(xlsx_blob, new_membernames):
+    """
+    Return the Excel file in *xlsx_blob* with the members named in the keys
+    of *new_membernames* renamed to the corresponding value, and the
+    workbook relationships changed to match.
+    """
+    in_zip = ZipFile(BytesIO(xlsx_blob))
+    xlsx_file = BytesIO()
+    out_zip = ZipFile(xlsx_file, 'w')
+    for membername in in_zip.namelist():
+        blob = in_zip.read(membername)
+        if membername == 'xl/_rels/workbook.xml.rels':
+            for old_name, new_name in new_membernames.items():
+                blob = blob.replace(
+                    old_name[3:].encode('utf-8'), new_name[3:].encode('utf-8')
+                )
+        out_zip.writestr(new_membernames.get(membername, membername), blob)
+    out_zip.close()
+    in_zip.close()
+    return xlsx_file.getvalue()
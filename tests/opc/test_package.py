@@ -760,6 +760,16 @@ class DescribeRelationshipCollection(object):
         assert rels[rId] == rel
         assert rel == _Relationship_.return_value
 
+    def it_can_add_relationships_to_several_parts(self):
+        rels = RelationshipCollection('baseURI')
+        rels.add_relationship('reltype', 'part_1', 'rId1')
+        rels.add_relationship('reltype', 'part_3', 'rId3')
+        rIds = rels.add_relationships('foo', ['part_a', 'part_b'])
+        assert rIds == ['rId2', 'rId4']
+        assert [(rels[r].reltype, rels[r].target_part) for r in rIds] == [
+            ('foo', 'part_a'), ('foo', 'part_b')
+        ]
+
     def it_can_add_an_external_relationship(self, add_ext_rel_fixture_):
         rels, reltype, url = add_ext_rel_fixture_
         rId = rels.get_or_add_ext_rel(reltype, url)
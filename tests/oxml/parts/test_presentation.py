@@ -18,6 +18,12 @@ class DescribeCT_SlideIdList(object):
         sldIdLst.add_sldId('rId1')
         assert sldIdLst.xml == expected_xml
 
+    def it_can_add_several_sldId_elements(self, add_sldIds_fixture):
+        sldIdLst, rIds, expected_ids = add_sldIds_fixture
+        sldIds = sldIdLst.add_sldIds(rIds)
+        assert [(s.id, s.rId) for s in sldIds] == list(zip(expected_ids, rIds))
+        assert sldIdLst.sldId_lst[-len(rIds):] == sldIds
+
     def it_knows_the_next_available_slide_id(self, next_id_fixture):
         sldIdLst, expected_id = next_id_fixture
         assert sldIdLst._next_id == expected_id
@@ -33,6 +39,20 @@ class DescribeCT_SlideIdList(object):
         ).xml()
         return sldIdLst, expected_xml
 
+    @pytest.fixture(params=[
+        ((), (256, 257)),
+        ((256, 258), (257, 259)),
+        ((257, 258), (256, 259)),
+    ])
+    def add_sldIds_fixture(self, request):
+        existing_ids, expected_ids = request.param
+        sldIdLst_bldr = a_sldIdLst().with_nsdecls()
+        for n in existing_ids:
+            sldIdLst_bldr.with_child(a_sldId().with_id(n))
+        sldIdLst = sldIdLst_bldr.element
+        rIds = ['rId8', 'rId9']
+        return sldIdLst, rIds, expected_ids
+
     @pytest.fixture(params=[
         ((), 256),
         ((256,), 257), ((257,), 256), ((300,), 256), ((255,), 256),
@@ -6,9 +6,13 @@ Test suite for pptx.oxml.table module.
 
 from __future__ import absolute_import, print_function
 
+import pytest
+
 from pptx.oxml.ns import nsdecls
 from pptx.oxml.shapes.table import CT_Table
 
+from ...unitutil.cxml import element, xml
+
 
 class DescribeCT_Table(object):
 
@@ -40,3 +44,40 @@ class DescribeCT_Table(object):
         )
         tbl = CT_Table.new_tbl(2, 3, 334, 445)
         assert tbl.xml == expected_xml
+
+    def it_can_create_a_tbl_prefilled_with_text(self):
+        tbl = CT_Table.new_tbl(
+            2, 2, 200, 100, texts=[['a<b', 'c\nd'], ['', None]]
+        )
+        tcs = tbl.xpath('.//a:tc')
+        assert len(tbl.tr_lst) == 2
+        assert [t.text for t in tcs[0].xpath('.//a:t')] == ['a<b']
+        assert tcs[1].xml == xml(
+            'a:tc/(a:txBody/(a:bodyPr,a:lstStyle,a:p/(a:r/a:t"c",a:br,a:r/a'
+            ':t"d")),a:tcPr)'
+        )
+        empty_tc_xml = xml('a:tc/(a:txBody/(a:bodyPr,a:lstStyle,a:p),a:tcPr)')
+        assert [tc.xml for tc in tcs[2:]] == [empty_tc_xml, empty_tc_xml]
+
+
+class DescribeCT_TableCell(object):
+
+    def it_can_replace_its_text(self, text_fixture):
+        tc, text, expected_xml = text_fixture
+        tc.set_text(text)
+        assert tc.xml == expected_xml
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ('a:tc', 'foo', 'a:tc/a:txBody/(a:bodyPr,a:p/a:r/a:t"foo")'),
+        ('a:tc/(a:txBody/(a:p/(a:pPr{algn=ctr},a:r/a:t"x",a:br),a:p),a:tcPr)',
+         'a\nb',
+         'a:tc/(a:txBody/a:p/(a:pPr{algn=ctr},a:r/a:t"a",a:br,a:r/a:t"b"),a:'
+         'tcPr)'),
+    ])
+    def text_fixture(self, request):
+        tc_cxml, text, expected_cxml = request.param
+        tc = element(tc_cxml)
+        expected_xml = xml(expected_cxml)
+        return tc, text, expected_xml
@@ -9,7 +9,10 @@ from __future__ import absolute_import, print_function
 import pytest
 
 from pptx.chart.chart import Chart
-from pptx.chart.data import ChartData
+from pptx.chart.data import ChartData, _SeriesData
+from pptx.chart.series import SeriesIndex
+from pptx.chart.template import ChartTemplate
+from pptx.chart.xlsx import WorkbookWriter, WorksheetPatcher
 from pptx.enum.base import EnumValue
 from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
 from pptx.opc.package import OpcPackage
@@ -44,6 +47,19 @@ class DescribeChartPart(object):
         )
         assert chart_part is chart_part_
 
+    def it_can_construct_from_a_chart_template(self, new_tmpl_fixture):
+        template_, chart_data_, package_, chartSpace_ = new_tmpl_fixture[:4]
+        chart_workbook_, xlsx_blob_ = new_tmpl_fixture[4:]
+
+        chart_part = ChartPart.new(template_, chart_data_, package_)
+
+        template_.new_chartSpace.assert_called_once_with(chart_data_)
+        assert chart_part._element is chartSpace_
+        assert chart_part.package is package_
+        chart_workbook_.update_from_xlsx_blob.assert_called_once_with(
+            xlsx_blob_
+        )
+
     def it_provides_access_to_the_chart_object(self, chart_fixture):
         chart_part, chart_, Chart_ = chart_fixture
         chart = chart_part.chart
@@ -58,6 +74,15 @@ class DescribeChartPart(object):
         ChartWorkbook_.assert_called_once_with(chartSpace_, chart_part)
         assert chart_workbook is chart_workbook_
 
+    def it_provides_access_to_the_series_index(self, series_index_fixture):
+        chart_part, SeriesIndex_, chartSpace_, series_index_ = (
+            series_index_fixture
+        )
+        series_index = chart_part.series_index
+        SeriesIndex_.assert_called_once_with(chartSpace_)
+        assert series_index is series_index_
+        assert chart_part.series_index is series_index_
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -76,6 +101,31 @@ class DescribeChartPart(object):
             partname_, content_type, chart_blob_, chart_part_, xlsx_blob_
         )
 
+    @pytest.fixture
+    def new_tmpl_fixture(
+            self, request, chart_data_, package_, chartSpace_, xlsx_blob_,
+            chart_workbook_):
+        template_ = instance_mock(request, ChartTemplate)
+        template_.new_chartSpace.return_value = chartSpace_
+        property_mock(
+            request, ChartPart, 'chart_workbook',
+            return_value=chart_workbook_
+        )
+        return (
+            template_, chart_data_, package_, chartSpace_, chart_workbook_,
+            xlsx_blob_
+        )
+
+    @pytest.fixture
+    def series_index_fixture(self, request, chartSpace_):
+        series_index_ = instance_mock(request, SeriesIndex)
+        SeriesIndex_ = class_mock(
+            request, 'pptx.parts.chart.SeriesIndex',
+            return_value=series_index_
+        )
+        chart_part = ChartPart(None, None, chartSpace_)
+        return chart_part, SeriesIndex_, chartSpace_, series_index_
+
     @pytest.fixture
     def workbook_fixture(self, chartSpace_, ChartWorkbook_, chart_workbook_):
         chart_part = ChartPart(None, None, chartSpace_)
@@ -178,6 +228,61 @@ class DescribeChartWorkbook(object):
         chart_data.update_from_xlsx_blob(xlsx_blob_)
         assert chart_data.xlsx_part.blob is xlsx_blob_
 
+    @pytest.mark.parametrize('source_idxs, expected_value', [
+        (None, True), ((3, 7), False),
+    ])
+    def it_knows_whether_worksheet_cells_can_be_updated(
+            self, source_idxs, expected_value, xlsx_part_prop_, xlsx_part_):
+        chart_workbook = ChartWorkbook(None, None)
+        xlsx_part_.blob = WorkbookWriter.xlsx_blob(
+            ('Foo', 'Bar'), (_SeriesData(0, 'S1', (1, 2), None, 'General'),),
+            source_idxs
+        )
+        xlsx_part_prop_.return_value = xlsx_part_
+        assert chart_workbook.can_update_cells(1) is expected_value
+
+    def but_not_when_there_is_no_workbook(self, xlsx_part_prop_):
+        xlsx_part_prop_.return_value = None
+        assert ChartWorkbook(None, None).can_update_cells(1) is False
+
+    def or_when_the_workbook_has_no_worksheet(
+            self, request, xlsx_part_prop_, xlsx_part_):
+        method_mock(
+            request, WorksheetPatcher, 'cell_text', side_effect=KeyError
+        )
+        xlsx_part_prop_.return_value = xlsx_part_
+        assert ChartWorkbook(None, None).can_update_cells(1) is False
+
+    def it_reads_the_workbook_only_until_found_updatable(
+            self, request, xlsx_part_prop_, xlsx_part_):
+        chart_workbook = ChartWorkbook(None, None)
+        xlsx_part_.blob = WorkbookWriter.xlsx_blob(
+            ('Foo', 'Bar'), (_SeriesData(0, 'S1', (1, 2), None, 'General'),)
+        )
+        xlsx_part_prop_.return_value = xlsx_part_
+        cell_text_ = method_mock(
+            request, WorksheetPatcher, 'cell_text',
+            side_effect=WorksheetPatcher.cell_text
+        )
+
+        assert chart_workbook.can_update_cells(1) is True
+        assert chart_workbook.can_update_cells(1) is True
+        chart_workbook.update_cells([(1, 1, 42.0)])
+        assert chart_workbook.can_update_cells(1) is True
+
+        assert cell_text_.call_count == 1
+
+    def it_can_update_individual_worksheet_cells(self, update_cells_fixture):
+        chart_data, cells_, WorksheetPatcher_, old_blob_, xlsx_blob_ = (
+            update_cells_fixture
+        )
+        number_formats = {2: '0.00'}
+        chart_data.update_cells(cells_, number_formats)
+        WorksheetPatcher_.patched_xlsx_blob.assert_called_once_with(
+            old_blob_, cells_, number_formats
+        )
+        assert chart_data.xlsx_part.blob is xlsx_blob_
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -192,6 +297,20 @@ class DescribeChartWorkbook(object):
             xlsx_part_prop_, xlsx_part_
         )
 
+    @pytest.fixture
+    def update_cells_fixture(
+            self, request, xlsx_blob_, xlsx_part_prop_, xlsx_part_):
+        chart_data = ChartWorkbook(None, None)
+        cells_ = instance_mock(request, list)
+        old_blob_ = instance_mock(request, bytes)
+        xlsx_part_.blob = old_blob_
+        xlsx_part_prop_.return_value = xlsx_part_
+        WorksheetPatcher_ = class_mock(
+            request, 'pptx.parts.chart.WorksheetPatcher'
+        )
+        WorksheetPatcher_.patched_xlsx_blob.return_value = xlsx_blob_
+        return chart_data, cells_, WorksheetPatcher_, old_blob_, xlsx_blob_
+
     @pytest.fixture
     def update_blob_fixture(self, request, xlsx_blob_, xlsx_part_prop_):
         chart_data = ChartWorkbook(None, None)
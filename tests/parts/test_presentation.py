@@ -8,8 +8,8 @@ from __future__ import absolute_import, print_function
 
 import pytest
 
-from pptx.opc.constants import RELATIONSHIP_TYPE as RT
-from pptx.opc.package import _Relationship
+from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from pptx.opc.package import _Relationship, RelationshipCollection
 from pptx.opc.packuri import PackURI
 from pptx.oxml.parts.presentation import (
     CT_Presentation, CT_SlideId, CT_SlideIdList, CT_SlideMasterIdList
@@ -22,6 +22,7 @@ from pptx.parts.slidemaster import SlideMaster
 from ..oxml.unitdata.presentation import (
     a_presentation, a_sldMasterId, a_sldMasterIdLst, a_sldSz
 )
+from ..unitutil.cxml import element
 from ..unitutil.mock import (
     ANY, call, class_mock, instance_mock, MagicMock, method_mock,
     property_mock
@@ -316,6 +317,28 @@ class DescribeSlides(object):
         slides._sldIdLst.add_sldId.assert_called_once_with(ANY)
         assert slide is slide_
 
+    def it_can_add_several_new_slides(self, add_slides_fixture):
+        slides, slidelayout_, slide_, slide_2_, Slide_ = add_slides_fixture
+        new_slides = slides.add_slides(slidelayout_, 2)
+        package = slides._prs.package
+        Slide_.new.assert_called_once_with(
+            slidelayout_, PackURI('/ppt/slides/slide3.xml'), package
+        )
+        Slide_.assert_called_once_with(
+            PackURI('/ppt/slides/slide4.xml'), CT.PML_SLIDE, ANY, package
+        )
+        sld = Slide_.call_args[0][2]
+        assert sld is not slide_._element
+        assert sld.xml == slide_._element.xml
+        slide_2_.relate_to.assert_called_once_with(
+            slidelayout_, RT.SLIDE_LAYOUT
+        )
+        slides._prs.rels.add_relationships.assert_called_once_with(
+            RT.SLIDE, [slide_, slide_2_]
+        )
+        slides._sldIdLst.add_sldIds.assert_called_once_with(['rId3', 'rId4'])
+        assert new_slides == [slide_, slide_2_]
+
     def it_knows_the_next_available_slide_partname(
             self, slides_with_slide_parts_):
         slides = slides_with_slide_parts_[0]
@@ -345,6 +368,17 @@ class DescribeSlides(object):
     #
     # ----------------------------------------------------------------
 
+    @pytest.fixture
+    def add_slides_fixture(
+            self, request, slides, slidelayout_, Slide_, slide_2_, rels_):
+        slide_ = instance_mock(request, Slide, spec_set=False)
+        slide_._element = element('p:sld/p:cSld/p:spTree/p:sp')
+        Slide_.new.return_value = slide_
+        Slide_.return_value = slide_2_
+        slides._prs.rels = rels_
+        rels_.add_relationships.return_value = ['rId3', 'rId4']
+        return slides, slidelayout_, slide_, slide_2_, Slide_
+
     @pytest.fixture
     def index_fixture(self, sldIdLst_, prs_, slide_2_):
         slides = _Slides(sldIdLst_, prs_)
@@ -398,6 +432,10 @@ class DescribeSlides(object):
         related_parts_.__getitem__.side_effect = getitem
         return related_parts_
 
+    @pytest.fixture
+    def rels_(self, request):
+        return instance_mock(request, RelationshipCollection)
+
     @pytest.fixture
     def rename_slides_(self, request):
         return method_mock(request, _Slides, 'rename_slides')
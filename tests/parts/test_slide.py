@@ -6,6 +6,8 @@ Test suite for pptx.parts.slide module
 
 from __future__ import absolute_import
 
+from copy import deepcopy
+
 import pytest
 
 from pptx.chart.data import ChartData
@@ -18,7 +20,11 @@ from pptx.oxml.shapes.groupshape import CT_GroupShape
 from pptx.package import Package
 from pptx.parts.chart import ChartPart
 from pptx.parts.image import Image, ImagePart
-from pptx.parts.slide import BaseSlide, Slide, _SlidePlaceholders
+from pptx.enum.shapes import PP_PLACEHOLDER
+from pptx.parts.slide import (
+    BaseSlide, _PlaceholderIndex, _ShapeIdAllocator, Slide,
+    _SlidePlaceholders
+)
 from pptx.parts.slidelayout import SlideLayout
 from pptx.shapes.placeholder import _BaseSlidePlaceholder
 from pptx.shapes.shapetree import SlideShapeTree
@@ -57,8 +63,62 @@ class DescribeBaseSlide(object):
         spTree = slide.spTree
         assert isinstance(spTree, CT_GroupShape)
 
+    def it_provides_an_index_of_its_placeholders(self, slide):
+        placeholder_index = slide.placeholder_index
+        assert isinstance(placeholder_index, _PlaceholderIndex)
+        assert placeholder_index is slide.placeholder_index
+
+    def it_provides_a_shape_id_allocator(self, slide):
+        shape_id_allocator = slide.shape_id_allocator
+        assert isinstance(shape_id_allocator, _ShapeIdAllocator)
+        assert shape_id_allocator is slide.shape_id_allocator
+
+    def it_finds_the_shapes_added_since_an_earlier_state(self):
+        slide = BaseSlide(None, None, element(
+            'p:sld/p:cSld/p:spTree/(p:nvGrpSpPr,p:sp,p:extLst)'
+        ), None)
+        spTree = slide.spTree
+        state, added = slide.shapes_added_since(None)
+        assert added is None
+
+        sp = spTree.add_textbox(2, 'TextBox 1', 0, 0, 0, 0)
+        sp_2 = spTree.add_textbox(3, 'TextBox 2', 0, 0, 0, 0)
+        state, added = slide.shapes_added_since(state)
+        assert added == [sp, sp_2]
+
+        state, added = slide.shapes_added_since(state)
+        assert added == []
+        assert state == slide.shape_tree_state
+
+    def it_finds_other_changes_need_a_rescan(self, change_fixture):
+        slide, state, change = change_fixture
+        change(slide)
+        new_state, added = slide.shapes_added_since(state)
+        assert added is None
+        assert new_state != state
+
     # fixtures -------------------------------------------------------
 
+    @pytest.fixture(params=[
+        lambda slide: slide.spTree.remove(slide.spTree[1]),
+        lambda slide: slide.spTree.remove(slide.spTree[2]),
+        lambda slide: (
+            slide.spTree.remove(slide.spTree[1]),
+            slide.spTree.append(element('p:sp'))
+        ),
+        lambda slide: slide.spTree.replace(slide.spTree[2], element('p:sp')),
+        lambda slide: slide.shape_tree_changed(),
+        lambda slide: slide._element.cSld.replace(
+            slide.spTree, deepcopy(slide.spTree)
+        ),
+    ])
+    def change_fixture(self, request):
+        slide = BaseSlide(None, None, element(
+            'p:sld/p:cSld/p:spTree/(p:nvGrpSpPr,p:sp,p:sp)'
+        ), None)
+        state = slide.shape_tree_state
+        return slide, state, request.param
+
     @pytest.fixture
     def get_image_fixture(self, related_parts_prop_, image_part_, image_):
         slide = BaseSlide(None, None, None, None)
@@ -349,8 +409,10 @@ class Describe_SlidePlaceholders(object):
     ])
     def getitem_fixture(self, request, SlideShapeFactory_, placeholder_):
         spTree_cxml, idx, offset = request.param
-        spTree = element(spTree_cxml)
-        placeholders = _SlidePlaceholders(spTree, None)
+        slide = Slide(None, None, element('p:sld/p:cSld/%s' % spTree_cxml),
+                      None)
+        spTree = slide.spTree
+        placeholders = _SlidePlaceholders(spTree, slide)
         shape_elm = spTree[offset]
         SlideShapeFactory_.return_value = placeholder_
         return placeholders, idx, SlideShapeFactory_, shape_elm, placeholder_
@@ -363,8 +425,10 @@ class Describe_SlidePlaceholders(object):
     ])
     def iter_fixture(self, request, SlideShapeFactory_, placeholder_):
         spTree_cxml, sequence = request.param
-        spTree = element(spTree_cxml)
-        placeholders = _SlidePlaceholders(spTree, None)
+        slide = Slide(None, None, element('p:sld/p:cSld/%s' % spTree_cxml),
+                      None)
+        spTree = slide.spTree
+        placeholders = _SlidePlaceholders(spTree, slide)
         SlideShapeFactory_.return_value = placeholder_
         calls = [call(spTree[i], placeholders) for i in sequence]
         values = [placeholder_] * len(sequence)
@@ -381,7 +445,9 @@ class Describe_SlidePlaceholders(object):
     ])
     def len_fixture(self, request):
         spTree_cxml, length = request.param
-        placeholders = _SlidePlaceholders(element(spTree_cxml), None)
+        slide = Slide(None, None, element('p:sld/p:cSld/%s' % spTree_cxml),
+                      None)
+        placeholders = _SlidePlaceholders(slide.spTree, slide)
         return placeholders, length
 
     # fixture components ---------------------------------------------
@@ -396,3 +462,209 @@ class Describe_SlidePlaceholders(object):
             request, 'pptx.parts.slide.SlideShapeFactory',
             return_value=placeholder_
         )
+
+
+class Describe_PlaceholderIndex(object):
+
+    def it_finds_a_placeholder_element_by_idx(self, index_fixture):
+        placeholder_index, spTree = index_fixture
+        assert placeholder_index.by_idx(0) is spTree[1]
+        assert placeholder_index.by_idx(1) is spTree[2]
+        assert placeholder_index.by_idx(42) is None
+
+    def it_finds_a_placeholder_element_by_type(self, index_fixture):
+        placeholder_index, spTree = index_fixture
+        assert placeholder_index.by_type(PP_PLACEHOLDER.TITLE) is spTree[1]
+        assert placeholder_index.by_type(PP_PLACEHOLDER.BODY) is spTree[2]
+        assert placeholder_index.by_type(PP_PLACEHOLDER.CHART) is None
+
+    def it_provides_its_placeholder_elements_in_document_order(
+            self, index_fixture):
+        placeholder_index, spTree = index_fixture
+        assert placeholder_index.ph_elms == [spTree[1], spTree[2], spTree[3]]
+
+    def it_only_indexes_the_shape_tree_once(self, index_fixture,
+                                            _rebuild_):
+        placeholder_index, spTree = index_fixture
+        placeholder_index.by_idx(0)
+        placeholder_index.by_type(PP_PLACEHOLDER.BODY)
+        placeholder_index.ph_elms
+        placeholder_index.by_idx(42)
+        placeholder_index.by_idx(42)
+        placeholder_index.by_type(PP_PLACEHOLDER.CHART)
+        _rebuild_.assert_called_once_with(placeholder_index, spTree)
+
+    def it_indexes_only_the_shapes_added_since_last_use(
+            self, index_fixture, _rebuild_):
+        placeholder_index, spTree = index_fixture
+        placeholder_index.by_idx(42)
+        sp = element('p:sp/p:nvSpPr/p:nvPr/p:ph{type=chart,idx=42}')
+        spTree.append(sp)
+        assert placeholder_index.by_idx(42) is sp
+        assert placeholder_index.ph_elms[-1] is sp
+        _rebuild_.assert_called_once_with(placeholder_index, spTree)
+
+    def it_sees_a_placeholder_added_to_the_shape_tree(self, index_fixture):
+        placeholder_index, spTree = index_fixture
+        placeholder_index.by_idx(42)
+        sp = element('p:sp/p:nvSpPr/p:nvPr/p:ph{type=chart,idx=42}')
+        spTree.append(sp)
+        assert placeholder_index.by_idx(42) is sp
+        assert placeholder_index.by_type(PP_PLACEHOLDER.CHART) is sp
+
+    def it_sees_a_placeholder_removed_from_the_shape_tree(
+            self, index_fixture):
+        placeholder_index, spTree = index_fixture
+        title = placeholder_index.by_idx(0)
+        spTree.remove(title)
+        assert placeholder_index.by_idx(0) is None
+        assert placeholder_index.by_type(PP_PLACEHOLDER.TITLE) is None
+        assert len(placeholder_index.ph_elms) == 2
+
+    def it_sees_a_placeholder_replaced_in_the_shape_tree(
+            self, index_fixture):
+        placeholder_index, spTree = index_fixture
+        body = placeholder_index.by_idx(1)
+        sp = element('p:sp/p:nvSpPr/p:nvPr/p:ph{type=body,idx=1}')
+        spTree.replace(body, sp)
+        assert placeholder_index.by_idx(1) is sp
+        assert placeholder_index.ph_elms[1] is sp
+
+    def it_sees_a_change_to_the_idx_of_a_placeholder(self, index_fixture):
+        placeholder_index, spTree = index_fixture
+        body = placeholder_index.by_idx(1)
+        body.ph.idx = 7
+        assert placeholder_index.by_idx(1) is None
+        assert placeholder_index.by_idx(7) is body
+
+    def it_sees_a_placeholder_given_a_missing_idx_when_notified(
+            self, index_fixture):
+        placeholder_index, spTree = index_fixture
+        body = placeholder_index.by_idx(1)
+        assert placeholder_index.by_idx(7) is None
+        body.ph.idx = 7
+        placeholder_index._slide.shape_tree_changed()
+        assert placeholder_index.by_idx(7) is body
+
+    def it_sees_a_placeholder_given_a_missing_type_when_notified(
+            self, index_fixture):
+        placeholder_index, spTree = index_fixture
+        pic = spTree[3]
+        assert placeholder_index.by_type(PP_PLACEHOLDER.PICTURE) is None
+        pic.ph.type = PP_PLACEHOLDER.PICTURE
+        placeholder_index._slide.shape_tree_changed()
+        assert placeholder_index.by_type(PP_PLACEHOLDER.PICTURE) is pic
+
+    def it_sees_placeholders_moved_in_z_order(self, index_fixture):
+        placeholder_index, spTree = index_fixture
+        title, body, pic = placeholder_index.ph_elms
+        spTree.remove(pic)
+        spTree.insert(1, pic)
+        assert placeholder_index.ph_elms == [pic, title, body]
+        assert placeholder_index.by_type(PP_PLACEHOLDER.BODY) is pic
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def index_fixture(self):
+        sld = element(
+            'p:sld/p:cSld/p:spTree/('
+            'p:sp,'
+            'p:sp/p:nvSpPr/p:nvPr/p:ph{type=title},'
+            'p:sp/p:nvSpPr/p:nvPr/p:ph{type=body,idx=1},'
+            'p:pic/p:nvPicPr/p:nvPr/p:ph{type=body,idx=2})'
+        )
+        slide = Slide(None, None, sld, None)
+        return _PlaceholderIndex(slide), slide.spTree
+
+    # fixture components ---------------------------------------------
+
+    @pytest.fixture
+    def _rebuild_(self, request):
+        return method_mock(
+            request, _PlaceholderIndex, '_rebuild', autospec=True,
+            side_effect=_PlaceholderIndex._rebuild
+        )
+
+
+class Describe_ShapeIdAllocator(object):
+
+    def it_finds_the_next_available_shape_id(self, allocator_fixture):
+        allocator, spTree = allocator_fixture
+        assert allocator.next_id == 2
+        assert allocator.next_id == 2
+
+    def it_finds_an_unused_shape_name(self, allocator_fixture):
+        allocator, spTree = allocator_fixture
+        assert allocator.unique_name('Title', 1) == 'Title 2'
+        assert allocator.unique_name('Title', 3) == 'Title 3'
+        assert allocator.unique_name('Content Placeholder', 2) == (
+            'Content Placeholder 2'
+        )
+
+    def it_sees_the_ids_and_names_of_added_shapes(self, allocator_fixture):
+        allocator, spTree = allocator_fixture
+        allocator.next_id
+        spTree.add_textbox(2, 'Title 2', 0, 0, 0, 0)
+        spTree.add_textbox(4, 'TextBox 3', 0, 0, 0, 0)
+        assert allocator.next_id == 5
+        assert allocator.unique_name('Title', 1) == 'Title 3'
+
+    def it_scans_only_the_shapes_added_since_last_use(
+            self, allocator_fixture, _add_, _rebuild_):
+        allocator, spTree = allocator_fixture
+        allocator.next_id
+        sp = spTree.add_textbox(2, 'TextBox 1', 0, 0, 0, 0)
+        allocator.next_id
+        allocator.unique_name('TextBox', 1)
+        _rebuild_.assert_called_once_with(allocator, spTree)
+        _add_.assert_called_once_with(allocator, sp)
+
+    def it_reuses_the_ids_of_removed_shapes(self, allocator_fixture):
+        allocator, spTree = allocator_fixture
+        sp = spTree.xpath('p:sp')[0]
+        allocator.next_id
+        spTree.remove(sp)
+        assert allocator.next_id == 2
+        assert allocator.unique_name('Title', 1) == 'Title 1'
+
+    def it_rescans_when_a_shape_is_replaced_between_uses(
+            self, allocator_fixture):
+        allocator, spTree = allocator_fixture
+        sp = spTree.xpath('p:sp')[0]
+        allocator.next_id
+        spTree.remove(sp)
+        pasted_sp = deepcopy(sp)
+        pasted_sp.xpath('p:nvSpPr/p:cNvPr')[0].set('id', '2')
+        spTree.insert(1, pasted_sp)
+        assert allocator.next_id == 3
+        assert allocator.unique_name('Title', 1) == 'Title 2'
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def allocator_fixture(self):
+        sld = element(
+            'p:sld/p:cSld/p:spTree/(p:nvGrpSpPr/p:cNvPr{id=1},'
+            'p:sp/p:nvSpPr/p:cNvPr{id=3},p:extLst)'
+        )
+        slide = Slide(None, None, sld, None)
+        spTree = slide.spTree
+        spTree.xpath('p:sp/p:nvSpPr/p:cNvPr')[0].set('name', 'Title 1')
+        return _ShapeIdAllocator(slide), spTree
+
+    # fixture components ---------------------------------------------
+
+    @pytest.fixture
+    def _add_(self, request):
+        return method_mock(
+            request, _ShapeIdAllocator, '_add', autospec=True,
+            side_effect=_ShapeIdAllocator._add
+        )
+
+    @pytest.fixture
+    def _rebuild_(self, request):
+        return method_mock(
+            request, _ShapeIdAllocator, '_rebuild', autospec=True,
+            side_effect=_ShapeIdAllocator._rebuild
+        )
@@ -16,9 +16,10 @@ from pptx.parts.slidelayout import (
 )
 from pptx.parts.slidemaster import SlideMaster
 from pptx.shapes.base import BaseShape
-from pptx.shapes.placeholder import LayoutPlaceholder
+from pptx.shapes.placeholder import LayoutPlaceholder, PlaceholderInheritance
 
 from ..oxml.unitdata.shape import a_ph, a_pic, an_nvPr, an_nvSpPr, an_sp
+from ..unitutil.cxml import element
 from ..unitutil.mock import (
     class_mock, function_mock, instance_mock, method_mock, property_mock
 )
@@ -32,6 +33,13 @@ class DescribeSlideLayout(object):
         slide_layout.part_related_by.assert_called_once_with(RT.SLIDE_MASTER)
         assert slide_master is slide_master_
 
+    def it_provides_access_to_its_placeholder_inheritance(self):
+        slide_layout = SlideLayout(None, None, None, None)
+        inheritance = slide_layout.placeholder_inheritance
+        assert isinstance(inheritance, PlaceholderInheritance)
+        assert inheritance._slide_layout is slide_layout
+        assert slide_layout.placeholder_inheritance is inheritance
+
     def it_provides_access_to_its_shapes(self, shapes_fixture):
         slide_layout, _LayoutShapeTree_, layout_shape_tree_ = shapes_fixture
         shapes = slide_layout.shapes
@@ -266,8 +274,8 @@ class Describe_LayoutPlaceholders(object):
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
-    def default_fixture(self, _iter_):
-        layout_placeholders = _LayoutPlaceholders(None)
+    def default_fixture(self, slide_layout):
+        layout_placeholders = _LayoutPlaceholders(slide_layout)
         return layout_placeholders
 
     @pytest.fixture
@@ -280,20 +288,31 @@ class Describe_LayoutPlaceholders(object):
         )
 
     @pytest.fixture(params=[0, 1])
-    def get_fixture(self, request, _iter_, placeholder_, placeholder_2_):
-        layout_placeholders = _LayoutPlaceholders(None)
+    def get_fixture(self, request, slide_layout, _shape_factory_,
+                    placeholder_, placeholder_2_):
+        layout_placeholders = _LayoutPlaceholders(slide_layout)
         ph_idx = request.param
+        ph_elm = slide_layout.spTree[ph_idx]
         ph_shape_ = {0: placeholder_, 1: placeholder_2_}[request.param]
+        _shape_factory_.side_effect = (
+            lambda elm: ph_shape_ if elm is ph_elm else None
+        )
         return layout_placeholders, ph_idx, ph_shape_
 
     # fixture components ---------------------------------------------
 
     @pytest.fixture
-    def _iter_(self, request, placeholder_, placeholder_2_):
-        return method_mock(
-            request, _LayoutPlaceholders, '__iter__',
-            return_value=iter([placeholder_, placeholder_2_])
+    def _shape_factory_(self, request):
+        return method_mock(request, _LayoutPlaceholders, '_shape_factory')
+
+    @pytest.fixture
+    def slide_layout(self):
+        sldLayout = element(
+            'p:sldLayout/p:cSld/p:spTree/('
+            'p:sp/p:nvSpPr/p:nvPr/p:ph{type=title},'
+            'p:sp/p:nvSpPr/p:nvPr/p:ph{type=body,idx=1})'
         )
+        return SlideLayout(None, None, sldLayout, None)
 
     @pytest.fixture
     def layout_placeholder_(self, request):
@@ -8,6 +8,7 @@ from __future__ import absolute_import, print_function
 
 import pytest
 
+from pptx.enum.shapes import PP_PLACEHOLDER
 from pptx.oxml.parts.slidemaster import CT_SlideLayoutIdList
 from pptx.oxml.shapes.autoshape import CT_Shape
 from pptx.parts.slidelayout import SlideLayout
@@ -22,6 +23,7 @@ from ..oxml.unitdata.shape import a_ph, a_pic, an_nvPr, an_nvSpPr, an_sp
 from ..oxml.unitdata.slides import (
     a_sldLayoutId, a_sldLayoutIdLst, a_sldMaster
 )
+from ..unitutil.cxml import element
 from ..unitutil.mock import (
     class_mock, function_mock, instance_mock, method_mock, property_mock
 )
@@ -286,8 +288,8 @@ class Describe_MasterPlaceholders(object):
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
-    def default_fixture(self, _iter_):
-        master_placeholders = _MasterPlaceholders(None)
+    def default_fixture(self, slide_master):
+        master_placeholders = _MasterPlaceholders(slide_master)
         return master_placeholders
 
     @pytest.fixture
@@ -298,23 +300,35 @@ class Describe_MasterPlaceholders(object):
             master_placeholders, ph_elm_, _MasterShapeFactory_, placeholder_
         )
 
-    @pytest.fixture(params=['title', 'body'])
-    def get_fixture(self, request, _iter_, placeholder_, placeholder_2_):
-        master_placeholders = _MasterPlaceholders(None)
+    @pytest.fixture(params=[PP_PLACEHOLDER.TITLE, PP_PLACEHOLDER.BODY])
+    def get_fixture(self, request, slide_master, _shape_factory_,
+                    placeholder_, placeholder_2_):
+        master_placeholders = _MasterPlaceholders(slide_master)
         ph_type = request.param
-        ph_shape_ = {
-            'title': placeholder_, 'body': placeholder_2_
-        }[request.param]
+        offset, ph_shape_ = {
+            PP_PLACEHOLDER.TITLE: (0, placeholder_),
+            PP_PLACEHOLDER.BODY:  (1, placeholder_2_),
+        }[ph_type]
+        ph_elm = slide_master.spTree[offset]
+        _shape_factory_.side_effect = (
+            lambda elm: ph_shape_ if elm is ph_elm else None
+        )
         return master_placeholders, ph_type, ph_shape_
 
     # fixture components ---------------------------------------------
 
     @pytest.fixture
-    def _iter_(self, request, placeholder_, placeholder_2_):
-        return method_mock(
-            request, _MasterPlaceholders, '__iter__',
-            return_value=iter([placeholder_, placeholder_2_])
+    def _shape_factory_(self, request):
+        return method_mock(request, _MasterPlaceholders, '_shape_factory')
+
+    @pytest.fixture
+    def slide_master(self):
+        sldMaster = element(
+            'p:sldMaster/p:cSld/p:spTree/('
+            'p:sp/p:nvSpPr/p:nvPr/p:ph{type=title},'
+            'p:sp/p:nvSpPr/p:nvPr/p:ph{type=body,idx=1})'
         )
+        return SlideMaster(None, None, sldMaster, None)
 
     @pytest.fixture
     def _MasterShapeFactory_(self, request, placeholder_):
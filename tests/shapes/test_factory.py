@@ -8,7 +8,7 @@ from __future__ import absolute_import
 
 import pytest
 
-from pptx.parts.slide import Slide
+from pptx.parts.slide import Slide, _ShapeIdAllocator
 from pptx.shapes.autoshape import Shape
 from pptx.shapes.base import BaseShape
 from pptx.shapes.factory import (
@@ -66,6 +66,8 @@ class DescribeBaseShapeFactory(object):
         spTree = an_spTree().with_nsdecls().with_child(nvSpPr_bldr).element
         print(spTree.xml)
         slide_.spTree = spTree
+        slide_.shapes_added_since.return_value = (None, None)
+        slide_.shape_id_allocator = _ShapeIdAllocator(slide_)
         shapes = BaseShapeTree(slide_)
         return shapes, next_available_shape_id
 
@@ -14,6 +14,7 @@ from pptx.oxml.shapes.graphfrm import CT_GraphicalObjectFrame
 from pptx.parts.chart import ChartPart
 from pptx.shapes.graphfrm import GraphicFrame
 from pptx.shapes.shapetree import SlideShapeTree
+from pptx.shapes.table import Table
 from pptx.spec import GRAPHIC_DATA_URI_CHART, GRAPHIC_DATA_URI_TABLE
 
 from ..unitutil.cxml import element
@@ -22,6 +23,25 @@ from ..unitutil.mock import instance_mock, property_mock
 
 class DescribeGraphicFrame(object):
 
+    def it_provides_the_same_table_object_on_each_access(self):
+        graphicFrame = CT_GraphicalObjectFrame.new_table_graphicFrame(
+            1, 'Table 1', 3, 2, 0, 0, 600, 300
+        )
+        graphic_frame = GraphicFrame(graphicFrame, None)
+        table = graphic_frame.table
+        assert isinstance(table, Table)
+        assert graphic_frame.table is table
+
+    def it_keeps_the_frame_in_sync_across_row_resizes(self):
+        graphicFrame = CT_GraphicalObjectFrame.new_table_graphicFrame(
+            1, 'Table 1', 3, 2, 0, 0, 600, 300
+        )
+        graphic_frame = GraphicFrame(graphicFrame, None)
+        for idx, height in enumerate((150, 200, 250)):
+            graphic_frame.table.rows[idx].height = height
+        assert graphic_frame.height == 600
+        assert graphic_frame.table._synced_height == 600
+
     def it_knows_if_it_contains_a_chart(self, has_chart_fixture):
         graphic_frame, expected_value = has_chart_fixture
         assert graphic_frame.has_chart is expected_value
@@ -18,7 +18,8 @@ from pptx.parts.slidemaster import SlideMaster
 from pptx.shapes.placeholder import (
     BasePlaceholder, _BaseSlidePlaceholder, ChartPlaceholder,
     LayoutPlaceholder, MasterPlaceholder, PicturePlaceholder,
-    PlaceholderGraphicFrame, PlaceholderPicture, TablePlaceholder
+    PlaceholderGraphicFrame, PlaceholderInheritance, PlaceholderPicture,
+    TablePlaceholder
 )
 from pptx.shapes.shapetree import BaseShapeTree
 
@@ -29,7 +30,7 @@ from ..oxml.unitdata.shape import (
 from ..unitutil.cxml import element, xml
 from ..unitutil.file import snippet_seq
 from ..unitutil.mock import (
-    class_mock, instance_mock, method_mock, property_mock
+    call, class_mock, instance_mock, method_mock, property_mock
 )
 
 
@@ -50,8 +51,10 @@ class Describe_BaseSlidePlaceholder(object):
         assert value == expected_value
 
     def it_gets_an_inherited_dim_value_to_help(self, layout_val_fixture):
-        placeholder, attr_name, expected_value = layout_val_fixture
+        placeholder, attr_name, inheritance_, idx = layout_val_fixture[:4]
+        expected_value = layout_val_fixture[4]
         value = placeholder._inherited_value(attr_name)
+        inheritance_.layout_value.assert_called_once_with(idx, attr_name)
         assert value == expected_value
 
     def it_finds_its_layout_placeholder_to_help(self, layout_ph_fixture):
@@ -71,10 +74,11 @@ class Describe_BaseSlidePlaceholder(object):
         assert placeholder._element.xml == expected_xml
 
     def it_replaces_a_placeholder_element_to_help(self, replace_fixture):
-        placeholder, element, spTree, expected_xml = replace_fixture
+        placeholder, element, spTree, expected_xml, slide_ = replace_fixture
         placeholder._replace_placeholder_with(element)
         assert spTree.xml == expected_xml
         assert placeholder._element is None
+        slide_.shape_tree_changed.assert_called_once_with()
 
     # fixtures -------------------------------------------------------
 
@@ -110,17 +114,16 @@ class Describe_BaseSlidePlaceholder(object):
         slide_layout_.placeholders.get.return_value = layout_placeholder_
         return placeholder, slide_layout_, 1, layout_placeholder_
 
-    @pytest.fixture(params=[(True, 42), (False, None)])
-    def layout_val_fixture(self, request, _layout_placeholder_,
-                           layout_placeholder_):
-        has_layout_placeholder, expected_value = request.param
-        placeholder = _BaseSlidePlaceholder(None, None)
-        if has_layout_placeholder:
-            layout_placeholder_.width = expected_value
-            _layout_placeholder_.return_value = layout_placeholder_
-        else:
-            _layout_placeholder_.return_value = None
-        return placeholder, 'width', expected_value
+    @pytest.fixture(params=[42, None])
+    def layout_val_fixture(self, request, _slide_layout_prop_, slide_layout_,
+                           inheritance_):
+        expected_value = request.param
+        sp_cxml = 'p:sp/p:nvSpPr/p:nvPr/p:ph{type=pic,idx=1}'
+        placeholder = _BaseSlidePlaceholder(element(sp_cxml), None)
+        _slide_layout_prop_.return_value = slide_layout_
+        slide_layout_.placeholder_inheritance = inheritance_
+        inheritance_.layout_value.return_value = expected_value
+        return placeholder, 'width', inheritance_, 1, expected_value
 
     @pytest.fixture(params=[
         ('left',   'p:sp/p:spPr/a:xfrm/a:off{x=12}',  12),
@@ -134,7 +137,7 @@ class Describe_BaseSlidePlaceholder(object):
         return slide_placeholder, prop_name, value
 
     @pytest.fixture
-    def replace_fixture(self):
+    def replace_fixture(self, part_prop_, slide_):
         spTree = element(
             'p:spTree/p:sp/p:nvSpPr/p:nvPr/p:ph{type=pic,idx=10}'
         )
@@ -143,7 +146,8 @@ class Describe_BaseSlidePlaceholder(object):
         expected_xml = xml(
             'p:spTree/p:pic/p:nvPicPr/p:nvPr/p:ph{type=pic,idx=10}'
         )
-        return placeholder, pic, spTree, expected_xml
+        part_prop_.return_value = slide_
+        return placeholder, pic, spTree, expected_xml, slide_
 
     @pytest.fixture
     def slide_layout_fixture(self, part_prop_, slide_, slide_layout_):
@@ -161,10 +165,8 @@ class Describe_BaseSlidePlaceholder(object):
         )
 
     @pytest.fixture
-    def _layout_placeholder_(self, request):
-        return property_mock(
-            request, _BaseSlidePlaceholder, '_layout_placeholder'
-        )
+    def inheritance_(self, request):
+        return instance_mock(request, PlaceholderInheritance)
 
     @pytest.fixture
     def layout_placeholder_(self, request):
@@ -429,8 +431,12 @@ class DescribeLayoutPlaceholder(object):
 
     def it_knows_how_to_get_a_property_value_from_its_master(
             self, mstr_val_fixture):
-        layout_placeholder, attr_name, expected_value = mstr_val_fixture
+        layout_placeholder, attr_name, inheritance_, idx = (
+            mstr_val_fixture[:4]
+        )
+        expected_value = mstr_val_fixture[4]
         value = layout_placeholder._inherited_value(attr_name)
+        inheritance_.master_value.assert_called_once_with(idx, attr_name)
         assert value == expected_value
 
     def it_finds_its_corresponding_master_placeholder_to_help_inherit(
@@ -476,18 +482,15 @@ class DescribeLayoutPlaceholder(object):
             master_placeholder_
         )
 
-    @pytest.fixture(params=[(True, 42), (False, None)])
-    def mstr_val_fixture(
-            self, request, _master_placeholder_, master_placeholder_):
-        has_master_placeholder, expected_value = request.param
-        layout_placeholder = LayoutPlaceholder(None, None)
-        attr_name = 'width'
-        if has_master_placeholder:
-            setattr(master_placeholder_, attr_name, expected_value)
-            _master_placeholder_.return_value = master_placeholder_
-        else:
-            _master_placeholder_.return_value = None
-        return layout_placeholder, attr_name, expected_value
+    @pytest.fixture(params=[42, None])
+    def mstr_val_fixture(self, request, parent_, slide_layout_,
+                         inheritance_):
+        expected_value = request.param
+        sp = element('p:sp/p:nvSpPr/p:nvPr/p:ph{type=body,idx=3}')
+        layout_placeholder = LayoutPlaceholder(sp, parent_)
+        slide_layout_.placeholder_inheritance = inheritance_
+        inheritance_.master_value.return_value = expected_value
+        return layout_placeholder, 'width', inheritance_, 3, expected_value
 
     @pytest.fixture
     def slide_master_fixture(self, parent_, slide_master_):
@@ -519,6 +522,10 @@ class DescribeLayoutPlaceholder(object):
             return_value=int_value_
         )
 
+    @pytest.fixture
+    def inheritance_(self, request):
+        return instance_mock(request, PlaceholderInheritance)
+
     @pytest.fixture
     def int_value_(self, request):
         return instance_mock(request, int)
@@ -574,6 +581,148 @@ class DescribeLayoutPlaceholder(object):
         return 31416
 
 
+class DescribePlaceholderInheritance(object):
+
+    def it_provides_the_value_a_layout_placeholder_has(
+            self, inheritance_fixture):
+        inheritance = inheritance_fixture[0]
+        assert inheritance.layout_value(0, 'left') == 1
+        assert inheritance.layout_value(0, 'height') == 4
+        assert inheritance.layout_value(1, 'top') == 60
+        assert inheritance.layout_value(1, 'width') == 70
+        assert inheritance.layout_value(42, 'left') is None
+
+    def it_provides_the_value_its_master_placeholder_has(
+            self, inheritance_fixture):
+        inheritance = inheritance_fixture[0]
+        assert inheritance.master_value(0, 'left') == 10
+        assert inheritance.master_value(1, 'height') == 80
+        assert inheritance.master_value(42, 'left') is None
+
+    def it_remembers_the_placeholders_it_inherits_through(
+            self, inheritance_fixture, _find_ph_elms_):
+        inheritance = inheritance_fixture[0]
+        for attr_name in ('left', 'top', 'width', 'height'):
+            inheritance.layout_value(1, attr_name)
+            inheritance.master_value(1, attr_name)
+        assert _find_ph_elms_.call_args_list == [
+            call(inheritance, 1, False), call(inheritance, 1, True)
+        ]
+
+    def it_looks_to_the_master_only_when_the_layout_has_no_value(
+            self, inheritance_fixture, _find_ph_elms_):
+        inheritance = inheritance_fixture[0]
+        assert inheritance.layout_value(0, 'width') == 3
+        assert inheritance.layout_value(0, 'height') == 4
+        _find_ph_elms_.assert_called_once_with(inheritance, 0, False)
+
+    def it_provides_the_value_of_a_type_not_inherited_from_the_master(
+            self, inheritance_fixture):
+        inheritance, layout_spTree, master_spTree = inheritance_fixture
+        layout_spTree.append(element(
+            'p:sp/(p:nvSpPr/p:nvPr/p:ph{type=hdr,idx=11},p:spPr/a:xfrm/('
+            'a:off{x=5,y=6},a:ext{cx=7,cy=8}))'
+        ))
+        layout_spTree.append(element(
+            'p:sp/(p:nvSpPr/p:nvPr/p:ph{type=hdr,idx=12},p:spPr)'
+        ))
+        assert inheritance.layout_value(11, 'top') == 6
+        assert inheritance.layout_value(12, 'top') is None
+        assert inheritance.master_value(11, 'top') is None
+
+    def it_reads_values_changed_in_place(self, inheritance_fixture):
+        inheritance, layout_spTree, master_spTree = inheritance_fixture
+        inheritance.layout_value(1, 'left')
+        layout_spTree[1].x = 5
+        master_spTree[0].cy = 9
+        assert inheritance.layout_value(1, 'left') == 5
+        assert inheritance.master_value(0, 'height') == 9
+
+    def it_sees_a_change_to_a_placeholder_type(self, inheritance_fixture):
+        inheritance, layout_spTree, master_spTree = inheritance_fixture
+        assert inheritance.layout_value(1, 'left') == 50
+        layout_spTree[1].ph.type = PP_PLACEHOLDER.TITLE
+        assert inheritance.layout_value(1, 'left') == 10
+
+    def it_sees_a_placeholder_given_a_missing_idx_when_notified(
+            self, inheritance_fixture):
+        inheritance, layout_spTree, master_spTree = inheritance_fixture
+        assert inheritance.layout_value(7, 'left') is None
+        layout_spTree[1].ph.idx = 7
+        inheritance._slide_layout.shape_tree_changed()
+        assert inheritance.layout_value(7, 'left') == 50
+
+    def it_sees_a_master_placeholder_given_a_missing_type_when_notified(
+            self, inheritance_fixture):
+        inheritance, layout_spTree, master_spTree = inheritance_fixture
+        layout_spTree[1].ph.type = PP_PLACEHOLDER.DATE
+        assert inheritance.master_value(1, 'left') is None
+        master_spTree[1].ph.type = PP_PLACEHOLDER.DATE
+        inheritance._slide_master.shape_tree_changed()
+        assert inheritance.master_value(1, 'left') == 50
+
+    def it_sees_a_placeholder_removed_from_the_master(
+            self, inheritance_fixture):
+        inheritance, layout_spTree, master_spTree = inheritance_fixture
+        assert inheritance.layout_value(1, 'left') == 50
+        master_spTree.remove(master_spTree[1])
+        assert inheritance.layout_value(1, 'left') is None
+
+    def it_sees_a_placeholder_replaced_on_the_layout(
+            self, inheritance_fixture):
+        inheritance, layout_spTree, master_spTree = inheritance_fixture
+        assert inheritance.layout_value(0, 'left') == 1
+        sp = element(
+            'p:sp/(p:nvSpPr/p:nvPr/p:ph{type=title},p:spPr/a:xfrm/a:off'
+            '{x=2,y=2})'
+        )
+        layout_spTree.replace(layout_spTree[0], sp)
+        assert inheritance.layout_value(0, 'left') == 2
+
+    def it_sees_a_placeholder_replaced_on_the_master(
+            self, inheritance_fixture):
+        inheritance, layout_spTree, master_spTree = inheritance_fixture
+        assert inheritance.master_value(0, 'top') == 20
+        sp = element(
+            'p:sp/(p:nvSpPr/p:nvPr/p:ph{type=title},p:spPr/a:xfrm/a:off'
+            '{x=2,y=2})'
+        )
+        master_spTree.replace(master_spTree[0], sp)
+        assert inheritance.master_value(0, 'top') == 2
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def inheritance_fixture(self, request):
+        slide_layout = SlideLayout(None, None, element(
+            'p:sldLayout/p:cSld/p:spTree/('
+            'p:sp/(p:nvSpPr/p:nvPr/p:ph{type=title},p:spPr/a:xfrm/('
+            'a:off{x=1,y=2},a:ext{cx=3,cy=4})),'
+            'p:sp/(p:nvSpPr/p:nvPr/p:ph{type=obj,idx=1},p:spPr))'
+        ), None)
+        slide_master = SlideMaster(None, None, element(
+            'p:sldMaster/p:cSld/p:spTree/('
+            'p:sp/(p:nvSpPr/p:nvPr/p:ph{type=title},p:spPr/a:xfrm/('
+            'a:off{x=10,y=20},a:ext{cx=30,cy=40})),'
+            'p:sp/(p:nvSpPr/p:nvPr/p:ph{type=body,idx=1},p:spPr/a:xfrm/('
+            'a:off{x=50,y=60},a:ext{cx=70,cy=80})))'
+        ), None)
+        property_mock(
+            request, SlideLayout, 'slide_master', return_value=slide_master
+        )
+        inheritance = PlaceholderInheritance(slide_layout)
+        return inheritance, slide_layout.spTree, slide_master.spTree
+
+    # fixture components ---------------------------------------------
+
+    @pytest.fixture
+    def _find_ph_elms_(self, request):
+        return method_mock(
+            request, PlaceholderInheritance, '_find_ph_elms', autospec=True,
+            side_effect=PlaceholderInheritance._find_ph_elms
+        )
+
+
 class DescribePicturePlaceholder(object):
 
     def it_can_insert_a_picture_into_itself(self, insert_fixture):
@@ -17,7 +17,7 @@ from pptx.oxml.shapes.groupshape import CT_GroupShape
 from pptx.oxml.shapes.picture import CT_Picture
 from pptx.oxml.shapes.shared import BaseShapeElement, ST_Direction
 from pptx.parts.image import ImagePart
-from pptx.parts.slide import Slide
+from pptx.parts.slide import Slide, _ShapeIdAllocator
 from pptx.parts.slidelayout import SlideLayout
 from pptx.shapes.autoshape import AutoShapeType, Shape
 from pptx.shapes.base import BaseShape
@@ -81,14 +81,96 @@ class DescribeBaseShapeTree(object):
         shapes = BaseShapeTree(slide)
         assert shapes.part is slide
 
+    def it_provides_the_bounds_of_its_shapes(self, slide, iter_shape_bounds_):
+        shapes = BaseShapeTree(slide)
+        bounds = shapes.iter_shape_bounds()
+        shape_elms, shape_factory = iter_shape_bounds_.call_args[0]
+        assert list(shape_elms) == slide.spTree.xpath('p:sp')
+        assert shape_factory == shapes._shape
+        assert bounds is iter_shape_bounds_.return_value
+
+    def it_can_build_a_spatial_index_of_its_shapes(
+            self, slide, iter_shape_bounds_, SpatialIndex_):
+        shapes = BaseShapeTree(slide)
+        spatial_index = shapes.spatial_index(42)
+        SpatialIndex_.assert_called_once_with(
+            iter_shape_bounds_.return_value, 42
+        )
+        assert spatial_index is SpatialIndex_.return_value
+
+    def it_lists_its_shape_elements_only_once(
+            self, slide, _iter_member_elms_spy_):
+        shapes = BaseShapeTree(slide)
+        len(shapes), shapes[0], shapes[1], shapes[-1]
+        _iter_member_elms_spy_.assert_called_once_with(shapes)
+
+    def it_does_not_relist_its_shapes_as_the_slide_grows(
+            self, _iter_member_elms_spy_):
+        sld = element(
+            'p:sld/p:cSld/p:spTree/(p:grpSpPr,%s)' % ','.join(['p:sp'] * 200)
+        )
+        slide = Slide(None, None, sld, None)
+        shapes = BaseShapeTree(slide)
+        for idx in range(len(shapes)):
+            shapes[idx]
+        for idx in range(50):
+            slide.spTree.add_textbox(idx + 300, 'TextBox', 0, 0, 0, 0)
+            shapes[len(shapes) - 1]
+        assert len(shapes) == 250
+        full_listings = [
+            c for c in _iter_member_elms_spy_.call_args_list
+            if c == call(shapes)
+        ]
+        assert full_listings == [call(shapes)]
+
+    def it_sees_a_shape_replaced_mid_tree_when_notified(self, slide):
+        shapes = BaseShapeTree(slide)
+        old_sp = shapes[0].element
+        sp = element('p:sp')
+        slide.spTree.replace(old_sp, sp)
+        slide.shape_tree_changed()
+        assert shapes[0].element is sp
+
+    def it_returns_the_same_shape_object_on_each_access(self, slide):
+        shapes = BaseShapeTree(slide)
+        shape = shapes[1]
+        assert shapes[1] is shape
+        assert shapes[-1] is shape
+        assert list(shapes)[1] is shape
+
+    def it_sees_shapes_added_to_the_shape_tree(self, slide):
+        shapes = BaseShapeTree(slide)
+        shape = shapes[1]
+        sp = slide.spTree.add_textbox(42, 'TextBox 41', 0, 0, 0, 0)
+        assert len(shapes) == 3
+        assert shapes[2].element is sp
+        assert shapes[1] is shape
+
+    def it_sees_a_shape_replaced_in_the_shape_tree(self, slide):
+        shapes = BaseShapeTree(slide)
+        old_sp = shapes[1].element
+        sp = element('p:sp')
+        slide.spTree.replace(old_sp, sp)
+        assert shapes[1].element is sp
+
+    def it_sees_shapes_moved_in_z_order(self, slide):
+        spTree = slide.spTree
+        shapes = BaseShapeTree(slide)
+        sp, sp_2 = spTree.xpath('p:sp')
+        shape, shape_2 = shapes[0], shapes[1]
+        spTree.remove(sp_2)
+        spTree.insert(1, sp_2)
+        assert [s.element for s in shapes] == [sp_2, sp]
+        assert (shapes[0], shapes[1]) == (shape_2, shape)
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
-    def getitem_fixture(
-            self, _iter_member_elms_, BaseShapeFactory_, sp_2_, shape_):
-        shapes = BaseShapeTree(None)
+    def getitem_fixture(self, slide, BaseShapeFactory_, shape_):
+        shapes = BaseShapeTree(slide)
         idx = 1
-        return shapes, idx, BaseShapeFactory_, sp_2_, shape_
+        sp = slide.spTree.xpath('p:sp')[idx]
+        return shapes, idx, BaseShapeFactory_, sp, shape_
 
     @pytest.fixture
     def iter_fixture(
@@ -118,6 +200,23 @@ class DescribeBaseShapeTree(object):
             return_value=iter([sp_, sp_2_])
         )
 
+    @pytest.fixture
+    def iter_shape_bounds_(self, request):
+        return function_mock(
+            request, 'pptx.shapes.shapetree.iter_shape_bounds'
+        )
+
+    @pytest.fixture
+    def SpatialIndex_(self, request):
+        return class_mock(request, 'pptx.shapes.shapetree.SpatialIndex')
+
+    @pytest.fixture
+    def _iter_member_elms_spy_(self, request):
+        return method_mock(
+            request, BaseShapeTree, '_iter_member_elms', autospec=True,
+            side_effect=BaseShapeTree._iter_member_elms
+        )
+
     @pytest.fixture
     def BaseShapeFactory_(self, request, shape_, shape_2_):
         return function_mock(
@@ -255,11 +354,22 @@ class DescribeSlideShapeTree(object):
         table = shapes.add_table(rows_, cols_, x_, y_, cx_, cy_)
         # verify -----------------------
         _add_graphicFrame_containing_table_.assert_called_once_with(
-            rows_, cols_, x_, y_, cx_, cy_
+            rows_, cols_, x_, y_, cx_, cy_, None
         )
         _shape_factory_.assert_called_once_with(graphicFrame_)
         assert table is table_
 
+    def it_can_add_a_table_filled_with_text(self, table_fixture):
+        shapes, rows_, cols_, x_, y_, cx_, cy_ = table_fixture[:7]
+        _add_graphicFrame_containing_table_ = table_fixture[7]
+        texts = [('a', 'b'), ('c', 'd')]
+
+        shapes.add_table(rows_, cols_, x_, y_, cx_, cy_, texts=texts)
+
+        _add_graphicFrame_containing_table_.assert_called_once_with(
+            rows_, cols_, x_, y_, cx_, cy_, texts
+        )
+
     def it_can_add_a_textbox(self, textbox_fixture):
         shapes, x_, y_, cx_, cy_, _add_textbox_sp_ = textbox_fixture[:6]
         _shape_factory_, sp_, textbox_ = textbox_fixture[6:]
@@ -280,6 +390,17 @@ class DescribeSlideShapeTree(object):
         idx = shapes.index(shape_)
         assert idx == expected_idx
 
+    def it_knows_the_index_of_a_shape_moved_in_z_order(self):
+        sld = element('p:sld/p:cSld/p:spTree/(p:grpSpPr,p:sp,p:sp,p:sp)')
+        shapes = SlideShapeTree(Slide(None, None, sld, None))
+        spTree = shapes._spTree
+        shape = shapes[2]
+        assert shapes.index(shape) == 2
+        spTree.remove(shape.element)
+        spTree.insert(1, shape.element)
+        assert shapes.index(shape) == 0
+        assert shapes[0] is shape
+
     def it_raises_on_index_where_shape_not_found(self, index_fixture):
         shapes, shape_, expected_idx = index_fixture
         shapes._spTree.iter_shape_elms.return_value = []
@@ -324,7 +445,7 @@ class DescribeSlideShapeTree(object):
         )
         # verify -----------------------
         spTree_.add_table.assert_called_once_with(
-            id_, name, rows_, cols_, x_, y_, cx_, cy_
+            id_, name, rows_, cols_, x_, y_, cx_, cy_, None
         )
         assert graphicFrame is graphicFrame_
 
@@ -506,6 +627,7 @@ class DescribeSlideShapeTree(object):
                 a_cNvPr().with_name('Title 1')).with_child(
                 a_cNvPr().with_name('Table Placeholder 3'))
         ).element
+        slide_.shape_id_allocator = _ShapeIdAllocator(slide_)
         shapes = SlideShapeTree(slide_)
         return shapes, ph_type, id_, orient, expected_name
 
@@ -583,7 +705,7 @@ class DescribeSlideShapeTree(object):
         spTree_cxml, found = request.param
         spTree = element(spTree_cxml)
         sp = spTree.xpath('p:sp')[1]
-        slide_.spTree = spTree
+        slide_.placeholder_index.by_idx.return_value = sp if found else None
 
         shapes = SlideShapeTree(slide_)
         _shape_factory_.return_value = shape_
@@ -791,6 +913,7 @@ class DescribeSlideShapeTree(object):
     def slide_(self, request, spTree_, image_part_, rId_):
         slide_ = instance_mock(request, Slide)
         slide_.spTree = spTree_
+        slide_.shapes_added_since.return_value = (None, None)
         slide_.add_chart_part.return_value = rId_
         return slide_
 
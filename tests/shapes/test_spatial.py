@@ -0,0 +1,137 @@
+# encoding: utf-8
+
+"""
+Test suite for pptx.shapes.spatial module.
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import pytest
+
+from pptx.shapes.base import BaseShape
+from pptx.shapes.spatial import (
+    iter_shape_bounds, ShapeBounds, SpatialIndex
+)
+
+from ..unitutil.cxml import element
+
+
+class DescribeShapeBounds(object):
+
+    def it_knows_its_position_and_size(self):
+        bounds = ShapeBounds('shape', 10, 20, 30, 40)
+        assert bounds.shape == 'shape'
+        assert (bounds.left, bounds.top) == (10, 20)
+        assert (bounds.width, bounds.height) == (30, 40)
+        assert (bounds.right, bounds.bottom) == (40, 60)
+
+    @pytest.mark.parametrize('x, y, expected_value', [
+        (10, 20, True), (39, 59, True), (40, 30, False), (20, 60, False),
+        (9, 30, False),
+    ])
+    def it_knows_whether_it_contains_a_point(self, x, y, expected_value):
+        bounds = ShapeBounds(None, 10, 20, 30, 40)
+        assert bounds.contains(x, y) is expected_value
+
+    @pytest.mark.parametrize('rect, expected_value', [
+        ((0, 0, 11, 21), True), ((39, 59, 5, 5), True),
+        ((20, 30, 1, 1), True), ((0, 0, 10, 100), False),
+        ((40, 20, 5, 5), False), ((10, 60, 30, 5), False),
+    ])
+    def it_knows_whether_it_intersects_a_rectangle(
+            self, rect, expected_value):
+        bounds = ShapeBounds(None, 10, 20, 30, 40)
+        assert bounds.intersects(*rect) is expected_value
+
+
+class DescribeSpatialIndex(object):
+
+    def it_knows_how_many_shapes_it_holds(self, index):
+        assert len(index) == 4
+
+    def it_finds_the_shapes_at_a_point(self, index):
+        assert [b.shape for b in index.shapes_at(150, 150)] == ['c', 'a']
+        assert [b.shape for b in index.shapes_at(50, 50)] == ['a']
+        assert index.shapes_at(5000, 5000) == []
+
+    def it_finds_the_shapes_in_a_rectangle(self, index):
+        shapes_in = index.shapes_in(0, 0, 120, 120)
+        assert [b.shape for b in shapes_in] == ['a', 'c']
+        assert index.shapes_in(900, 900, 50, 50) == []
+
+    def it_finds_the_shapes_that_overlap(self, index):
+        pairs = index.overlapping_pairs()
+        assert [(a.shape, b.shape) for a, b in pairs] == [
+            ('a', 'c'), ('b', 'd'), ('c', 'd')
+        ]
+
+    def it_chooses_a_cell_size_from_the_shapes(self):
+        index = SpatialIndex([
+            ShapeBounds(None, 0, 0, 100, 50),
+            ShapeBounds(None, 0, 0, 20, 300),
+        ])
+        assert index._cell_size == 200
+
+    def it_can_index_no_shapes(self):
+        index = SpatialIndex([])
+        assert index.shapes_at(0, 0) == []
+        assert index.overlapping_pairs() == []
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[None, 50, 1000])
+    def index(self, request):
+        return SpatialIndex([
+            ShapeBounds('a', 0, 0, 200, 200),
+            ShapeBounds('b', 500, 500, 100, 100),
+            ShapeBounds('c', 100, 100, 300, 300),
+            ShapeBounds('d', 350, 350, 200, 200),
+        ], request.param)
+
+
+class Describe_iter_shape_bounds(object):
+
+    def it_generates_the_bounds_of_each_shape_on_the_slide(
+            self, bounds_fixture):
+        spTree, expected_values = bounds_fixture
+        bounds = list(
+            iter_shape_bounds(spTree.iter_shape_elms(), self._shape)
+        )
+        assert [
+            (b.shape.element, b.left, b.top, b.width, b.height)
+            for b in bounds
+        ] == [
+            (spTree.xpath(xpath)[0], x, y, cx, cy)
+            for xpath, x, y, cx, cy in expected_values
+        ]
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ('p:spTree/(p:sp/p:spPr/a:xfrm/(a:off{x=10,y=20},a:ext{cx=30,cy=40}'
+         '),p:sp/p:spPr)',
+         [('p:sp[1]', 10, 20, 30, 40)]),
+        ('p:spTree/p:grpSp/(p:grpSpPr/a:xfrm/(a:off{x=1000,y=1000},a:ext{cx'
+         '=200,cy=100},a:chOff{x=100,y=0},a:chExt{cx=100,cy=100}),p:sp/p:sp'
+         'Pr/a:xfrm/(a:off{x=150,y=50},a:ext{cx=10,cy=10}))',
+         [('p:grpSp/p:sp', 1100, 1050, 20, 10)]),
+        ('p:spTree/(p:sp/p:spPr/a:xfrm/(a:off{x=1,y=2},a:ext{cx=3,cy=4}),p:g'
+         'rpSp/(p:grpSpPr/a:xfrm/(a:off{x=1000,y=1000},a:ext{cx=200,cy=100},'
+         'a:chOff{x=0,y=0},a:chExt{cx=100,cy=100}),p:grpSp/(p:grpSpPr/a:xfr'
+         'm/(a:off{x=0,y=0},a:ext{cx=50,cy=50},a:chOff{x=0,y=0},a:chExt{cx='
+         '100,cy=100}),p:sp/p:spPr/a:xfrm/(a:off{x=100,y=100},a:ext{cx=20,c'
+         'y=20}))))',
+         [('p:sp', 1, 2, 3, 4), ('p:grpSp/p:grpSp/p:sp', 1100, 1050, 20, 10)]),
+        ('p:spTree/p:grpSp/(p:grpSpPr,p:sp/p:spPr/a:xfrm/(a:off{x=5,y=6},a:e'
+         'xt{cx=7,cy=8}))',
+         [('p:grpSp/p:sp', 5, 6, 7, 8)]),
+    ])
+    def bounds_fixture(self, request):
+        spTree_cxml, expected_values = request.param
+        return element(spTree_cxml), expected_values
+
+    # fixture components ---------------------------------------------
+
+    @staticmethod
+    def _shape(shape_elm):
+        return BaseShape(shape_elm, None)
@@ -38,15 +38,62 @@ class DescribeTable(object):
         assert table.columns is expected_columns_
 
     def it_updates_graphic_frame_width_on_width_change(self, dx_fixture):
-        table, expected_width = dx_fixture
-        table.notify_width_changed()
+        table, delta, expected_width = dx_fixture
+        table.notify_width_changed(delta)
         assert table._graphic_frame.width == expected_width
 
     def it_updates_graphic_frame_height_on_height_change(self, dy_fixture):
-        table, expected_height = dy_fixture
-        table.notify_height_changed()
+        table, delta, expected_height = dy_fixture
+        table.notify_height_changed(delta)
         assert table._graphic_frame.height == expected_height
 
+    def it_resizes_each_row_and_column_in_constant_time(self):
+        tbl = element('a:tbl/(a:tblGrid/(a:gridCol{w=1},a:gridCol{w=2}),a:t'
+                      'r{h=3},a:tr{h=4})')
+        graphic_frame = GraphicFrame(
+            element('p:graphicFrame/p:xfrm/a:ext{cx=3,cy=7}'), None
+        )
+        table = Table(tbl, graphic_frame)
+
+        for row in table.rows:
+            row.height = 10
+        for column in table.columns:
+            column.width = 20
+
+        assert (graphic_frame.width, graphic_frame.height) == (40, 20)
+
+    def it_resyncs_a_graphic_frame_that_does_not_match_its_table(self):
+        tbl = element('a:tbl/(a:tblGrid/(a:gridCol{w=1},a:gridCol{w=2}),a:t'
+                      'r{h=3},a:tr{h=4})')
+        graphic_frame = GraphicFrame(
+            element('p:graphicFrame/p:xfrm/a:ext{cx=99,cy=99}'), None
+        )
+        table = Table(tbl, graphic_frame)
+
+        table.rows[0].height = 10
+        table.columns[1].width = 20
+        assert (graphic_frame.width, graphic_frame.height) == (21, 14)
+
+        graphic_frame.height = 50
+        table.rows[1].height = 5
+        assert graphic_frame.height == 15
+
+    def it_can_populate_its_cells_in_bulk(self, populate_fixture):
+        table, data, number_formats, expected_xml = populate_fixture
+        table.populate(data, number_formats)
+        assert table._tbl.xml == expected_xml
+
+    def it_raises_on_populate_beyond_its_extent(self, populate_raises_fixture):
+        table, data = populate_raises_fixture
+        with pytest.raises(IndexError):
+            table.populate(data)
+
+    def it_raises_on_a_number_format_not_valid_for_a_value(self):
+        table = Table(element('a:tbl/a:tr/a:tc/a:txBody/a:p'), None)
+        with pytest.raises(ValueError) as e:
+            table.populate([(1.5,)], ['.2q'])
+        assert "number format '.2q' cannot format 1.5" in str(e.value)
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -61,19 +108,59 @@ class DescribeTable(object):
         table._columns = columns_
         return table, columns_
 
-    @pytest.fixture
-    def dx_fixture(self, graphic_frame_):
+    @pytest.fixture(params=[
+        (None, None, 333), (None, 1000, 333), (-11, None, 333),
+        (-11, 42, 333), (-11, 1000, 989),
+    ])
+    def dx_fixture(self, request, graphic_frame_):
+        delta, synced_width, expected_width = request.param
         tbl_cxml = 'a:tbl/a:tblGrid/(a:gridCol{w=111},a:gridCol{w=222})'
         table = Table(element(tbl_cxml), graphic_frame_)
-        expected_width = 333
-        return table, expected_width
+        table._synced_width = synced_width
+        graphic_frame_.width = 1000
+        return table, delta, expected_width
 
-    @pytest.fixture
-    def dy_fixture(self, graphic_frame_):
+    @pytest.fixture(params=[
+        (None, None, 300), (None, 1000, 300), (22, None, 300),
+        (22, 42, 300), (22, 1000, 1022),
+    ])
+    def dy_fixture(self, request, graphic_frame_):
+        delta, synced_height, expected_height = request.param
         tbl_cxml = 'a:tbl/(a:tr{h=100},a:tr{h=200})'
         table = Table(element(tbl_cxml), graphic_frame_)
-        expected_height = 300
-        return table, expected_height
+        table._synced_height = synced_height
+        graphic_frame_.height = 1000
+        return table, delta, expected_height
+
+    @pytest.fixture(params=[
+        ([['a', 'b'], ['c', 'd']], None,
+         'a:tbl/(a:tr/(a:tc/a:txBody/a:p/a:r/a:t"a",a:tc/a:txBody/a:p/a:r/a:t'
+         '"b"),a:tr/(a:tc/a:txBody/a:p/a:r/a:t"c",a:tc/a:txBody/a:p/a:r/a:t"'
+         'd"))'),
+        (iter([(1234.5, 0.25)]), ['.2f', '.0%'],
+         'a:tbl/(a:tr/(a:tc/a:txBody/a:p/a:r/a:t"1234.50",a:tc/a:txBody/a:p'
+         '/a:r/a:t"25%"),a:tr/(a:tc/a:txBody/a:p,a:tc/a:txBody/a:p))'),
+        ([[None, True], [42]], [None, 'd'],
+         'a:tbl/(a:tr/(a:tc/a:txBody/a:p,a:tc/a:txBody/a:p/a:r/a:t"True"),a:'
+         'tr/(a:tc/a:txBody/a:p/a:r/a:t"42",a:tc/a:txBody/a:p))'),
+    ])
+    def populate_fixture(self, request):
+        data, number_formats, expected_cxml = request.param
+        tc = 'a:tc/a:txBody/a:p'
+        table = Table(element(
+            'a:tbl/(a:tr/(%s,%s),a:tr/(%s,%s))' % (tc, tc, tc, tc)
+        ), None)
+        expected_xml = xml(expected_cxml)
+        return table, data, number_formats, expected_xml
+
+    @pytest.fixture(params=[
+        [['a'], ['b']],
+        [['a', 'b']],
+    ])
+    def populate_raises_fixture(self, request):
+        data = request.param
+        table = Table(element('a:tbl/a:tr/a:tc'), None)
+        return table, data
 
     @pytest.fixture
     def rows_fixture(self, table, rows_):
@@ -361,10 +448,10 @@ class Describe_Column(object):
         assert isinstance(width, Length)
 
     def it_can_change_its_width(self, width_set_fixture):
-        column, new_width, expected_xml, parent_ = width_set_fixture
+        column, new_width, expected_xml, delta, parent_ = width_set_fixture
         column.width = new_width
         assert column._gridCol.xml == expected_xml
-        parent_.notify_width_changed.assert_called_once_with()
+        parent_.notify_width_changed.assert_called_once_with(delta)
 
     # fixtures -------------------------------------------------------
 
@@ -378,14 +465,14 @@ class Describe_Column(object):
         return column, expected_value
 
     @pytest.fixture(params=[
-        ('a:gridCol{w=12pt}', Inches(1), 'a:gridCol{w=914400}'),
-        ('a:gridCol{w=1234}', Inches(1), 'a:gridCol{w=914400}'),
+        ('a:gridCol{w=12pt}', Inches(1), 'a:gridCol{w=914400}', 762000),
+        ('a:gridCol{w=1234}', Inches(1), 'a:gridCol{w=914400}', 913166),
     ])
     def width_set_fixture(self, request, parent_):
-        gridCol_cxml, new_width, expected_gridCol_cxml = request.param
+        gridCol_cxml, new_width, expected_gridCol_cxml, delta = request.param
         column = _Column(element(gridCol_cxml), parent_)
         expected_xml = xml(expected_gridCol_cxml)
-        return column, new_width, expected_xml, parent_
+        return column, new_width, expected_xml, delta, parent_
 
     # fixture components ---------------------------------------------
 
@@ -472,10 +559,10 @@ class Describe_Row(object):
         assert isinstance(height, Length)
 
     def it_can_change_its_height(self, height_set_fixture):
-        row, new_height, expected_xml, parent_ = height_set_fixture
+        row, new_height, expected_xml, delta, parent_ = height_set_fixture
         row.height = new_height
         assert row._tr.xml == expected_xml
-        parent_.notify_height_changed.assert_called_once_with()
+        parent_.notify_height_changed.assert_called_once_with(delta)
 
     def it_provides_access_to_its_cells(self, cells_fixture):
         row, _CellCollection_, cells_ = cells_fixture
@@ -500,14 +587,14 @@ class Describe_Row(object):
         return row, expected_value
 
     @pytest.fixture(params=[
-        ('a:tr{h=12pt}', Inches(1), 'a:tr{h=914400}'),
-        ('a:tr{h=1234}', Inches(1), 'a:tr{h=914400}'),
+        ('a:tr{h=12pt}', Inches(1), 'a:tr{h=914400}', 762000),
+        ('a:tr{h=1234}', Inches(1), 'a:tr{h=914400}', 913166),
     ])
     def height_set_fixture(self, request, parent_):
-        tr_cxml, new_height, expected_tr_cxml = request.param
+        tr_cxml, new_height, expected_tr_cxml, delta = request.param
         row = _Row(element(tr_cxml), parent_)
         expected_xml = xml(expected_tr_cxml)
-        return row, new_height, expected_xml, parent_
+        return row, new_height, expected_xml, delta, parent_
 
     # fixture components ---------------------------------------------
 
@@ -0,0 +1,154 @@
+# encoding: utf-8
+
+"""
+Test suite for pptx.shapes.tablelayout module.
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import pytest
+
+from pptx import Presentation
+from pptx.oxml.ns import qn
+from pptx.shapes.shapetree import SlideShapeTree
+from pptx.shapes.tablelayout import TablePaginator
+from pptx.text.layout import ParagraphFitter
+
+from ..unitutil.file import testfile
+from ..unitutil.mock import call, method_mock
+
+
+class DescribeTablePaginator(object):
+
+    def it_splits_rows_across_slides_repeating_the_header(
+            self, paginate_fixture):
+        paginator, prs, rows = paginate_fixture
+
+        graphic_frames = paginator.paginate(prs.slides, iter(rows))
+
+        assert len(prs.slides) == 3
+        assert [gf.part for gf in graphic_frames] == list(prs.slides)
+        tables = [gf.table for gf in graphic_frames]
+        assert [len(table.rows) for table in tables] == [3, 3, 2]
+        assert [
+            table.cell(0, 0).text_frame.text for table in tables
+        ] == ['Name', 'Name', 'Name']
+        assert tables[2].cell(1, 0).text_frame.text == 'row 5'
+        assert tables[2].cell(1, 1).text_frame.text == '7.50'
+        assert [row.height for row in tables[0].rows] == [100, 100, 150]
+        assert graphic_frames[0].height == 350
+        assert [column.width for column in tables[0].columns] == [300, 301]
+        assert tables[0].first_row is True
+
+    def it_adds_each_table_using_the_public_shapes_api(
+            self, paginate_fixture, request):
+        paginator, prs, rows = paginate_fixture
+        add_table_ = method_mock(
+            request, SlideShapeTree, 'add_table', autospec=True,
+            side_effect=SlideShapeTree.add_table
+        )
+
+        graphic_frames = paginator.paginate(prs.slides, rows)
+
+        assert add_table_.call_count == 3
+        shapes, rows_, cols, left, top, width, height = (
+            add_table_.call_args_list[2][0]
+        )
+        assert (rows_, cols, left, top) == (2, 2, 0, 0)
+        assert (width, height) == (601, 200)
+        assert add_table_.call_args_list[2][1] == {
+            'texts': [('Name', 'Value'), ('row 5', '7.50')]
+        }
+        assert graphic_frames[2].height == 200
+
+    def it_puts_a_row_taller_than_a_page_on_its_own_page(self, request):
+        method_mock(
+            request, TablePaginator, '_row_height',
+            side_effect=lambda texts: 500 if texts[0] == 'tall' else 100
+        )
+        prs = Presentation()
+        paginator = TablePaginator(
+            prs.slide_layouts[6], 0, 0, 200, 350, col_widths=(100, 100)
+        )
+        rows = [('a',), ('tall',), ('b',)]
+
+        graphic_frames = paginator.paginate(prs.slides, rows)
+
+        tables = [gf.table for gf in graphic_frames]
+        assert [len(table.rows) for table in tables] == [1, 1, 1]
+        assert tables[0].first_row is False
+        assert [len(table.columns) for table in tables] == [2, 2, 2]
+
+    def it_sets_the_text_at_the_measured_size(self, request):
+        method_mock(
+            request, TablePaginator, '_row_height', return_value=100
+        )
+        prs = Presentation()
+        paginator = TablePaginator(
+            prs.slide_layouts[6], 0, 0, 200, 350, header=('x', 'y'),
+            point_size=10.5
+        )
+
+        graphic_frame = paginator.paginate(prs.slides, [('a', None)])[0]
+
+        tbl = graphic_frame._element.graphic.graphicData.tbl
+        assert [r.rPr.sz for r in tbl.iter(qn('a:r'))] == [1050, 1050, 1050]
+        assert [p.endParaRPr.sz for p in tbl.iter(qn('a:p'))] == [1050] * 4
+
+    def it_raises_on_a_row_with_more_values_than_columns(self):
+        prs = Presentation()
+        paginator = TablePaginator(
+            prs.slide_layouts[6], 0, 0, 200, 350, col_widths=(100, 100),
+            font_file=testfile('calibriz.ttf')
+        )
+        with pytest.raises(ValueError):
+            paginator.paginate(prs.slides, [('a', 'b'), ('c', 'd', 'e')])
+
+    def it_measures_a_row_by_its_tallest_cell(self, request):
+        text_height_ = method_mock(
+            request, ParagraphFitter, 'text_height',
+            side_effect=lambda text, *args: 1000 * len(text)
+        )
+        paginator = TablePaginator(
+            None, 0, 0, 0, 0, col_widths=(200000, 300000), point_size=12,
+            font_file='foo.ttf'
+        )
+
+        assert paginator._row_height(('ab', 'c')) == 2000 + 91440
+        assert paginator._row_height(('ab', 'cde')) == 3000 + 91440
+
+        assert text_height_.call_args_list == [
+            call('ab', 200000 - 182880, 12, 'foo.ttf'),
+            call('c', 300000 - 182880, 12, 'foo.ttf'),
+            call('cde', 300000 - 182880, 12, 'foo.ttf'),
+        ]
+
+    def it_measures_rows_using_the_metrics_of_a_font_file(self):
+        paginator = TablePaginator(
+            None, 0, 0, 0, 0, col_widths=(914400,), point_size=12,
+            font_file=testfile('calibriz.ttf')
+        )
+        assert paginator._row_height(('foo\nbar',)) == 372071 + 91440
+        assert paginator._row_height(()) == 186036 + 91440
+
+    def it_raises_when_the_number_of_columns_is_unknown(self):
+        paginator = TablePaginator(None, 0, 0, 100, 100)
+        with pytest.raises(ValueError):
+            paginator._column_widths
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def paginate_fixture(self, request):
+        row_heights = {'Name': 100, 'row 1': 100, 'row 2': 150, 'row 3': 100}
+        method_mock(
+            request, TablePaginator, '_row_height',
+            side_effect=lambda texts: row_heights.get(texts[0], 100)
+        )
+        prs = Presentation()
+        paginator = TablePaginator(
+            prs.slide_layouts[6], 0, 0, 601, 350, header=('Name', 'Value'),
+            number_formats=(None, '.2f')
+        )
+        rows = [('row %d' % n, n * 1.5) for n in range(1, 6)]
+        return paginator, prs, rows
@@ -9,9 +9,13 @@ from __future__ import absolute_import, print_function
 import pytest
 
 from pptx.api import Presentation
+from pptx.chart.data import ChartData
+from pptx.enum.chart import XL_CHART_TYPE
 from pptx.parts.presentation import PresentationPart
+from pptx.text.style import TextStyleResolver
+from pptx.text.usage import FontUsage
 
-from .unitutil.mock import call, property_mock
+from .unitutil.mock import call, class_mock, property_mock
 
 
 class DescribePresentation(object):
@@ -36,8 +40,79 @@ class DescribePresentation(object):
         prs.slide_height = slide_height
         assert part_slide_height_.mock_calls == [call(slide_height)]
 
+    def it_can_replace_text_in_bulk(self, replace_fixture):
+        prs, TextReplacer_, text_parts_ = replace_fixture
+        replacer_ = TextReplacer_.return_value
+
+        count = prs.replace_text({'foo': 'bar'}, processes=2)
+
+        TextReplacer_.assert_called_once_with({'foo': 'bar'})
+        replacer_.replace_in_parts.assert_called_once_with(
+            text_parts_.return_value, 2
+        )
+        assert count is replacer_.replace_in_parts.return_value
+
+    def it_can_substitute_tokens_in_bulk(self, replace_fixture):
+        prs, TextReplacer_, text_parts_ = replace_fixture
+        replacer_ = TextReplacer_.from_tokens.return_value
+
+        count = prs.substitute_tokens({'foo': 42}, '[', ']')
+
+        TextReplacer_.from_tokens.assert_called_once_with(
+            {'foo': 42}, '[', ']'
+        )
+        replacer_.replace_in_parts.assert_called_once_with(
+            text_parts_.return_value, None
+        )
+        assert count is replacer_.replace_in_parts.return_value
+
+    def it_knows_the_parts_whose_text_it_replaces(self):
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        chart_data = ChartData()
+        chart_data.categories = ('Foo',)
+        chart_data.add_series('Series 1', (1,))
+        graphic_frame = slide.shapes.add_chart(
+            XL_CHART_TYPE.PIE, 0, 0, 0, 0, chart_data
+        )
+        slide_2 = prs.slides.add_slide(prs.slide_layouts[6])
+
+        assert prs._text_parts == [
+            slide, graphic_frame.chart_part, slide_2
+        ]
+
+    def it_can_report_the_fonts_its_text_uses(self):
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[1])
+        slide.shapes.title.text = 'Hello'
+        text_frame = slide.placeholders[1].text_frame
+        text_frame.text = 'abc'
+        run = text_frame.paragraphs[0].add_run()
+        run.text = 'xyz'
+        run.font.name = 'Arial'
+
+        font_usage = prs.font_usage()
+
+        assert font_usage == {
+            'Calibri': FontUsage('Calibri', frozenset('Heloabc'), 8),
+            'Arial': FontUsage('Arial', frozenset('xyz'), 3),
+        }
+
+    def it_provides_a_text_style_resolver(self):
+        prs = Presentation()
+        text_styles = prs.text_styles
+        assert isinstance(text_styles, TextStyleResolver)
+        assert prs.text_styles is text_styles
+
     # fixtures -------------------------------------------------------
 
+    @pytest.fixture
+    def replace_fixture(self, request):
+        prs = Presentation()
+        TextReplacer_ = class_mock(request, 'pptx.api.TextReplacer')
+        text_parts_ = property_mock(request, Presentation, '_text_parts')
+        return prs, TextReplacer_, text_parts_
+
     @pytest.fixture
     def slide_height_get_fixture(self, part_slide_height_, slide_height):
         prs = Presentation()
@@ -9,11 +9,12 @@ from __future__ import absolute_import, print_function, unicode_literals
 import io
 import pytest
 
-from struct import calcsize
+from struct import calcsize, pack
 
 from pptx.compat import BytesIO
 from pptx.text.fonts import (
-    _BaseTable, _Font, FontFiles, _HeadTable, _NameTable, _Stream,
+    _BaseTable, _CmapTable, _Font, FontFiles, _FontIndex, FontMetrics,
+    _HeadTable, _HheaTable, _HmtxTable, _KernTable, _NameTable, _Stream,
     _TableFactory
 )
 
@@ -31,14 +32,40 @@ class DescribeFontFiles(object):
         path = FontFiles.find(family_name, is_bold, is_italic)
         assert path == expected_path
 
+    def it_can_search_an_added_font_directory(self, add_dir_fixture):
+        directory, user_dirs, expected_dirs = add_dir_fixture
+        FontFiles.add_directory(directory)
+        assert FontFiles._user_directories == expected_dirs
+        assert FontFiles._user_directories is not user_dirs
+        assert FontFiles._font_files is None
+
     def it_catalogs_the_system_fonts_to_help_find(self, installed_fixture):
-        expected_call_args, expected_values = installed_fixture
+        _FontIndex_, index_path, font_index_ = installed_fixture[:3]
+        expected_call_args, expected_values = installed_fixture[3:]
+
         installed_fonts = FontFiles._installed_fonts()
-        assert FontFiles._iter_font_files_in.call_args_list == (
+
+        _FontIndex_.load.assert_called_once_with(index_path)
+        assert font_index_.font_files_in.call_args_list == (
             expected_call_args
         )
+        font_index_.save.assert_called_once_with()
         assert installed_fonts == expected_values
 
+    def it_knows_where_to_keep_its_index(self, index_path_fixture):
+        expected_value = index_path_fixture
+        assert FontFiles._index_path() == expected_value
+
+    def it_knows_linux_font_dirs_to_help_find(self, linux_dirs_fixture):
+        expected_dirs = linux_dirs_fixture
+        font_dirs = FontFiles._linux_font_directories()
+        assert font_dirs == expected_dirs
+
+    def it_reads_fontconfig_font_dirs_to_help_find(self, fc_dirs_fixture):
+        fonts_conf_path, expected_dirs = fc_dirs_fixture
+        font_dirs = FontFiles._fontconfig_directories(fonts_conf_path)
+        assert font_dirs == expected_dirs
+
     def it_generates_font_dirs_to_help_find(self, font_dirs_fixture):
         expected_values = font_dirs_fixture
         font_dirs = FontFiles._font_directories()
@@ -74,36 +101,93 @@ class DescribeFontFiles(object):
         family_name, is_bold, is_italic, expected_path = request.param
         return family_name, is_bold, is_italic, expected_path
 
+    @pytest.fixture(params=[[], ['x']])
+    def add_dir_fixture(self, request):
+        user_dirs = list(request.param)
+        var_mock(request, 'pptx.text.fonts.FontFiles._user_directories',
+                 new=user_dirs)
+        var_mock(request, 'pptx.text.fonts.FontFiles._font_files', new={})
+        directory = '/srv/fonts'
+        expected_dirs = request.param + [directory]
+        return directory, user_dirs, expected_dirs
+
     @pytest.fixture(params=[
-        ('darwin', ['a', 'b']),
-        ('win32',  ['c', 'd']),
+        ('darwin', ['a', 'b'], []),
+        ('win32',  ['c', 'd'], ['x']),
+        ('linux2', ['e', 'f'], ['x', 'y']),
     ])
     def font_dirs_fixture(
             self, request, _os_x_font_directories_,
-            _windows_font_directories_):
-        platform, expected_dirs = request.param
+            _windows_font_directories_, _linux_font_directories_):
+        platform, system_dirs, user_dirs = request.param
         dirs_meth_mock = {
             'darwin': _os_x_font_directories_,
             'win32':  _windows_font_directories_,
+            'linux2': _linux_font_directories_,
         }[platform]
         sys_ = var_mock(request, 'pptx.text.fonts.sys')
         sys_.platform = platform
-        dirs_meth_mock.return_value = expected_dirs
-        return expected_dirs
+        var_mock(request, 'pptx.text.fonts.FontFiles._user_directories',
+                 new=user_dirs)
+        dirs_meth_mock.return_value = list(system_dirs)
+        return system_dirs + user_dirs
+
+    @pytest.fixture(params=[
+        ('<fontconfig><dir>/usr/share/fonts</dir><dir>~/.fonts</dir>'
+         '<dir prefix="xdg">fonts</dir><dir> </dir></fontconfig>',
+         ['/usr/share/fonts', '/home/fbar/.fonts', '/xdg/data/fonts']),
+        ('<fontconfig><dir>', []),
+        (None, []),
+    ])
+    def fc_dirs_fixture(self, request, tmpdir):
+        conf_xml, expected_dirs = request.param
+        fonts_conf_path = str(tmpdir.join('fonts.conf'))
+        if conf_xml is not None:
+            with open(fonts_conf_path, 'w') as f:
+                f.write(conf_xml)
+        var_mock(request, 'pptx.text.fonts.os.environ', new={
+            'HOME': '/home/fbar', 'XDG_DATA_HOME': '/xdg/data'
+        })
+        return fonts_conf_path, expected_dirs
+
+    @pytest.fixture(params=[
+        ({'PPTX_FONT_INDEX': '/tmp/fonts.json'}, 'linux', '/tmp/fonts.json'),
+        ({'HOME': '/home/fbar'}, 'linux',
+         '/home/fbar/.cache/python-pptx/font-index.json'),
+        ({'HOME': '/home/fbar', 'XDG_CACHE_HOME': '/xdg/cache'}, 'linux',
+         '/xdg/cache/python-pptx/font-index.json'),
+    ])
+    def index_path_fixture(self, request):
+        environ, platform, expected_value = request.param
+        var_mock(request, 'pptx.text.fonts.os.environ', new=environ)
+        sys_ = var_mock(request, 'pptx.text.fonts.sys')
+        sys_.platform = platform
+        return expected_value
 
     @pytest.fixture
-    def installed_fixture(self, _iter_font_files_in_, _font_directories_):
+    def installed_fixture(self, request, _font_directories_):
         _font_directories_.return_value = ['d', 'd_2']
-        _iter_font_files_in_.side_effect = [
+        index_path = '/cache/font-index.json'
+        method_mock(
+            request, FontFiles, '_index_path', return_value=index_path
+        )
+        font_index_ = instance_mock(request, _FontIndex)
+        font_index_.font_files_in.side_effect = [
             [(('A', True,  False), 'a.ttf')],
             [(('B', False, True),  'b.ttf')],
         ]
-        expected_call_args = [call('d'), call('d_2')]
+        _FontIndex_ = class_mock(request, 'pptx.text.fonts._FontIndex')
+        _FontIndex_.load.return_value = font_index_
+        scan = FontFiles._iter_font_files_in
+        expected_call_args = [call('d', scan), call('d_2', scan)]
         expected_values = {
             ('A', True,  False): 'a.ttf',
             ('B', False, True):  'b.ttf',
         }
-        return expected_call_args, expected_values
+        return (
+            _FontIndex_, index_path, font_index_, expected_call_args,
+            expected_values
+        )
 
     @pytest.fixture
     def iter_fixture(self, _Font_):
@@ -115,6 +199,23 @@ class DescribeFontFiles(object):
         expected_paths = [(('Arial', True, True), font_file_path)]
         return directory, _Font_, expected_calls, expected_paths
 
+    @pytest.fixture
+    def linux_dirs_fixture(self, request):
+        method_mock(
+            request, FontFiles, '_fontconfig_directories',
+            return_value=['/opt/fonts', '/usr/share/fonts']
+        )
+        var_mock(request, 'pptx.text.fonts.os.environ', new={
+            'HOME': '/home/fbar'
+        })
+        return [
+            '/opt/fonts',
+            '/usr/share/fonts',
+            '/usr/local/share/fonts',
+            '/home/fbar/.local/share/fonts',
+            '/home/fbar/.fonts',
+        ]
+
     @pytest.fixture
     def osx_dirs_fixture(self, request):
         import os
@@ -159,6 +260,10 @@ class DescribeFontFiles(object):
     def _iter_font_files_in_(self, request):
         return method_mock(request, FontFiles, '_iter_font_files_in')
 
+    @pytest.fixture
+    def _linux_font_directories_(self, request):
+        return method_mock(request, FontFiles, '_linux_font_directories')
+
     @pytest.fixture
     def _os_x_font_directories_(self, request):
         return method_mock(request, FontFiles, '_os_x_font_directories')
@@ -168,6 +273,139 @@ class DescribeFontFiles(object):
         return method_mock(request, FontFiles, '_windows_font_directories')
 
 
+class Describe_FontIndex(object):
+
+    def it_scans_a_directory_not_yet_indexed(self, tmpdir, scan_):
+        index_path = str(tmpdir.join('cache', 'font-index.json'))
+        font_dir = str(tmpdir.mkdir('fonts'))
+
+        font_index = _FontIndex.load(index_path)
+        font_files = font_index.font_files_in(font_dir, scan_)
+        font_index.save()
+
+        scan_.assert_called_once_with(font_dir)
+        assert font_files == [(('Foo', True, False), 'foo.ttf')]
+        with open(index_path) as f:
+            assert f.read().startswith('{')
+
+    def it_reuses_the_font_files_of_an_unchanged_dir(self, tmpdir, scan_):
+        index_path = str(tmpdir.join('font-index.json'))
+        font_dir = str(tmpdir.mkdir('fonts'))
+        font_index = _FontIndex.load(index_path)
+        font_index.font_files_in(font_dir, scan_)
+        font_index.save()
+
+        font_index = _FontIndex.load(index_path)
+        font_files = font_index.font_files_in(font_dir, scan_)
+
+        assert scan_.call_count == 1
+        assert font_files == [(('Foo', True, False), 'foo.ttf')]
+        assert font_index._is_dirty is False
+
+    def but_it_rescans_a_changed_dir(self, tmpdir, scan_):
+        index_path = str(tmpdir.join('font-index.json'))
+        font_dir = tmpdir.mkdir('fonts')
+        font_index = _FontIndex.load(index_path)
+        font_index.font_files_in(str(font_dir), scan_)
+        font_index.save()
+        sub_dir = font_dir.mkdir('sub')
+        sub_dir.setmtime(sub_dir.mtime() + 10)
+
+        font_index = _FontIndex.load(index_path)
+        font_index.font_files_in(str(font_dir), scan_)
+
+        assert scan_.call_count == 2
+
+    def it_does_not_scan_a_missing_dir(self, tmpdir, scan_):
+        font_index = _FontIndex.load(str(tmpdir.join('font-index.json')))
+        font_files = font_index.font_files_in(str(tmpdir.join('x')), scan_)
+        assert scan_.call_count == 0
+        assert font_files == []
+
+    def it_starts_empty_when_the_index_is_unreadable(self, tmpdir):
+        index_path = tmpdir.join('font-index.json')
+        index_path.write('{not json')
+        font_index = _FontIndex.load(str(index_path))
+        assert font_index._entries == {}
+
+    def it_ignores_a_failure_to_save(self, tmpdir):
+        index_path = tmpdir.join('font-index.json')
+        index_path.mkdir()
+        font_index = _FontIndex(str(index_path), {})
+        font_index._is_dirty = True
+        font_index.save()
+        assert font_index._is_dirty is True
+
+    def it_removes_its_temporary_file_when_a_save_fails(self, request,
+                                                        tmpdir):
+        var_mock(request, 'pptx.text.fonts.json.dump', side_effect=IOError)
+        font_index = _FontIndex(str(tmpdir.join('font-index.json')), {})
+        font_index._is_dirty = True
+        font_index.save()
+        assert tmpdir.listdir() == []
+        assert font_index._is_dirty is True
+
+    # fixture components -----------------------------------
+
+    @pytest.fixture
+    def scan_(self, request):
+        scan_ = instance_mock(request, FontFiles._iter_font_files_in)
+        scan_.side_effect = lambda d: iter([
+            (('Foo', True, False), 'foo.ttf')
+        ])
+        return scan_
+
+
+class DescribeFontMetrics(object):
+
+    def it_can_load_the_metrics_of_a_font_file(self):
+        font_metrics = FontMetrics.load(testfile('calibriz.ttf'))
+        assert font_metrics._units_per_em == 2048
+        assert font_metrics.line_height(2048) == 2500
+        assert font_metrics.text_width('Ty', 2048) == 1922
+
+    def it_knows_the_width_of_text(self, width_fixture):
+        font_metrics, text, expected_value = width_fixture
+        assert font_metrics.text_width(text, 12) == expected_value
+
+    def it_remembers_the_width_of_each_word(self, font_metrics):
+        font_metrics.text_width('AV AV', 12)
+        assert font_metrics._word_widths == {'AV': 1800}
+
+    def it_starts_its_word_width_memo_afresh_when_full(self, font_metrics):
+        font_metrics.max_word_widths = 2
+        font_metrics.text_width('AV VA', 12)
+        font_metrics.text_width('A', 12)
+        assert list(font_metrics._word_widths.keys()) == ['A']
+
+    def it_knows_the_line_height_at_a_point_size(self, font_metrics):
+        assert font_metrics.line_height(12) == 14.4
+
+    # fixtures ---------------------------------------------
+
+    @pytest.fixture(params=[
+        ('AV',    21.6),
+        ('VA',    22.8),
+        ('A V',   28.2),
+        ('x',      0.0),
+        ('A\u00e9', 18.0),
+    ])
+    def width_fixture(self, request, font_metrics):
+        text, expected_value = request.param
+        return font_metrics, text, expected_value
+
+    # fixture components -----------------------------------
+
+    @pytest.fixture
+    def font_metrics(self):
+        glyph_ids = {ord('A'): 1, ord('V'): 2, ord(' '): 3, 0xE9: 4}
+        advance_widths = (0, 1000, 900, 500)
+        kerning_pairs = {(1, 2): -100, (3, 2): -50}
+        return FontMetrics(
+            1000, 800, -400, glyph_ids, advance_widths, kerning_pairs
+        )
+
+
 class Describe_Font(object):
 
     def it_can_construct_from_a_font_file_path(self, open_fixture):
@@ -196,6 +434,13 @@ class Describe_Font(object):
         assert _TableFactory_.call_args_list == expected_calls
         assert tables == expected_tables
 
+    def it_provides_access_to_its_glyph_metrics(self, metrics_fixture):
+        font, expected_values = metrics_fixture
+        assert (
+            font.units_per_em, font.ascender, font.descender,
+            font.advance_widths, font.glyph_ids, font.kerning_pairs
+        ) == expected_values
+
     def it_generates_table_records_to_help_read_tables(self, iter_fixture):
         font, expected_values = iter_fixture
         values = list(font._iter_table_records())
@@ -264,6 +509,32 @@ class Describe_Font(object):
         expected_values = [('name', 42, 21), ('head', 21, 42)]
         return font, expected_values
 
+    @pytest.fixture(params=[True, False])
+    def metrics_fixture(self, request, _tables_):
+        has_kern = request.param
+        head_table_ = instance_mock(request, _HeadTable, units_per_em=2048)
+        hhea_table_ = instance_mock(
+            request, _HheaTable, ascender=1536, descender=-512,
+            metric_count=3
+        )
+        hmtx_table_ = instance_mock(request, _HmtxTable)
+        hmtx_table_.advance_widths.return_value = (0, 1, 2)
+        cmap_table_ = instance_mock(request, _CmapTable, glyph_ids={65: 1})
+        kern_table_ = instance_mock(request, _KernTable, pairs={(1, 2): -3})
+        tables = {
+            'head': head_table_, 'hhea': hhea_table_, 'hmtx': hmtx_table_,
+            'cmap': cmap_table_,
+        }
+        if has_kern:
+            tables['kern'] = kern_table_
+        _tables_.return_value = tables
+        font = _Font(None)
+        expected_values = (
+            2048, 1536, -512, (0, 1, 2), {65: 1},
+            {(1, 2): -3} if has_kern else {}
+        )
+        return font, expected_values
+
     @pytest.fixture
     def open_fixture(self, _Stream_):
         path = 'foobar.ttf'
@@ -427,13 +698,19 @@ class Describe_TableFactory(object):
 
     # fixtures ---------------------------------------------
 
-    @pytest.fixture(params=['name', 'head', 'foob'])
+    @pytest.fixture(params=[
+        'name', 'head', 'cmap', 'hhea', 'hmtx', 'kern', 'foob'
+    ])
     def fixture(self, request, stream_):
         tag = request.param
         offset, length = 42, 21
         TableClass, target = {
             'name': (_NameTable, 'pptx.text.fonts._NameTable'),
             'head': (_HeadTable, 'pptx.text.fonts._HeadTable'),
+            'cmap': (_CmapTable, 'pptx.text.fonts._CmapTable'),
+            'hhea': (_HheaTable, 'pptx.text.fonts._HheaTable'),
+            'hmtx': (_HmtxTable, 'pptx.text.fonts._HmtxTable'),
+            'kern': (_KernTable, 'pptx.text.fonts._KernTable'),
             'foob': (_BaseTable, 'pptx.text.fonts._BaseTable'),
         }[tag]
         TableClass_ = class_mock(request, target)
@@ -456,6 +733,10 @@ class Describe_HeadTable(object):
         head_table, expected_value = italic_fixture
         assert head_table.is_italic is expected_value
 
+    def it_knows_the_units_per_em(self, macStyle_fixture):
+        head_table = macStyle_fixture[0]
+        assert head_table.units_per_em == 11822
+
     def it_reads_its_macStyle_field_to_help(self, macStyle_fixture):
         head_table, expected_value = macStyle_fixture
         assert head_table._macStyle == expected_value
@@ -500,6 +781,94 @@ class Describe_HeadTable(object):
         return property_mock(request, _HeadTable, '_macStyle')
 
 
+class Describe_CmapTable(object):
+
+    def it_maps_code_points_to_glyph_ids(self, glyph_ids_fixture):
+        cmap_table, expected_value = glyph_ids_fixture
+        assert cmap_table.glyph_ids == expected_value
+
+    # fixtures ---------------------------------------------
+
+    @pytest.fixture(params=['format_4', 'format_12', 'unsupported'])
+    def glyph_ids_fixture(self, request):
+        subtable, encoding_id, expected_value = {
+            'format_4': (
+                self._format_4_subtable(), 1,
+                {0x41: 5, 0x42: 6, 0x43: 7, 0x61: 9, 0x63: 11}
+            ),
+            'format_12': (
+                pack('>HHLLLLLL', 12, 0, 28, 0, 1, 0x1F600, 0x1F601, 42), 10,
+                {0x1F600: 42, 0x1F601: 43}
+            ),
+            'unsupported': (pack('>HHH', 0, 262, 0), 0, {}),
+        }[request.param]
+        bytes_ = pack('>HHHHL', 0, 1, 3, encoding_id, 12) + subtable
+        stream = _Stream(BytesIO(bytes_))
+        cmap_table = _CmapTable(None, stream, 0, len(bytes_))
+        return cmap_table, expected_value
+
+    # fixture components -----------------------------------
+
+    @staticmethod
+    def _format_4_subtable():
+        # segments 'A'-'C' by delta, 'a'-'c' by glyph array, and the end
+        # segment; 'b' maps to the missing glyph
+        seg_count = 3
+        return (
+            pack('>HHH', 4, 0, 0) +
+            pack('>HHHH', seg_count * 2, 0, 0, 0) +
+            pack('>3H', 0x43, 0x63, 0xFFFF) + pack('>H', 0) +
+            pack('>3H', 0x41, 0x61, 0xFFFF) +
+            pack('>3h', -60, 0, 1) +
+            pack('>3H', 0, 4, 0) +
+            pack('>3H', 9, 0, 11)
+        )
+
+
+class Describe_HheaTable(object):
+
+    def it_knows_its_vertical_metrics(self):
+        bytes_ = pack('>4shhhH6h4hhH', b'\x00\x01\x00\x00', 1536, -512,
+                      0, 2000, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 97)
+        hhea_table = _HheaTable(None, _Stream(BytesIO(bytes_)), 0, 36)
+        assert hhea_table.ascender == 1536
+        assert hhea_table.descender == -512
+        assert hhea_table.metric_count == 97
+
+
+class Describe_HmtxTable(object):
+
+    def it_reads_the_glyph_advance_widths(self):
+        bytes_ = pack('>HhHhHh', 1000, -10, 2000, 20, 3000, 30)
+        hmtx_table = _HmtxTable(None, _Stream(BytesIO(bytes_)), 0, 12)
+        assert hmtx_table.advance_widths(2) == (1000, 2000)
+
+
+class Describe_KernTable(object):
+
+    def it_maps_glyph_pairs_to_kerning_values(self, pairs_fixture):
+        kern_table, expected_value = pairs_fixture
+        assert kern_table.pairs == expected_value
+
+    # fixtures ---------------------------------------------
+
+    @pytest.fixture(params=[
+        (0, 0x0001, {(1, 2): -40, (3, 4): 25}),
+        (0, 0x0003, {}),
+        (1, 0x0001, {}),
+    ])
+    def pairs_fixture(self, request):
+        version, coverage, expected_value = request.param
+        subtable = (
+            pack('>HHH', 0, 26, coverage) + pack('>HHHH', 2, 12, 1, 0) +
+            pack('>HHh', 1, 2, -40) + pack('>HHh', 3, 4, 25)
+        )
+        bytes_ = pack('>HH', version, 1) + subtable
+        stream = _Stream(BytesIO(bytes_))
+        kern_table = _KernTable(None, stream, 0, len(bytes_))
+        return kern_table, expected_value
+
+
 class Describe_NameTable(object):
 
     def it_knows_the_font_family_name(self, family_fixture):
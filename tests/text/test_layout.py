@@ -9,12 +9,15 @@ from __future__ import absolute_import, print_function, unicode_literals
 import pytest
 
 from pptx.text.layout import (
-    _BinarySearchTree, _Line, _LineSource, TextFitter
+    _best_fit_job, FontMetricsCache, _LineSource, ParagraphFitter,
+    _ParagraphSource, TextFitter
 )
+from pptx.util import Pt
 
+from ..unitutil.file import testfile
 from ..unitutil.mock import (
-    call, class_mock, function_mock, initializer_mock, instance_mock,
-    method_mock, property_mock
+    call, class_mock, initializer_mock, instance_mock, method_mock,
+    property_mock
 )
 
 
@@ -34,70 +37,54 @@ class DescribeTextFitter(object):
         _best_fit_font_size_.assert_called_once_with(max_size)
         assert font_size is font_size_
 
-    def it_finds_best_fit_font_size_to_help_best_fit(self, _best_fit_fixture):
-        text_fitter, max_size, _BinarySearchTree_ = _best_fit_fixture[:3]
-        sizes_, predicate_, font_size_ = _best_fit_fixture[3:]
-
-        font_size = text_fitter._best_fit_font_size(max_size)
-
-        _BinarySearchTree_.from_ordered_sequence.assert_called_once_with(
-            range(1, max_size+1)
+    def it_can_fit_many_jobs_at_once(self, sizes_fixture):
+        jobs, best_fit_font_size_, expected_calls, expected_value = (
+            sizes_fixture
         )
-        sizes_.find_max.assert_called_once_with(predicate_)
-        assert font_size is font_size_
+        font_sizes = TextFitter.best_fit_font_sizes(iter(jobs))
+        assert best_fit_font_size_.call_args_list == expected_calls
+        assert font_sizes == expected_value
 
-    def it_provides_a_fits_inside_predicate_fn(self, fits_pred_fixture):
-        text_fitter, point_size = fits_pred_fixture[:2]
-        _rendered_size_, expected_bool_value = fits_pred_fixture[2:]
+    def it_can_fit_jobs_in_a_process_pool(self, pool_fixture):
+        jobs, Pool_, pool_, distinct_jobs, expected_value = pool_fixture
 
-        predicate = text_fitter._fits_inside_predicate
-        result = predicate(point_size)
+        font_sizes = TextFitter.best_fit_font_sizes(jobs, processes=2)
 
-        text_fitter._wrap_lines.assert_called_once_with(
-            text_fitter._line_source, point_size
-        )
-        _rendered_size_.assert_called_once_with(
-            'Ty', point_size, text_fitter._font_file
+        Pool_.assert_called_once_with(2)
+        pool_.map.assert_called_once_with(
+            _best_fit_job, [(TextFitter, job) for job in distinct_jobs], 1
         )
-        assert result is expected_bool_value
-
-    def it_provides_a_fits_in_width_predicate_fn(self, fits_cx_pred_fixture):
-        text_fitter, point_size, line = fits_cx_pred_fixture[:3]
-        _rendered_size_, expected_value = fits_cx_pred_fixture[3:]
+        pool_.close.assert_called_once_with()
+        pool_.join.assert_called_once_with()
+        assert font_sizes == expected_value
 
-        predicate = text_fitter._fits_in_width_predicate(point_size)
-        result = predicate(line)
-
-        _rendered_size_.assert_called_once_with(
-            line.text, point_size, text_fitter._font_file
+    def it_finds_best_fit_font_size_to_help_best_fit(self, _best_fit_fixture):
+        text_fitter, max_size, expected_calls, expected_value = (
+            _best_fit_fixture
         )
-        assert result is expected_value
-
-    def it_wraps_lines_to_help_best_fit(self, wrap_fixture):
-        text_fitter, line_source, point_size, remainder = wrap_fixture
-
-        text_fitter._wrap_lines(line_source, point_size)
+        font_size = text_fitter._best_fit_font_size(max_size)
+        assert text_fitter._fits_inside.call_args_list == expected_calls
+        assert font_size == expected_value
 
-        assert text_fitter._break_line.call_args_list == [
-            call(line_source, point_size),
-            call(remainder, point_size)
-        ]
+    def it_estimates_the_largest_size_from_area(self, area_fixture):
+        text_fitter, expected_value = area_fixture
+        assert text_fitter._max_size_by_area == expected_value
 
-    def it_breaks_off_a_line_to_help_wrap(self, break_fixture):
-        text_fitter, line_source_, point_size = break_fixture[:3]
-        _BinarySearchTree_, bst_, predicate_ = break_fixture[3:6]
-        max_value_ = break_fixture[6]
+    def it_knows_whether_the_text_fits_at_a_size(self, fits_fixture):
+        text_fitter, point_size, expected_value = fits_fixture
+        assert text_fitter._fits_inside(point_size) is expected_value
 
-        value = text_fitter._break_line(line_source_, point_size)
+    def it_wraps_lines_greedily_to_help_best_fit(self, wrap_fixture):
+        text_fitter, point_size, expected_value = wrap_fixture
+        assert text_fitter._wrap_lines(point_size) == expected_value
 
-        _BinarySearchTree_.from_ordered_sequence.assert_called_once_with(
-            line_source_
-        )
-        text_fitter._fits_in_width_predicate.assert_called_once_with(
-            point_size
+    def it_fits_text_using_the_metrics_of_a_font_file(self, font_fixture):
+        text, extents, max_size, expected_value = font_fixture
+        font_file = testfile('calibriz.ttf')
+        font_size = TextFitter.best_fit_font_size(
+            text, extents, max_size, font_file
         )
-        bst_.find_max.assert_called_once_with(predicate_)
-        assert value is max_value_
+        assert font_size == expected_value
 
     # fixtures ---------------------------------------------
 
@@ -112,91 +99,115 @@ class DescribeTextFitter(object):
             _init_, line_source_, _best_fit_font_size_, font_size_
         )
 
-    @pytest.fixture
-    def _best_fit_fixture(self, _BinarySearchTree_, _fits_inside_predicate_):
-        text_fitter = TextFitter(None, (None, None), None)
-        max_size = 42
-        sizes_ = _BinarySearchTree_.from_ordered_sequence.return_value
-        predicate_ = _fits_inside_predicate_.return_value
-        font_size_ = sizes_.find_max.return_value
-        return (
-            text_fitter, max_size, _BinarySearchTree_, sizes_, predicate_,
-            font_size_
+    @pytest.fixture(params=[
+        (42, 99, [True], [call(42)], 42),
+        (42, 30, [True], [call(30)], 30),
+        (42, 30, [False, True, False, True, False, False], [
+            call(30), call(15), call(22), call(18), call(20), call(19)
+        ], 18),
+        (42, 30, [False] * 5, [
+            call(30), call(15), call(7), call(3), call(1)
+        ], None),
+        (42, 0, [], [], None),
+    ])
+    def _best_fit_fixture(
+            self, request, _fits_inside_, _max_size_by_area_):
+        max_size, area_size, fits, expected_calls, expected_value = (
+            request.param
         )
-
-    @pytest.fixture
-    def break_fixture(
-            self, line_source_, _BinarySearchTree_, bst_,
-            _fits_in_width_predicate_):
         text_fitter = TextFitter(None, (None, None), None)
-        point_size = 21
-        _BinarySearchTree_.from_ordered_sequence.return_value = bst_
-        predicate_ = _fits_in_width_predicate_.return_value
-        max_value_ = bst_.find_max.return_value
-        return (
-            text_fitter, line_source_, point_size, _BinarySearchTree_, bst_,
-            predicate_, max_value_
-        )
+        _max_size_by_area_.return_value = area_size
+        _fits_inside_.side_effect = fits
+        return text_fitter, max_size, expected_calls, expected_value
 
-    @pytest.fixture(params=[(49, True), (50, True), (51, False)])
-    def fits_cx_pred_fixture(self, request, _rendered_size_):
-        rendered_width, expected_value = request.param
-        text_fitter = TextFitter(None, (50, None), 'foobar.ttf')
-        point_size, line = 12, _Line('foobar', None)
-        _rendered_size_.return_value = (rendered_width, None)
-        return (
-            text_fitter, point_size, line, _rendered_size_, expected_value
-        )
+    @pytest.fixture(params=[
+        ((12700 * 300, 12700 * 40), [50.0, 50.0], 7),
+        ((12700 * 300, 12700 * 40), [], 20),
+    ])
+    def area_fixture(self, request, _font_, _word_widths_):
+        extents, word_widths, expected_value = request.param
+        text_fitter = TextFitter(None, extents, None)
+        _word_widths_.return_value = word_widths
+        _font_.return_value.line_height.return_value = 2.0
+        return text_fitter, expected_value
 
     @pytest.fixture(params=[
-        ((66,  99), 6, ('foo', 'bar'), False),
-        ((66, 100), 6, ('foo', 'bar'), True),
-        ((66, 101), 6, ('foo', 'bar'), True),
+        ((12700 * 36, 12700 * 23), 10, [(0, 1), (1, 2)], True),
+        ((12700 * 36, 12700 * 19), 10, [(0, 1), (1, 2)], False),
+        ((12700 * 36, 12700 * 99), 10, None, False),
     ])
-    def fits_pred_fixture(
-            self, request, line_source_, _wrap_lines_, _rendered_size_):
-        extents, point_size, text_lines, expected_value = request.param
-        text_fitter = TextFitter(line_source_, extents, 'foobar.ttf')
-        _wrap_lines_.return_value = text_lines
-        _rendered_size_.return_value = (None, 50)
-        return text_fitter, point_size, _rendered_size_, expected_value
+    def fits_fixture(self, request, _break_lines_, _font_):
+        extents, point_size, lines, expected_value = request.param
+        text_fitter = TextFitter(None, extents, None)
+        _break_lines_.return_value = lines
+        _font_.return_value.line_height.return_value = 10.0
+        return text_fitter, point_size, expected_value
 
-    @pytest.fixture
-    def wrap_fixture(self, _break_line_):
-        text_fitter = TextFitter(None, (None, None), None)
-        point_size = 21
-        line_source, remainder = _LineSource('foo bar'), _LineSource('bar')
-        _break_line_.side_effect = [
-            ('foo', remainder),
-            ('bar', _LineSource('')),
-        ]
-        return text_fitter, line_source, point_size, remainder
+    @pytest.fixture(params=[
+        (99, 1, ['foo bar', 'baz', 'quux']),
+        (100, 1, ['foo bar', 'baz quux']),
+        (160, 2, ['foo bar', 'baz', 'quux']),
+        (200, 1, ['foo bar baz quux']),
+        (39, 1, None),
+    ])
+    def wrap_fixture(self, request, _word_widths_, _space_width_):
+        width, point_size, expected_value = request.param
+        line_source = _LineSource('foo bar baz quux')
+        text_fitter = TextFitter(line_source, (12700 * width, None), None)
+        _word_widths_.return_value = [30.0, 40.0, 50.0, 40.0]
+        _space_width_.return_value = 10.0
+        return text_fitter, point_size, expected_value
 
-    # fixture components -----------------------------------
+    @pytest.fixture(params=[
+        ('Typical', (660500, 279100), 48, 18),
+        ('Typical', (660462, 279052), 48, 17),
+        ('foo bar baz', (712800, 186100), 48, 12),
+        ('foo bar baz', (400000, 400000), 48, 10),
+        ('lorem ipsum dolor sit amet ' * 40, (4572000, 2743200), 48, 11),
+        ('foo bar baz', (12700, 12700), 48, None),
+    ])
+    def font_fixture(self, request):
+        text, extents, max_size, expected_value = request.param
+        return text, extents, max_size, expected_value
 
     @pytest.fixture
-    def _best_fit_font_size_(self, request):
-        return method_mock(request, TextFitter, '_best_fit_font_size')
+    def pool_fixture(self, request):
+        job_a = ('foo', (1, 2), 42, 'f.ttf')
+        job_b = ('bar', (1, 2), 42, 'f.ttf')
+        jobs = [job_a, job_b, job_a]
+        Pool_ = class_mock(request, 'pptx.text.layout.Pool')
+        pool_ = Pool_.return_value
+        pool_.map.return_value = [12, 15]
+        return jobs, Pool_, pool_, [job_a, job_b], [12, 15, 12]
 
     @pytest.fixture
-    def _BinarySearchTree_(self, request):
-        return class_mock(request, 'pptx.text.layout._BinarySearchTree')
+    def sizes_fixture(self, request):
+        job_a = ('foo', (1, 2), 42, 'f.ttf')
+        job_b = ('bar', (1, 2), 42, 'f.ttf')
+        jobs = [job_a, job_b, job_a, job_b]
+        best_fit_font_size_ = method_mock(
+            request, TextFitter, 'best_fit_font_size', side_effect=[12, 15]
+        )
+        expected_calls = [call(*job_a), call(*job_b)]
+        return jobs, best_fit_font_size_, expected_calls, [12, 15, 12, 15]
+
+    # fixture components -----------------------------------
 
     @pytest.fixture
-    def _break_line_(self, request):
-        return method_mock(request, TextFitter, '_break_line')
+    def _best_fit_font_size_(self, request):
+        return method_mock(request, TextFitter, '_best_fit_font_size')
 
     @pytest.fixture
-    def bst_(self, request):
-        return instance_mock(request, _BinarySearchTree)
+    def _break_lines_(self, request):
+        return method_mock(request, TextFitter, '_break_lines')
 
     @pytest.fixture
-    def _fits_in_width_predicate_(self, request):
-        return method_mock(request, TextFitter, '_fits_in_width_predicate')
+    def _fits_inside_(self, request):
+        return method_mock(request, TextFitter, '_fits_inside')
 
     @pytest.fixture
-    def _fits_inside_predicate_(self, request):
-        return property_mock(request, TextFitter, '_fits_inside_predicate')
+    def _font_(self, request):
+        return property_mock(request, TextFitter, '_font')
 
     @pytest.fixture
     def _init_(self, request):
@@ -214,84 +225,278 @@ class DescribeTextFitter(object):
         return instance_mock(request, _LineSource)
 
     @pytest.fixture
-    def _rendered_size_(self, request):
-        return function_mock(request, 'pptx.text.layout._rendered_size')
+    def _max_size_by_area_(self, request):
+        return property_mock(request, TextFitter, '_max_size_by_area')
+
+    @pytest.fixture
+    def _space_width_(self, request):
+        return property_mock(request, TextFitter, '_space_width')
 
     @pytest.fixture
-    def _wrap_lines_(self, request):
-        return method_mock(request, TextFitter, '_wrap_lines')
+    def _word_widths_(self, request):
+        return property_mock(request, TextFitter, '_word_widths')
+
+
+class DescribeParagraphFitter(object):
+
+    def it_can_determine_the_best_fit_font_size(self, best_fit_fixture):
+        paragraphs, extents, max_size, font_file = best_fit_fixture[:4]
+        _init_, paragraph_sources, _best_fit_font_size_ = best_fit_fixture[4:]
 
+        font_size = ParagraphFitter.best_fit_font_size(
+            paragraphs, extents, max_size, font_file
+        )
 
-class Describe_BinarySearchTree(object):
+        _init_.assert_called_once_with(paragraph_sources, extents, font_file)
+        _best_fit_font_size_.assert_called_once_with(max_size)
+        assert font_size == 10.5
 
-    def it_can_construct_from_an_ordered_sequence(self):
-        bst = _BinarySearchTree.from_ordered_sequence(range(10))
+    def it_searches_sizes_on_a_half_point_grid(self, request):
+        method_mock(
+            request, ParagraphFitter, '_fits_inside',
+            side_effect=[False, True, True, True, False]
+        )
+        property_mock(
+            request, ParagraphFitter, '_max_size_by_area', return_value=12.3
+        )
+        paragraph_fitter = ParagraphFitter(None, (None, None), None)
+
+        font_size = paragraph_fitter._best_fit_font_size(18)
 
-        def in_order(node):
-            """
-            Traverse the tree depth first to produce a list of its values,
-            in order.
-            """
-            result = []
-            if node is None:
-                return result
-            result.extend(in_order(node._lesser))
-            result.append(node.value)
-            result.extend(in_order(node._greater))
-            return result
+        assert paragraph_fitter._fits_inside.call_args_list == [
+            call(12.0), call(6.0), call(9.0), call(10.5), call(11.0)
+        ]
+        assert font_size == 10.5
 
-        assert bst.value == 9
-        assert bst._lesser.value == 4
-        assert bst._greater is None
-        assert in_order(bst) == list(range(10))
+    def it_knows_whether_the_paragraphs_fit_at_a_size(self, fits_fixture):
+        paragraph_fitter, expected_value = fits_fixture
+        assert paragraph_fitter._fits_inside(1) is expected_value
 
-    def it_can_find_the_max_value_satisfying_a_predicate(self, max_fixture):
-        bst, predicate, expected_value = max_fixture
-        assert bst.find_max(predicate) == expected_value
+    def it_estimates_the_largest_size_from_area(self, area_fixture):
+        paragraph_fitter, expected_value = area_fixture
+        assert paragraph_fitter._max_size_by_area == expected_value
+
+    def it_can_measure_the_height_of_wrapped_text(self, request):
+        _init_ = initializer_mock(request, ParagraphFitter)
+        _text_height_ = method_mock(
+            request, ParagraphFitter, '_text_height', return_value=42
+        )
+
+        height = ParagraphFitter.text_height('foo\nbar', 99, 12, 'foo.ttf')
+
+        _init_.assert_called_once_with(
+            (_ParagraphSource('foo\nbar', None, None, None),), (99, 0),
+            'foo.ttf'
+        )
+        _text_height_.assert_called_once_with(12)
+        assert height == 42
+
+    def it_measures_text_height_letting_long_words_overflow(
+            self, height_fixture):
+        paragraph_fitter, expected_value = height_fixture
+        assert paragraph_fitter._text_height(1) == expected_value
+
+    def it_measures_text_height_using_the_metrics_of_a_font_file(self):
+        font_file = testfile('calibriz.ttf')
+        text_height = ParagraphFitter.text_height
+        assert text_height('foo', 914400, 12, font_file) == 186036
+        assert text_height('foo\nbar', 914400, 12, font_file) == 372071
+        assert text_height('', 914400, 12, font_file) == 186036
+        assert text_height('x' * 99, 914400, 12, font_file) == 186036
+
+    def it_fits_paragraphs_using_the_metrics_of_a_font_file(
+            self, font_fixture):
+        paragraphs, extents, expected_value = font_fixture
+        font_file = testfile('calibriz.ttf')
+        font_size = ParagraphFitter.best_fit_font_size(
+            paragraphs, extents, 48, font_file
+        )
+        assert font_size == expected_value
 
     # fixtures ---------------------------------------------
 
     @pytest.fixture(params=[
-        (range(10), lambda n: n < 6.5, 6),
-        (range(10), lambda n: n > 9.9, None),
-        (range(10), lambda n: n < 0.0, None),
+        ([[30.0, 40.0, 50.0, 40.0]], [[], [10.0]], 2.0, 5.0),
+        ([[]], [[]], 2.0, float('inf')),
+    ])
+    def area_fixture(self, request, _font_, _word_widths_):
+        p1_word_widths, p2_word_widths, line_height, expected_value = (
+            request.param
+        )
+        paragraph_fitter = ParagraphFitter((
+            _ParagraphSource('', 1.5, None, None),
+            _ParagraphSource('', Pt(12), None, None),
+        ), (12700 * 300, 12700 * 40), None)
+        _word_widths_.return_value = [p1_word_widths, p2_word_widths]
+        _font_.return_value.line_height.return_value = line_height
+        return paragraph_fitter, expected_value
+
+    @pytest.fixture
+    def best_fit_fixture(self, request):
+        paragraphs = [('foo', 1.5, None, None), ('bar', None, Pt(6), None)]
+        extents, max_size, font_file = (19, 20), 42, 'foobar.ttf'
+        _init_ = initializer_mock(request, ParagraphFitter)
+        _best_fit_font_size_ = method_mock(
+            request, ParagraphFitter, '_best_fit_font_size',
+            return_value=10.5
+        )
+        paragraph_sources = (
+            _ParagraphSource('foo', 1.5, None, None),
+            _ParagraphSource('bar', None, Pt(6), None),
+        )
+        return (
+            paragraphs, extents, max_size, font_file, _init_,
+            paragraph_sources, _best_fit_font_size_
+        )
+
+    @pytest.fixture(params=[
+        (99, 78, True),
+        (99, 77.99, False),
+        (39, 99, False),
+    ])
+    def fits_fixture(self, request, _font_, _space_width_, _word_widths_):
+        width, height, expected_value = request.param
+        paragraph_fitter = ParagraphFitter((
+            _ParagraphSource('', 1.5, Pt(6), None),
+            _ParagraphSource('', Pt(12), None, Pt(3)),
+        ), (12700 * width, 12700 * height), None)
+        _word_widths_.return_value = [
+            [[30.0, 40.0, 50.0, 40.0]], [[], [10.0]]
+        ]
+        _space_width_.return_value = 10.0
+        _font_.return_value.line_height.return_value = 10.0
+        return paragraph_fitter, expected_value
+
+    @pytest.fixture(params=[
+        (99, 990600),
+        (39, 1181100),
+    ])
+    def height_fixture(self, request, _font_, _space_width_, _word_widths_):
+        width, expected_value = request.param
+        paragraph_fitter = ParagraphFitter((
+            _ParagraphSource('', 1.5, Pt(6), None),
+            _ParagraphSource('', Pt(12), None, Pt(3)),
+        ), (12700 * width, 0), None)
+        _word_widths_.return_value = [
+            [[30.0, 40.0, 50.0, 40.0]], [[], [10.0]]
+        ]
+        _space_width_.return_value = 10.0
+        _font_.return_value.line_height.return_value = 10.0
+        return paragraph_fitter, expected_value
+
+    @pytest.fixture(params=[
+        ([('foo bar baz', None, None, None)], (712800, 186100), 12.0),
+        ([('Typical', None, None, None)] * 2, (660500, 558200), 18.0),
+        ([('Typical\nTypical', None, None, None)], (660500, 558200), 18.0),
+        ([('Typical', 2.0, None, None)] * 2, (660500, 558200), 9.0),
+        ([('Typical', None, Pt(12), None)] * 2, (660500, 558200), 8.0),
+        ([('lorem ipsum dolor sit amet ' * 40, None, None, None)],
+         (4572000, 2743200), 11.5),
     ])
-    def max_fixture(self, request):
-        seq, predicate, expected_value = request.param
-        bst = _BinarySearchTree.from_ordered_sequence(seq)
-        return bst, predicate, expected_value
+    def font_fixture(self, request):
+        paragraphs, extents, expected_value = request.param
+        return paragraphs, extents, expected_value
+
+    # fixture components -----------------------------------
+
+    @pytest.fixture
+    def _font_(self, request):
+        return property_mock(request, ParagraphFitter, '_font')
+
+    @pytest.fixture
+    def _space_width_(self, request):
+        return property_mock(request, ParagraphFitter, '_space_width')
+
+    @pytest.fixture
+    def _word_widths_(self, request):
+        return property_mock(request, ParagraphFitter, '_word_widths')
 
 
 class Describe_LineSource(object):
 
-    def it_generates_text_remainder_pairs(self):
-        line_source = _LineSource('foo bar baz')
-        expected = (
-            ('foo',         _LineSource('bar baz')),
-            ('foo bar',     _LineSource('baz')),
-            ('foo bar baz', _LineSource('')),
-        )
-        assert all((a == b) for a, b in zip(expected, line_source))
+    def it_splits_its_text_into_words(self):
+        line_source = _LineSource(' foo  bar\nbaz ')
+        assert line_source.words == ['foo', 'bar', 'baz']
+
+
+class Describe_ParagraphSource(object):
 
+    def it_provides_a_line_source_for_each_line(self):
+        paragraph_source = _ParagraphSource('foo bar\nbaz', None, None, None)
+        assert paragraph_source.line_sources == [
+            _LineSource('foo bar'), _LineSource('baz')
+        ]
+
+    def it_knows_its_line_pitch(self, pitch_fixture):
+        line_spacing, fixed, expected_value = pitch_fixture
+        paragraph_source = _ParagraphSource('', line_spacing, None, None)
+        assert paragraph_source.line_pitch(10.0, fixed) == expected_value
 
-# produces different results on Linux, fails Travis-CI
+    def it_treats_no_space_before_or_after_as_zero(self):
+        paragraph_source = _ParagraphSource('', None, None, Pt(6))
+        assert paragraph_source.space_before == 0
+        assert paragraph_source.space_after == Pt(6)
+
+    # fixtures ---------------------------------------------
+
+    @pytest.fixture(params=[
+        (None,    None, 10.0),
+        (1.5,     None, 15.0),
+        (Pt(12),  None, Pt(12)),
+        (Pt(12),  0,    0),
+        (1.5,     0,    15.0),
+    ])
+    def pitch_fixture(self, request):
+        line_spacing, fixed, expected_value = request.param
+        return line_spacing, fixed, expected_value
 
-# from pptx.text.layout import _rendered_size
-# from ..unitutil.file import testfile
-# class Describe_rendered_size(object):
 
-#     def it_calculates_the_rendered_size_of_text_at_point_size(self, fixture):
-#         text, point_size, font_file, expected_value = fixture
-#         extents = _rendered_size(text, point_size, font_file)
-#         assert extents == expected_value
+class DescribeFontMetricsCache(object):
 
-#     # fixtures ---------------------------------------------
+    def it_loads_the_metrics_of_each_font_file_once(self, FontMetrics_):
+        font = FontMetricsCache.font('foobar.ttf')
 
-#     @pytest.fixture(params=[
-#         ('Typical',     18, (673100, 254000)),
-#         ('foo bar baz', 12, (698500, 165100)),
-#     ])
-#     def fixture(self, request):
-#         text, point_size, expected_value = request.param
-#         font_file = testfile('calibriz.ttf')
-#         return text, point_size, font_file, expected_value
+        assert FontMetricsCache.font('foobar.ttf') is font
+        FontMetrics_.load.assert_called_once_with('foobar.ttf')
+        assert font is FontMetrics_.load.return_value
+
+    def it_drops_the_least_recently_used_font_when_full(self, FontMetrics_):
+        FontMetricsCache.set_capacity(2)
+        for font_path in ('a.ttf', 'b.ttf', 'a.ttf', 'c.ttf', 'a.ttf'):
+            FontMetricsCache.font(font_path)
+
+        assert sorted(FontMetricsCache._fonts) == ['a.ttf', 'c.ttf']
+        assert FontMetrics_.load.call_args_list == [
+            call('a.ttf'), call('b.ttf'), call('c.ttf')
+        ]
+
+    def it_drops_fonts_when_its_capacity_is_reduced(self, FontMetrics_):
+        for font_path in ('a.ttf', 'b.ttf', 'c.ttf', 'a.ttf'):
+            FontMetricsCache.font(font_path)
+
+        FontMetricsCache.set_capacity(1)
+
+        assert sorted(FontMetricsCache._fonts) == ['a.ttf']
+        assert FontMetricsCache.cache_info().capacity == 1
+
+    def it_can_report_and_reset_its_statistics(self, FontMetrics_):
+        for font_path in ('a.ttf', 'b.ttf', 'a.ttf'):
+            FontMetricsCache.font(font_path)
+        assert FontMetricsCache.cache_info() == (1, 2, 32, 2)
+        assert FontMetricsCache.cache_info().hits == 1
+
+        FontMetricsCache.clear()
+
+        assert FontMetricsCache.cache_info() == (0, 0, 32, 0)
+
+    # fixture components -----------------------------------
+
+    @pytest.fixture
+    def FontMetrics_(self, request):
+        FontMetricsCache.clear()
+
+        def restore():
+            FontMetricsCache.set_capacity(32)
+            FontMetricsCache.clear()
+        request.addfinalizer(restore)
+        return class_mock(request, 'pptx.text.layout.FontMetrics')
@@ -0,0 +1,101 @@
+# encoding: utf-8
+
+"""
+Test suite for pptx.text.replace module
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import pytest
+
+from pptx.opc.package import XmlPart
+from pptx.text.replace import _replace_job, TextReplacer
+
+from ..unitutil.cxml import element, xml
+from ..unitutil.mock import class_mock, instance_mock
+
+
+class DescribeTextReplacer(object):
+
+    def it_replaces_text_in_the_parts_it_is_given(self, replace_fixture):
+        replacer, part_, expected_count, expected_xml = replace_fixture
+        count = replacer.replace_in_parts([part_])
+        assert count == expected_count
+        assert part_._element.xml == expected_xml
+
+    def it_can_replace_tokens(self, request):
+        part_ = self._part_(
+            request, 'a:p/a:r/a:t"{{n}} of [[n]], {{m}}, {{x}}"'
+        )
+        replacer = TextReplacer.from_tokens({'n': 42, 'm': 'mm'})
+        bracket_replacer = TextReplacer.from_tokens({'n': 7}, '[[', ']]')
+
+        count = replacer.replace_in_parts([part_])
+        count += bracket_replacer.replace_in_parts([part_])
+
+        assert count == 3
+        assert part_._element.xml == xml('a:p/a:r/a:t"42 of 7, mm, {{x}}"')
+
+    def it_can_match_text_in_a_process_pool(self, request):
+        part_ = self._part_(request, 'a:p/a:r/a:t"foo bar"')
+        Pool_ = class_mock(request, 'pptx.text.replace.Pool')
+        pool_ = Pool_.return_value
+        pool_.map.return_value = [[(1, ['X bar'])]]
+        replacer = TextReplacer({'foo': 'X'})
+
+        count = replacer.replace_in_parts([part_], processes=2)
+
+        Pool_.assert_called_once_with(2)
+        pool_.map.assert_called_once_with(
+            _replace_job, [(replacer, [['foo bar']])], 1
+        )
+        pool_.close.assert_called_once_with()
+        pool_.join.assert_called_once_with()
+        assert count == 1
+        assert part_._element.xml == xml('a:p/a:r/a:t"X bar"')
+
+    def it_does_nothing_when_there_is_nothing_to_replace(self, request):
+        part_ = self._part_(request, 'a:p/a:r/a:t"foo"')
+        assert TextReplacer({}).replace_in_parts([part_]) == 0
+
+    def it_raises_on_empty_search_text(self):
+        with pytest.raises(ValueError):
+            TextReplacer({'': 'foo'})
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        # ---token split across runs takes formatting of first---
+        ('a:p/(a:r/a:t"Hi {{na",a:r/(a:rPr{b=1},a:t"me}}!"))',
+         {'{{name}}': 'Bob'}, 1,
+         'a:p/(a:r/a:t"Hi Bob",a:r/(a:rPr{b=1},a:t"!"))'),
+        # ---a run entirely within a match is left empty---
+        ('a:p/(a:r/a:t"{{",a:r/a:t"x",a:r/a:t"}} z")', {'{{x}}': '1'}, 1,
+         'a:p/(a:r/a:t"1",a:r/a:t,a:r/a:t" z")'),
+        # ---longest search text wins---
+        ('a:p/a:r/a:t"foobar foo"', {'foo': 'X', 'foobar': 'Y'}, 2,
+         'a:p/a:r/a:t"Y X"'),
+        # ---text in fields is replaced too---
+        ('a:p/(a:fld/a:t"{{x}}",a:r/a:t"y")', {'{{x}}': '1'}, 1,
+         'a:p/(a:fld/a:t"1",a:r/a:t"y")'),
+        # ---matches do not span a line break---
+        ('a:p/(a:r/a:t"{{na",a:br,a:r/a:t"me}}")', {'{{name}}': 'Bob'}, 0,
+         'a:p/(a:r/a:t"{{na",a:br,a:r/a:t"me}}")'),
+        # ---or a paragraph boundary---
+        ('a:txBody/(a:p/a:r/a:t"{{na",a:p/a:r/a:t"me}}")',
+         {'{{name}}': 'Bob'}, 0,
+         'a:txBody/(a:p/a:r/a:t"{{na",a:p/a:r/a:t"me}}")'),
+    ])
+    def replace_fixture(self, request):
+        cxml, replacements, expected_count, expected_cxml = request.param
+        part_ = self._part_(request, cxml)
+        replacer = TextReplacer(replacements)
+        return replacer, part_, expected_count, xml(expected_cxml)
+
+    # fixture components ---------------------------------------------
+
+    @staticmethod
+    def _part_(request, cxml):
+        part_ = instance_mock(request, XmlPart, spec_set=False)
+        part_._element = element(cxml)
+        return part_
@@ -0,0 +1,131 @@
+# encoding: utf-8
+
+"""
+Test suite for pptx.text.style module
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import pytest
+
+from pptx import Presentation
+from pptx.text.style import EffectiveFont, TextStyleResolver
+from pptx.util import Inches, Pt
+
+from ..unitutil.cxml import element
+
+
+class DescribeEffectiveFont(object):
+
+    def it_provides_access_to_its_properties(self):
+        font = EffectiveFont('Arial', Pt(12), True, False)
+        assert font.name == 'Arial'
+        assert font.size == Pt(12)
+        assert font.bold is True
+        assert font.italic is False
+
+
+class DescribeTextStyleResolver(object):
+
+    def it_resolves_the_font_of_a_placeholder_run(self, slide):
+        title_run = slide.shapes.title.text_frame.paragraphs[0].runs[0]
+        body = slide.placeholders[1].text_frame
+        body_run = body.paragraphs[0].runs[0]
+        level_1_run = body.paragraphs[1].runs[0]
+        resolver = TextStyleResolver()
+
+        assert resolver.font(title_run) == ('Calibri', Pt(44), None, None)
+        assert resolver.font(body_run) == ('Calibri', Pt(32), None, None)
+        assert resolver.font(level_1_run) == ('Calibri', Pt(28), None, None)
+
+    def it_resolves_the_font_of_a_text_box_run(self, slide):
+        text_box = slide.shapes.add_textbox(0, 0, Inches(1), Inches(1))
+        text_box.text_frame.text = 'foo'
+        run = text_box.text_frame.paragraphs[0].runs[0]
+        assert TextStyleResolver().font(run) == (
+            'Calibri', Pt(18), None, None
+        )
+
+    def it_can_resolve_the_font_of_a_run_element(self, slide):
+        run = slide.shapes.title.text_frame.paragraphs[0].runs[0]
+        font = TextStyleResolver().font_of_element(run._r, slide)
+        assert font == ('Calibri', Pt(44), None, None)
+
+    def it_gives_precedence_to_the_nearest_style(self, slide):
+        body = slide.placeholders[1].text_frame
+        paragraph = body.paragraphs[0]
+        run = paragraph.runs[0]
+        run.font.bold = True
+        run.font.name = 'Arial'
+        paragraph.font.size = Pt(20)
+        paragraph.font.italic = True
+        resolver = TextStyleResolver()
+
+        assert resolver.font(run) == ('Arial', Pt(20), True, True)
+
+        run.font.size = Pt(10)
+        assert resolver.font(run) == ('Arial', Pt(10), True, True)
+
+    def it_remembers_inherited_styles_until_cleared(self, slide):
+        runs = [p.runs[0] for p in slide.placeholders[1].text_frame.paragraphs]
+        resolver = TextStyleResolver()
+
+        for run in runs + runs:
+            resolver.font(run)
+        assert len(resolver._inherited_styles) == 2
+        assert len(resolver._theme_fonts) == 1
+
+        resolver.clear()
+        assert resolver._inherited_styles == {}
+        assert resolver._theme_fonts == {}
+
+    def it_can_get_the_defRPr_for_a_level(self, defRPr_fixture):
+        list_style, level, expected_value = defRPr_fixture
+        defRPr = TextStyleResolver._lvl_defRPr(list_style, level)
+        assert defRPr is expected_value
+
+    def it_can_read_the_style_of_an_rPr(self, rPr_fixture):
+        rPr, expected_style = rPr_fixture
+        assert TextStyleResolver._rPr_style(rPr) == expected_style
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ('a:lstStyle/a:lvl2pPr/a:defRPr', 1, True),
+        ('a:lstStyle/a:lvl2pPr/a:defRPr', 0, False),
+        ('a:lstStyle/a:lvl1pPr', 0, False),
+        (None, 0, False),
+    ])
+    def defRPr_fixture(self, request):
+        list_style_cxml, level, found = request.param
+        list_style = (
+            None if list_style_cxml is None else element(list_style_cxml)
+        )
+        expected_value = list_style[0][0] if found else None
+        return list_style, level, expected_value
+
+    @pytest.fixture(params=[
+        (None, {}),
+        ('a:rPr', {}),
+        ('a:defRPr{sz=1200,b=1,i=0}',
+         {'size': Pt(12), 'bold': True, 'italic': False}),
+        ('a:rPr/a:latin{typeface=Arial}', {'name': 'Arial'}),
+    ])
+    def rPr_fixture(self, request):
+        rPr_cxml, expected_style = request.param
+        rPr = None if rPr_cxml is None else element(rPr_cxml)
+        return rPr, expected_style
+
+    # fixture components ---------------------------------------------
+
+    @pytest.fixture
+    def slide(self):
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[1])
+        slide.shapes.title.text = 'Title'
+        body = slide.placeholders[1].text_frame
+        body.text = 'Body'
+        paragraph = body.add_paragraph()
+        paragraph.text = 'Level 1'
+        paragraph.level = 1
+        return slide
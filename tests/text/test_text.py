@@ -21,7 +21,7 @@ from pptx.util import Inches, Pt
 from ..oxml.unitdata.text import a_p, a_t, an_hlinkClick, an_r, an_rPr
 from ..unitutil.cxml import element, xml
 from ..unitutil.mock import (
-    class_mock, instance_mock, loose_mock, method_mock, property_mock
+    call, class_mock, instance_mock, loose_mock, method_mock, property_mock
 )
 
 
@@ -107,10 +107,42 @@ class DescribeTextFrame(object):
             family, font_size, bold, italic
         )
 
+    def it_raises_when_the_text_cannot_fit(self, fit_text_fixture):
+        text_frame, family, max_size = fit_text_fixture[:3]
+        bold, italic, font_file = fit_text_fixture[3:6]
+        text_frame._best_fit_font_size.return_value = None
+        with pytest.raises(ValueError):
+            text_frame.fit_text(family, max_size, bold, italic, font_file)
+        assert text_frame._apply_fit.call_count == 0
+
+    def it_can_fit_many_text_frames_at_once(self, fit_frames_fixture):
+        text_frames, FontFiles_, ParagraphFitter_ = fit_frames_fixture[:3]
+        expected_jobs, _apply_fit_, expected_calls = fit_frames_fixture[3:]
+
+        TextFrame.fit_text_frames(
+            iter(text_frames), 'Family', 42, True, False, processes=4
+        )
+
+        FontFiles_.find.assert_called_once_with('Family', True, False)
+        ParagraphFitter_.best_fit_font_sizes.assert_called_once_with(
+            expected_jobs, 4
+        )
+        assert _apply_fit_.call_args_list == expected_calls
+
+    def but_it_raises_when_any_text_cannot_fit(self, fit_frames_fixture):
+        text_frames, ParagraphFitter_, _apply_fit_ = (
+            fit_frames_fixture[0], fit_frames_fixture[2],
+            fit_frames_fixture[4]
+        )
+        ParagraphFitter_.best_fit_font_sizes.return_value = [12, None]
+        with pytest.raises(ValueError):
+            TextFrame.fit_text_frames(text_frames, 'Family', 42)
+        assert _apply_fit_.call_count == 0
+
     def it_calculates_its_best_fit_font_size_to_help_fit_text(
             self, size_font_fixture):
         text_frame, family, max_size, bold, italic = size_font_fixture[:5]
-        FontFiles_, TextFitter_, text, extents = size_font_fixture[5:9]
+        FontFiles_, ParagraphFitter_, text, extents = size_font_fixture[5:9]
         font_file_, font_size_ = size_font_fixture[9:]
 
         font_size = text_frame._best_fit_font_size(
@@ -118,7 +150,7 @@ class DescribeTextFrame(object):
         )
 
         FontFiles_.find.assert_called_once_with(family, bold, italic)
-        TextFitter_.best_fit_font_size.assert_called_once_with(
+        ParagraphFitter_.best_fit_font_size.assert_called_once_with(
             text, extents, max_size, font_file_
         )
         assert font_size is font_size_
@@ -131,6 +163,17 @@ class DescribeTextFrame(object):
         text_frame = Shape(element(sp_cxml), None).text_frame
         assert text_frame._extents == (731520, 822960)
 
+    def it_provides_its_paragraphs_in_fit_form_to_help_fit_text(self):
+        text_frame = TextFrame(element(
+            'p:txBody/(a:p/(a:pPr/(a:lnSpc/a:spcPct{val=150000},a:spcBef/a:s'
+            'pcPts{val=600}),a:r/a:t"foo",a:br,a:r/a:t"bar"),a:p/(a:pPr/a:ln'
+            'Spc/a:spcPts{val=1200},a:r/a:t"b",a:r/a:t"az"))'
+        ), None)
+        assert text_frame._fit_paragraphs == (
+            ('foo\nbar', 1.5, Pt(6), None),
+            ('baz', Pt(12), None, None),
+        )
+
     def it_applies_fit_to_help_fit_text(self, apply_fit_fixture):
         text_frame, family, font_size, bold, italic = apply_fit_fixture
         text_frame._apply_fit(family, font_size, bold, italic)
@@ -219,6 +262,27 @@ class DescribeTextFrame(object):
         expected_xml = xml(expected_cxml)
         return text_frame, value, expected_xml
 
+    @pytest.fixture
+    def fit_frames_fixture(
+            self, FontFiles_, ParagraphFitter_, _fit_paragraphs_prop_,
+            _extents_prop_, _apply_fit_):
+        text_frames = [TextFrame(None, None), TextFrame(None, None)]
+        _fit_paragraphs_prop_.side_effect = [(('foo',),), (('bar',),)]
+        _extents_prop_.side_effect = [(1, 2), (3, 4)]
+        FontFiles_.find.return_value = 'f.ttf'
+        ParagraphFitter_.best_fit_font_sizes.return_value = [12, 15]
+        expected_jobs = [
+            ((('foo',),), (1, 2), 42, 'f.ttf'),
+            ((('bar',),), (3, 4), 42, 'f.ttf'),
+        ]
+        expected_calls = [
+            call('Family', 12, True, False), call('Family', 15, True, False)
+        ]
+        return (
+            text_frames, FontFiles_, ParagraphFitter_, expected_jobs,
+            _apply_fit_, expected_calls
+        )
+
     @pytest.fixture
     def fit_text_fixture(self, _best_fit_font_size_, _apply_fit_):
         text_frame = TextFrame(None, None)
@@ -299,17 +363,18 @@ class DescribeTextFrame(object):
 
     @pytest.fixture
     def size_font_fixture(
-            self, FontFiles_, TextFitter_, text_prop_, _extents_prop_):
+            self, FontFiles_, ParagraphFitter_, _fit_paragraphs_prop_,
+            _extents_prop_):
         text_frame = TextFrame(None, None)
         family, max_size, bold, italic = 'Family', 42, True, False
         text, extents, font_size, font_file = 'text', (111, 222), 21, 'f.ttf'
-        text_prop_.return_value = text
+        _fit_paragraphs_prop_.return_value = text
         _extents_prop_.return_value = extents
         FontFiles_.find.return_value = font_file
-        TextFitter_.best_fit_font_size.return_value = font_size
+        ParagraphFitter_.best_fit_font_size.return_value = font_size
         return (
             text_frame, family, max_size, bold, italic, FontFiles_,
-            TextFitter_, text, extents, font_file, font_size
+            ParagraphFitter_, text, extents, font_file, font_size
         )
 
     @pytest.fixture(params=[
@@ -374,6 +439,10 @@ class DescribeTextFrame(object):
     def _extents_prop_(self, request):
         return property_mock(request, TextFrame, '_extents')
 
+    @pytest.fixture
+    def _fit_paragraphs_prop_(self, request):
+        return property_mock(request, TextFrame, '_fit_paragraphs')
+
     @pytest.fixture
     def FontFiles_(self, request):
         return class_mock(request, 'pptx.text.text.FontFiles')
@@ -383,8 +452,8 @@ class DescribeTextFrame(object):
         return method_mock(request, TextFrame, '_set_font')
 
     @pytest.fixture
-    def TextFitter_(self, request):
-        return class_mock(request, 'pptx.text.text.TextFitter')
+    def ParagraphFitter_(self, request):
+        return class_mock(request, 'pptx.text.text.ParagraphFitter')
 
     @pytest.fixture
     def text_frame_with_parent_(self, request):
@@ -392,10 +461,6 @@ class DescribeTextFrame(object):
         text_frame = TextFrame(None, parent_)
         return text_frame, parent_
 
-    @pytest.fixture
-    def text_prop_(self, request):
-        return property_mock(request, TextFrame, 'text')
-
 
 class DescribeFont(object):
 
@@ -949,6 +1014,9 @@ class Describe_Paragraph(object):
         ('a:p', 'foo\nbar',      'a:p/(a:r/a:t"foo",a:br,a:r/a:t"bar")'),
         ('a:p', '\nfoo\n',       'a:p/(a:br,a:r/a:t"foo",a:br)'),
         ('a:p', 'foo\n',         'a:p/(a:r/a:t"foo",a:br)'),
+        ('a:p', 'foo\n\nbar',    'a:p/(a:r/a:t"foo",a:br,a:br,a:r/a:t"bar")'),
+        ('a:p/(a:pPr,a:r/a:t"x",a:endParaRPr)', 'foo\nbar',
+         'a:p/(a:pPr,a:r/a:t"foo",a:br,a:r/a:t"bar",a:endParaRPr)'),
         ('a:p', '7-bit str',     'a:p/a:r/a:t"7-bit str"'),
         ('a:p', '8-ɓïȶ str',    u'a:p/a:r/a:t"8-ɓïȶ str"'),
         ('a:p', u'ŮŦƑ literal', u'a:p/a:r/a:t"ŮŦƑ literal"'),
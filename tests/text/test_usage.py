@@ -0,0 +1,76 @@
+# encoding: utf-8
+
+"""
+Test suite for pptx.text.usage module
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import pytest
+
+from pptx.opc.package import XmlPart
+from pptx.text.style import EffectiveFont, TextStyleResolver
+from pptx.text.usage import FontUsage, FontUsageAnalyzer
+
+from ..unitutil.cxml import element
+from ..unitutil.mock import instance_mock
+
+
+class DescribeFontUsage(object):
+
+    def it_provides_access_to_its_properties(self):
+        usage = FontUsage('Arial', frozenset('ab'), 3)
+        assert usage.name == 'Arial'
+        assert usage.glyphs == frozenset('ab')
+        assert usage.character_count == 3
+
+
+class DescribeFontUsageAnalyzer(object):
+
+    def it_reports_the_glyphs_and_characters_per_font(self, analyze_fixture):
+        analyzer, parts, resolver_, expected_value = analyze_fixture
+        usage = analyzer.analyze(parts)
+        assert usage == expected_value
+        assert resolver_.font_of_element.call_count == 3
+
+    def it_creates_a_resolver_when_none_is_given(self):
+        analyzer = FontUsageAnalyzer()
+        assert isinstance(analyzer._resolver, TextStyleResolver)
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def analyze_fixture(self, request):
+        part_ = self._part_(
+            request,
+            'p:txBody/(a:p/(a:r/(a:rPr/a:latin{typeface=Arial},a:t"aab"),'
+            'a:r/a:t"xy",a:br,a:fld/a:t"1"),'
+            'a:p/(a:r/(a:rPr/a:latin{typeface=mj-lt},a:t"z"),a:r/a:t))'
+        )
+        theme_latin = part_._element.xpath('.//a:latin')[1]
+        theme_latin.set('typeface', '+mj-lt')
+        part_2_ = self._part_(
+            request, 'p:txBody/a:p/a:r/(a:rPr/a:latin{typeface=Arial},a:t"c")'
+        )
+        resolver_ = instance_mock(request, TextStyleResolver)
+        resolver_.font_of_element.side_effect = (
+            lambda r, part: EffectiveFont(
+                'Calibri' if r.tag.endswith('r') else 'Cambria',
+                None, None, None
+            )
+        )
+        analyzer = FontUsageAnalyzer(resolver_)
+        expected_value = {
+            'Arial': FontUsage('Arial', frozenset('abc'), 4),
+            'Calibri': FontUsage('Calibri', frozenset('xyz'), 3),
+            'Cambria': FontUsage('Cambria', frozenset('1'), 1),
+        }
+        return analyzer, [part_, part_2_], resolver_, expected_value
+
+    # fixture components ---------------------------------------------
+
+    @staticmethod
+    def _part_(request, cxml):
+        part_ = instance_mock(request, XmlPart, spec_set=False)
+        part_._element = element(cxml)
+        return part_